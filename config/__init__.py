@@ -8,6 +8,7 @@ from .config import (
     DOCS_DIR,
     RAW_DATA,
     PROCESSED_DATA,
+    CLEAN_PANEL_SCHEMA,
     OUTPUT_FILES,
     MODEL_FILES,
     MODEL_PARAMS,
@@ -16,6 +17,7 @@ from .config import (
     PLOT_PARAMS,
     get_path,
     ensure_dir,
+    refresh_env_cache,
 )
 
 __all__ = [
@@ -26,6 +28,7 @@ __all__ = [
     "DOCS_DIR",
     "RAW_DATA",
     "PROCESSED_DATA",
+    "CLEAN_PANEL_SCHEMA",
     "OUTPUT_FILES",
     "MODEL_FILES",
     "MODEL_PARAMS",
@@ -34,5 +37,6 @@ __all__ = [
     "PLOT_PARAMS",
     "get_path",
     "ensure_dir",
+    "refresh_env_cache",
 ]
 
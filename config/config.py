@@ -5,8 +5,29 @@ Centralized configuration for paths, settings, and parameters.
 """
 
 import os
+import types
 from pathlib import Path
 
+# Snapshot of the process environment, read once at import
+_ENV_SNAPSHOT = types.MappingProxyType(dict(os.environ))
+
+
+def _env(key: str, default: str = "") -> str:
+    """Look up an environment variable from the cached snapshot."""
+    return _ENV_SNAPSHOT.get(key, default)
+
+
+def refresh_env_cache() -> None:
+    """
+    Rebuild the environment snapshot and re-resolve API keys.
+    
+    Useful for long-running sessions (e.g. the Streamlit dashboard)
+    where environment variables may change after import.
+    """
+    global _ENV_SNAPSHOT
+    _ENV_SNAPSHOT = types.MappingProxyType(dict(os.environ))
+    API_KEYS.update(_resolve_api_keys())
+
 # Project Root Directory
 PROJECT_ROOT = Path(__file__).parent.parent.absolute()
 
@@ -17,9 +38,8 @@ MODELS_DIR = PROJECT_ROOT / "models"
 DOCS_DIR = PROJECT_ROOT / "docs"
 NOTEBOOKS_DIR = PROJECT_ROOT / "notebooks"
 
-# Create directories if they don't exist
-for directory in [DATA_DIR, OUTPUT_DIR, MODELS_DIR, DOCS_DIR, NOTEBOOKS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+# Directories are created lazily by ensure_dir() / get_path()
+_created: set[Path] = set()
 
 # Data Files (raw and processed)
 RAW_DATA = {
@@ -43,6 +63,23 @@ PROCESSED_DATA = {
     "clean_panel_test": DATA_DIR / "clean_panel_test.csv",
 }
 
+# Column dtypes for reading the clean panel (see merge_panel.py final_columns)
+CLEAN_PANEL_SCHEMA = {
+    "country": "string",
+    "year": "int16",
+    "transit_investment_gdp": "float32",
+    "modal_share_public": "float32",
+    "congestion_index": "float32",
+    "gdp_per_capita": "float32",
+    "pm25": "float32",
+    "population_density": "float32",
+    "log_gdp_per_capita": "float32",
+    "transit_invest_lag1": "float32",
+    "high_invest_dummy": "float32",
+    "data_source": "string",
+    "estimation_method": "string",
+}
+
 # Output Files
 OUTPUT_FILES = {
     "univariate_summary": OUTPUT_DIR / "univariate_summary.csv",
@@ -51,6 +88,11 @@ OUTPUT_FILES = {
     "country_clusters": OUTPUT_DIR / "country_clusters.csv",
     "sensitivity_results": OUTPUT_DIR / "sensitivity_analysis_results.csv",
     "tft_logs": OUTPUT_DIR / "tft_logs",
+    "counterfactual_summary": OUTPUT_DIR / "counterfactual_summary.csv",
+    "simulation_results": OUTPUT_DIR / "simulation_results",
+    "simulation_results_pkl": OUTPUT_DIR / "simulation_results.pkl",
+    "uncertainty": OUTPUT_DIR / "uncertainty_quantification.msgpack",
+    "uncertainty_pkl": OUTPUT_DIR / "uncertainty_quantification.pkl",
 }
 
 # Model Files
@@ -95,15 +137,27 @@ PLOT_PARAMS = {
 }
 
 # API Keys and Credentials (load from environment)
-API_KEYS = {
-    "tomtom": os.getenv("TOMTOM_API_KEY", ""),
-    "openaq": os.getenv("OPENAQ_API_KEY", ""),
-}
+def _resolve_api_keys() -> dict:
+    """Resolve API keys from the environment snapshot."""
+    return {
+        "tomtom": _env("TOMTOM_API_KEY"),
+        "openaq": _env("OPENAQ_API_KEY"),
+    }
+
+API_KEYS = _resolve_api_keys()
 
 # Logging Configuration
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_LEVEL = "INFO"
 
+# Category lookup table for get_path(), built once at import
+_CATEGORIES = types.MappingProxyType({
+    "raw": types.MappingProxyType(RAW_DATA),
+    "processed": types.MappingProxyType(PROCESSED_DATA),
+    "output": types.MappingProxyType(OUTPUT_FILES),
+    "model": types.MappingProxyType(MODEL_FILES),
+})
+
 def get_path(category: str, key: str) -> Path:
     """
     Get a path from the configuration.
@@ -113,25 +167,23 @@ def get_path(category: str, key: str) -> Path:
         key: The specific file/directory key
     
     Returns:
-        Path object
+        Path object (its parent directory is created if missing)
     """
-    categories = {
-        "raw": RAW_DATA,
-        "processed": PROCESSED_DATA,
-        "output": OUTPUT_FILES,
-        "model": MODEL_FILES,
-    }
-    
-    if category not in categories:
+    paths = _CATEGORIES.get(category)
+    if paths is None:
         raise ValueError(f"Unknown category: {category}")
     
-    if key not in categories[category]:
+    path = paths.get(key)
+    if path is None:
         raise ValueError(f"Unknown key '{key}' in category '{category}'")
     
-    return categories[category][key]
+    ensure_dir(path.parent)
+    return path
 
 def ensure_dir(path: Path) -> Path:
-    """Ensure a directory exists, create if it doesn't."""
-    path.mkdir(parents=True, exist_ok=True)
+    """Ensure a directory exists, create if it doesn't (at most once per process)."""
+    if path not in _created:
+        path.mkdir(parents=True, exist_ok=True)
+        _created.add(path)
     return path
 
@@ -0,0 +1,106 @@
+"""
+Shared HTTP Session
+===================
+One ``requests.Session`` for the data-gathering scrapers.
+
+Reusing the session keeps connections alive, so repeated requests to the
+same host pay for the TCP/TLS handshake once per process. Transient
+failures are retried with a short backoff.
+
+When requests-cache is installed, responses are also cached on disk for
+a day, so re-running a scraper reads pages locally instead of fetching
+them again.
+
+Scrapers that fan requests out over threads share a RateLimiter to stay
+within an API's request budget.
+
+Conditional requests (If-Modified-Since and the like) must go through
+``uncached()``: the cache key ignores request headers, so a cached reply
+would be returned in place of the server's 304.
+"""
+
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# requests-cache (optional) - on-disk response cache
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+CACHE_PATH = Path(__file__).resolve().parent.parent / '.cache' / 'http'
+CACHE_EXPIRE_SECONDS = 24 * 60 * 60
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _build_session():
+    """Create the shared session; the cache directory is made here, not at import"""
+    if REQUESTS_CACHE_AVAILABLE:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        session = requests_cache.CachedSession(
+            str(CACHE_PATH), backend='sqlite', expire_after=CACHE_EXPIRE_SECONDS
+        )
+    else:
+        session = requests.Session()
+    session.headers.update({'User-Agent': USER_AGENT})
+
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class _LazySession:
+    """Stands in for the shared session, building it on first use"""
+
+    def __getattr__(self, name):
+        global _session
+        if _session is None:
+            with _session_lock:
+                if _session is None:
+                    _session = _build_session()
+        return getattr(_session, name)
+
+
+SESSION = _LazySession()
+
+
+def uncached():
+    """Context in which SESSION requests bypass the on-disk cache"""
+    if REQUESTS_CACHE_AVAILABLE:
+        return SESSION.cache_disabled()
+    return nullcontext()
+
+
+class RateLimiter:
+    """Spaces calls to wait() at least 1/per_second apart, across threads"""
+
+    def __init__(self, per_second):
+        self._interval = 1.0 / per_second
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        time.sleep(start - now)
@@ -0,0 +1,66 @@
+"""
+Output Table Helpers
+====================
+Shared post-processing for the tables written by the data-gathering
+scrapers.
+
+Each table is written as CSV for inspection plus a zstd-compressed
+Parquet copy next to it, which typed readers load without re-parsing
+text. The CSV is written by pandas so its text matches what the scrapers
+wrote before the tables were narrowed; the Parquet copy keeps the narrow
+dtypes.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+def shrink(df):
+    """Downcast int64/float64 columns to the narrowest dtype that holds them
+
+    Float columns are only narrowed when every value survives the round
+    trip, so loan amounts and other large figures keep full precision.
+    """
+    for col in df.select_dtypes('int64').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes('float64').columns:
+        narrowed = pd.to_numeric(df[col], downcast='float')
+        if np.array_equal(narrowed.to_numpy('float64'), df[col].to_numpy(), equal_nan=True):
+            df[col] = narrowed
+    return df
+
+
+def parquet_path(csv_path):
+    """Path of the Parquet copy written next to a CSV"""
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+
+def _csv_frame(df):
+    """df with its float32 columns widened for to_csv
+
+    pandas prints float32 values like str() does ('1e+06'); widening each
+    value through that shortest repr prints it as the float64 column did
+    before shrink() (1000000.0, 1.48).
+    """
+    narrow = df.select_dtypes('float32').columns
+    if narrow.empty:
+        return df
+    return df.astype({col: str for col in narrow}).astype({col: np.float64 for col in narrow})
+
+
+def write_table(df, csv_path):
+    """Write df as CSV and as a Parquet copy alongside it"""
+    _csv_frame(df).to_csv(csv_path, index=False)
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), parquet_path(csv_path), compression='zstd')
+
+
+def read_table(csv_path):
+    """Read a table, preferring its Parquet copy when it is at least as new as the CSV"""
+    pq_path = parquet_path(csv_path)
+    if os.path.exists(pq_path) and os.path.getmtime(pq_path) >= os.path.getmtime(csv_path):
+        return pd.read_parquet(pq_path)
+    return pd.read_csv(csv_path)
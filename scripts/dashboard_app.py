@@ -16,9 +16,41 @@ import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import pickle
+import functools
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+
+# Add project root to path for config import
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# Numba (optional) - JIT-compiles the Custom Simulator Monte Carlo kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from config import CLEAN_PANEL_SCHEMA, DATA_DIR, OUTPUT_DIR, PROCESSED_DATA, OUTPUT_FILES
+import results_io
+
+SCENARIOS: tuple[str, ...] = (
+    "baseline", "low_investment", "moderate_increase",
+    "high_investment", "aggressive", "optimal",
+)
+
+PAGES: tuple[str, ...] = (
+    "Overview", "Data Quality", "Scenario Comparison", "Country Analysis",
+    "Time Series", "Uncertainty Analysis", "Custom Simulator",
+    "Deep Dive", "Reports",
+)
+
+@functools.cache
+def _css():
+    """Read the dashboard stylesheet once per process"""
+    return (Path(__file__).with_name('assets') / 'dashboard.css').read_text()
 
 # Set page configuration
 st.set_page_config(
@@ -29,76 +61,791 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
-    <style>
-    .main {
-        padding: 0rem 1rem;
-    }
-    .stAlert {
-        margin-top: 1rem;
-    }
-    h1 {
-        color: #2E86AB;
-        padding-bottom: 1rem;
-    }
-    h2 {
-        color: #A23B72;
-        padding-top: 1rem;
-    }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #2E86AB;
-    }
-    </style>
-""", unsafe_allow_html=True)
-
-# Directories
-data_dir = '../data'
-output_dir = '../output'
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
+
+# Artifact paths, resolved once at import
+COUNTRY_EFFECTS_PATHS = {
+    s: OUTPUT_DIR / f"country_effects_{s}.csv"
+    for s in SCENARIOS
+}
+
+REPORTS = {
+    'Counterfactual Summary': OUTPUT_FILES['counterfactual_summary'],
+    'Simulation Report': DATA_DIR / 'counterfactual_simulation_report.txt',
+    'Causal Analysis': DATA_DIR / 'causal_analysis_report.txt',
+    'TFT Training Report': DATA_DIR / 'tft_training_report.txt',
+}
+
+# Rows sent to the browser per page of a large results table
+TABLE_PAGE_ROWS = 5000
+
+# Larger reports are not staged for in-page download
+MAX_DOWNLOAD_BYTES = 50 * 1024 * 1024
 
 # ========================================================================
 # LOAD DATA
 # ========================================================================
 
+def read_csv_cached(csv_path, **read_kwargs):
+    """Read a CSV, preferring a Parquet sidecar that is newer than the CSV
+    
+    Returns None if the CSV does not exist.
+    """
+    try:
+        csv_mtime = csv_path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    parquet_path = csv_path.with_suffix('.parquet')
+    if parquet_path.is_file() and parquet_path.stat().st_mtime >= csv_mtime:
+        return pd.read_parquet(parquet_path)
+    
+    df = pd.read_csv(csv_path, engine='pyarrow', **read_kwargs)
+    try:
+        df.to_parquet(parquet_path, index=False)
+    except (ImportError, OSError, ValueError):
+        # Parquet engine missing or output not writable - CSV is still usable
+        pass
+    return df
+
+@st.cache_data
+def load_clean_panel():
+    """Load the merged country-year panel"""
+    df = read_csv_cached(
+        PROCESSED_DATA['clean_panel'], dtype_backend='pyarrow', dtype=CLEAN_PANEL_SCHEMA
+    )
+    if df is None:
+        return None
+    
+    # Low-cardinality labels as categoricals, numbers at their narrowest width
+    for col in ['country', 'data_source', 'estimation_method']:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    if 'year' in df.columns:
+        df['year'] = pd.to_numeric(df['year'], downcast='integer')
+    for col in df.select_dtypes('number').columns.drop('year', errors='ignore'):
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    return df
+
 @st.cache_data
-def load_data():
-    """Load all necessary data"""
+def load_sim_results():
+    """Load counterfactual simulation results (msgpack, falling back to pickle)"""
+    results_dir = OUTPUT_FILES['simulation_results']
+    if (results_dir / results_io.SCENARIOS_FILE).is_file():
+        return results_io.load_sim_results(results_dir)
+    
+    pickle_path = OUTPUT_FILES['simulation_results_pkl']
+    if not pickle_path.is_file():
+        return None
+    return results_io.load_pickle(pickle_path)
+
+@st.cache_data
+def load_scenario_data(scenario_key):
+    """Load the counterfactual panel for one scenario on demand"""
+    results_dir = OUTPUT_FILES['simulation_results']
+    if (results_dir / f'data_{scenario_key}.parquet').is_file():
+        return results_io.load_scenario_data(results_dir, scenario_key)
+    return load_sim_results()[scenario_key]['data']
+
+@st.cache_data
+def load_scenario_index():
+    """Map scenario display names to their simulation result keys"""
+    sim_results = load_sim_results()
+    if sim_results is None:
+        return {}
+    return {val['scenario']['name']: key for key, val in sim_results.items()}
+
+def scenario_names():
+    """Map scenario result keys to their display names (the inverse of load_scenario_index)"""
+    return {key: name for name, key in load_scenario_index().items()}
+
+# Summary columns shown on the Overview page; optional ones only if present
+_BASE_DISPLAY_COLS: tuple[str, ...] = (
+    'Scenario', 'Description', 'Relative Impact (%)',
+    'Baseline Congestion', 'Counterfactual Congestion',
+)
+_OPTIONAL_DISPLAY_COLS: tuple[str, ...] = ('GDP Impact (%)', 'PM2.5 Impact (%)')
+
+@st.cache_data
+def load_summary():
+    """Load the counterfactual scenario summary"""
+    summary = read_csv_cached(OUTPUT_FILES['counterfactual_summary'])
+    if summary is None:
+        return None
+    
+    # Precompute lookups the Overview page needs on every rerun
+    summary['_scenario_lc'] = summary['Scenario'].str.lower()
+    summary.attrs['best_scenario_idx'] = summary['Relative Impact (%)'].idxmin()
+    summary.attrs['display_cols'] = _BASE_DISPLAY_COLS + tuple(
+        col for col in _OPTIONAL_DISPLAY_COLS if col in summary.columns
+    )
+    return summary
+
+@st.cache_data
+def load_uncertainty():
+    """Load uncertainty quantification results (msgpack, falling back to pickle)"""
+    msgpack_path = OUTPUT_FILES['uncertainty']
+    if msgpack_path.is_file():
+        return results_io.load_uncertainty(msgpack_path)
+    
+    uncertainty_path = OUTPUT_FILES['uncertainty_pkl']
+    if not uncertainty_path.is_file():
+        return None
+    return results_io.load_pickle(uncertainty_path)
+
+@st.cache_data
+def load_all_country_effects():
+    """Load country-level effects for every scenario that has them"""
+    available = {s: path for s, path in COUNTRY_EFFECTS_PATHS.items() if path.is_file()}
+    if not available:
+        return None
+    
+    # The files are independent and I/O-bound, so read them concurrently
+    with ThreadPoolExecutor(max_workers=len(available)) as executor:
+        futures = {s: executor.submit(read_csv_cached, path) for s, path in available.items()}
+        return {s: future.result() for s, future in futures.items()}
+
+# Loader for each artifact, and the artifacts each page actually reads
+LOADERS = {
+    'clean_panel': load_clean_panel,
+    'simulation_results': load_sim_results,
+    'summary': load_summary,
+    'uncertainty': load_uncertainty,
+    'country_effects': load_all_country_effects,
+}
+
+PAGE_ARTIFACTS = {
+    "Overview": ('clean_panel', 'simulation_results', 'summary'),
+    "Data Quality": ('clean_panel',),
+    "Scenario Comparison": ('simulation_results',),
+    "Country Analysis": ('clean_panel', 'simulation_results'),
+    "Time Series": ('clean_panel', 'simulation_results'),
+    "Uncertainty Analysis": ('simulation_results', 'uncertainty'),
+    "Custom Simulator": (),
+    "Deep Dive": ('country_effects',),
+    "Reports": (),
+}
+
+def load_data(artifacts):
+    """Load only the requested artifacts, skipping any that are missing on disk"""
     data = {}
+    for name in artifacts:
+        value = LOADERS[name]()
+        if value is not None:
+            data[name] = value
+    return data
+
+# ========================================================================
+# CACHED COMPUTATIONS
+# ========================================================================
+
+COVERAGE_COLS = ['congestion_index', 'modal_share_public', 'pm25']
+
+@st.cache_data
+def coverage_counts(_df, n_rows, columns):
+    """Non-null counts for the coverage columns, in a single reduction"""
+    cols = [c for c in COVERAGE_COLS if c in columns]
+    return _df[cols].notna().sum()
+
+@st.cache_data
+def country_observation_counts(_df, n_rows, n=20):
+    """Top-n countries by number of panel observations"""
+    return (
+        _df['country'].value_counts().head(n)
+        .rename_axis('Country').reset_index(name='Observations')
+    )
+
+@st.cache_data
+def top_countries_by_size(_df, n_rows, n=10):
+    """The n countries with the most panel rows"""
+    return _df.groupby('country', observed=True, sort=False).size().nlargest(n).index.tolist()
+
+@st.cache_data
+def scenario_country_slices(scenario_key):
+    """One scenario's panel split by country, each slice sorted by year"""
+    scenario_data = load_scenario_data(scenario_key).sort_values('year')
+    return {c: g for c, g in scenario_data.groupby('country', observed=True, sort=False)}
+
+@st.cache_data
+def multi_outcome_frame():
+    """One row per scenario with congestion, GDP and PM2.5 impacts"""
+    items = list(load_sim_results().values())
+    return pd.DataFrame({
+        'Scenario': [r['scenario']['name'] for r in items],
+        'Congestion Impact (%)': [r['relative_impact'] for r in items],
+        'GDP Impact (%)': [r.get('gdp_relative_impact') for r in items],
+        'PM2.5 Impact (%)': [r.get('pm25_relative_impact') for r in items],
+    }).dropna(axis=1, how='all')
+
+@st.cache_data
+def scenario_comparison_frame():
+    """Baseline/counterfactual congestion and impacts, indexed by scenario key"""
+    sim_results = load_sim_results()
+    items = list(sim_results.values())
+    return pd.DataFrame({
+        'Scenario': [r['scenario']['name'] for r in items],
+        'Baseline': [r['baseline_congestion'] for r in items],
+        'Counterfactual': [r['counterfactual_congestion'] for r in items],
+        'Absolute Impact': [r['absolute_impact'] for r in items],
+        'Relative Impact (%)': [r['relative_impact'] for r in items],
+    }, index=pd.Index(list(sim_results), name='scenario_key'))
+
+@st.cache_data
+def country_scenario_means():
+    """Mean baseline and counterfactual congestion per (scenario, country)"""
+    keys = list(load_sim_results())
+    cols = ['country', 'congestion_index', 'congestion_index_cf']
+    panel = pd.concat(
+        [load_scenario_data(key)[cols] for key in keys],
+        keys=keys, names=['scenario_key'],
+    ).reset_index(level='scenario_key')
+    return panel.groupby(['scenario_key', 'country'], observed=True, sort=False)[
+        ['congestion_index', 'congestion_index_cf']
+    ].mean()
+
+@st.cache_data
+def bootstrap_histogram(scenario_key, bins=50):
+    """Bin a scenario's bootstrap distribution server-side: centers, counts, widths"""
+    distribution = np.asarray(load_uncertainty()[scenario_key]['distribution'])
+    counts, edges = np.histogram(distribution, bins=bins)
+    return 0.5 * (edges[:-1] + edges[1:]), counts, np.diff(edges)
+
+# Trajectories longer than this are downsampled before plotting
+MAX_LINE_POINTS = 500
+
+def lttb(x, y, n_out=MAX_LINE_POINTS):
+    """Largest-Triangle-Three-Buckets downsampling of a line to n_out points"""
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+    
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        nxt_start, nxt_end = (end, edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[nxt_start:nxt_end].mean()
+        avg_y = y[nxt_start:nxt_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+@st.cache_data(ttl=5)
+def available_reports():
+    """Reports from REPORTS that currently exist on disk"""
+    return {name: path for name, path in REPORTS.items() if path.is_file()}
+
+@st.cache_data
+def read_report_text(path, mtime):
+    """Text report contents; mtime keys the cache so edits are picked up"""
+    return path.read_text()
+
+@st.cache_data
+def read_report_bytes(path, mtime):
+    """Raw report bytes for the download button, cached like the other reads"""
+    return path.read_bytes()
+
+@st.cache_data
+def read_report_csv(path, mtime):
+    """CSV report contents; mtime keys the cache so edits are picked up"""
+    return pd.read_csv(path)
+
+PERFORMER_COLS = ['country', 'impact_pct', 'baseline_congestion', 'counterfactual_congestion']
+
+@st.cache_data
+def deep_dive_performers(scenario_key, n=10):
+    """The n largest reductions and n smallest/negative effects for a scenario"""
+    df = load_all_country_effects()[scenario_key].dropna(subset=['impact_pct'])[PERFORMER_COLS]
+    impact = df['impact_pct'].to_numpy()
+    k = min(n, len(impact))
+    if k == 0:
+        return df, df
+    
+    # O(N) partition, then sort only the k selected rows
+    smallest = df.iloc[np.argpartition(impact, k - 1)[:k]].sort_values('impact_pct')
+    largest = df.iloc[np.argpartition(-impact, k - 1)[:k]].sort_values('impact_pct', ascending=False)
+    return smallest.round(2), largest.round(2)
+
+@st.cache_data
+def sorted_country_effects(scenario_key):
+    """A scenario's country effects rounded for display and sorted by impact"""
+    return load_all_country_effects()[scenario_key].round(2).sort_values('impact_pct')
+
+@st.cache_data
+def lowercase_countries(scenario_key):
+    """Lower-cased country names, in sorted_country_effects() row order"""
+    countries = sorted_country_effects(scenario_key)['country']
+    return np.asarray([c.lower() if isinstance(c, str) else '' for c in countries], dtype=object)
+
+@st.cache_data
+def impact_marker_sizes(scenario_key):
+    """Deep Dive scatter marker sizes: |impact_pct|, clipped for legibility"""
+    impact = load_all_country_effects()[scenario_key]['impact_pct'].to_numpy()
+    return np.clip(np.abs(impact), 2, 30)
+
+def join_segments(segments):
+    """Concatenate (label, x, y) line segments into single x/y/label arrays
     
-    # Load clean panel
-    clean_panel_path = os.path.join(data_dir, 'clean_panel.csv')
-    if os.path.exists(clean_panel_path):
-        data['clean_panel'] = pd.read_csv(clean_panel_path)
-    
-    # Load simulation results
-    pickle_path = os.path.join(output_dir, 'simulation_results.pkl')
-    if os.path.exists(pickle_path):
-        with open(pickle_path, 'rb') as f:
-            data['simulation_results'] = pickle.load(f)
-    
-    # Load counterfactual summary
-    summary_path = os.path.join(output_dir, 'counterfactual_summary.csv')
-    if os.path.exists(summary_path):
-        data['summary'] = pd.read_csv(summary_path)
-    
-    # Load uncertainty quantification results
-    uncertainty_path = os.path.join(output_dir, 'uncertainty_quantification.pkl')
-    if os.path.exists(uncertainty_path):
-        with open(uncertainty_path, 'rb') as f:
-            data['uncertainty'] = pickle.load(f)
-    
-    # Load country effects for all scenarios
-    country_effects = {}
-    for scenario in ['baseline', 'low_investment', 'moderate_increase', 'high_investment', 'aggressive', 'optimal']:
-        country_path = os.path.join(output_dir, f'country_effects_{scenario}.csv')
-        if os.path.exists(country_path):
-            country_effects[scenario] = pd.read_csv(country_path)
-    if country_effects:
-        data['country_effects'] = country_effects
+    A NaN point after each segment breaks the line, so one trace can draw
+    every segment.
+    """
+    if not segments:
+        return np.array([]), np.array([]), np.array([], dtype=object)
+    xs = np.concatenate([np.append(x.astype(float), np.nan) for _, x, _ in segments])
+    ys = np.concatenate([np.append(y.astype(float), np.nan) for _, _, y in segments])
+    labels = np.concatenate([np.full(len(x) + 1, label, dtype=object) for label, x, _ in segments])
+    return xs, ys, labels
+
+# Monte Carlo draws per Custom Simulator run; 0 uses the closed-form z-score CI
+CUSTOM_SIM_DRAWS = 10_000
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def simulate_impact(investment_change, elasticity, n_draws, confidence, seed):
+        """Monte Carlo impact of an investment change under an uncertain elasticity
+        
+        The elasticity is drawn with a 20% relative standard error. Returns the
+        mean, standard deviation and the two-sided confidence bounds (in %).
+        """
+        # Inside a jitted function this seeds numba's own per-thread RNG,
+        # not NumPy's global one
+        np.random.seed(seed)
+        scale = abs(elasticity) * 0.2
+        out = np.empty(n_draws)
+        for i in range(n_draws):
+            out[i] = investment_change * (elasticity + scale * np.random.standard_normal())
+        tail = (100.0 - confidence) / 2.0
+        return out.mean(), out.std(), np.percentile(out, tail), np.percentile(out, 100.0 - tail)
+else:
+    def simulate_impact(investment_change, elasticity, n_draws, confidence, seed):
+        """Monte Carlo impact of an investment change under an uncertain elasticity
+        
+        Vectorized NumPy version of the numba kernel. Draws come from a
+        generator local to the call, so sessions never reseed a shared RNG.
+        """
+        rng = np.random.default_rng(seed)
+        scale = abs(elasticity) * 0.2
+        out = investment_change * (elasticity + scale * rng.standard_normal(n_draws))
+        tail = (100.0 - confidence) / 2.0
+        return out.mean(), out.std(), np.percentile(out, tail), np.percentile(out, 100.0 - tail)
+
+# ========================================================================
+# FIGURE BUILDERS
+# ========================================================================
+# Figures are built on each rerun from cached data. Call sites add traces
+# to the figures they get, so a Figure kept in st.cache_resource would be
+# one mutable object shared by every session and rerun, and handing out
+# copies with go.Figure(fig) re-validates as much as building afresh.
+
+# Static layout and reference lines for each page chart; call sites only add traces
+FIGURE_SKELETONS = {
+    'scenario_congestion': dict(
+        layout=dict(title="Baseline vs Counterfactual Congestion", xaxis_title="",
+                    yaxis_title="Congestion Index", barmode='group', height=400),
+    ),
+    'scenario_impact': dict(
+        layout=dict(title="Relative Impact on Congestion", xaxis_title="",
+                    yaxis_title="Impact (%)", height=400),
+        hline=dict(y=0, line_dash="dash", line_color="black"),
+    ),
+    'country_impact': dict(
+        layout=dict(xaxis_title="", yaxis_title="Impact (%)", height=400),
+        hline=dict(y=0, line_dash="dash", line_color="black"),
+    ),
+    'uncertainty_ci': dict(
+        layout=dict(title="Impact Estimates with 95% Confidence Intervals",
+                    xaxis_title="Impact on Congestion (%)", yaxis_title="",
+                    height=400, hovermode='closest'),
+        vline=dict(x=0, line_dash="dash", line_color="red", line_width=2),
+    ),
+    'bootstrap_distribution': dict(
+        layout=dict(xaxis_title="Impact on Congestion (%)", yaxis_title="Frequency",
+                    height=400, showlegend=True),
+    ),
+    'deep_dive_box': dict(
+        layout=dict(title='Impact Distribution (Box Plot)', yaxis_title='Impact (%)', height=400),
+        hline=dict(y=0, line_dash="dash", line_color="red"),
+    ),
+    'custom_simulation': dict(
+        layout=dict(title="Custom Scenario Impact Estimate",
+                    yaxis_title="Impact on Congestion (%)", height=400, showlegend=False),
+        hline=dict(y=0, line_dash="dash", line_color="black"),
+    ),
+}
+
+def figure_skeleton(kind):
+    """Empty figure carrying the static layout for one of FIGURE_SKELETONS"""
+    spec = FIGURE_SKELETONS[kind]
+    fig = go.Figure(layout=spec['layout'])
+    if 'hline' in spec:
+        fig.add_hline(**spec['hline'])
+    if 'vline' in spec:
+        fig.add_vline(**spec['vline'])
+    return fig
+
+def time_series_skeleton():
+    """Empty baseline/counterfactual subplot pair for the Time Series page"""
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=("Baseline Trajectory", "Counterfactual Trajectory")
+    )
+    fig.update_xaxes(title_text="Year")
+    fig.update_yaxes(title_text="Congestion Index")
+    fig.update_layout(height=500)
+    return fig
+
+def build_scenario_impact_fig(names, vals):
+    """Horizontal bar chart of relative congestion impact per scenario"""
+    names = np.asarray(names)
+    vals = np.asarray(vals, dtype=float)
+    colors = np.where(vals > 0, 'red', 'green')
     
-    return data
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        y=names,
+        x=vals,
+        orientation='h',
+        marker=dict(color=colors, line=dict(color='black', width=1)),
+        text=np.round(vals, 1),
+        textposition='outside',
+        hovertemplate='<b>%{y}</b><br>Impact: %{x:.1f}%<extra></extra>'
+    ))
+    
+    fig.add_vline(x=0, line_dash="dash", line_color="black", line_width=2)
+    
+    fig.update_layout(
+        title="Expected Impact on Congestion by Scenario",
+        xaxis_title="Relative Impact (%)",
+        yaxis_title="",
+        height=400,
+        showlegend=False,
+        hovermode='closest'
+    )
+    return fig
+
+def build_multi_outcome_fig(comparison_df):
+    """Grouped bar chart of congestion, GDP and PM2.5 impacts per scenario"""
+    scenario_names = comparison_df['Scenario'].to_numpy()
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        name='Congestion Impact',
+        x=scenario_names,
+        y=comparison_df['Congestion Impact (%)'].to_numpy(),
+        marker_color='steelblue'
+    ))
+    
+    if 'GDP Impact (%)' in comparison_df.columns:
+        fig.add_trace(go.Bar(
+            name='GDP Impact',
+            x=scenario_names,
+            y=comparison_df['GDP Impact (%)'].to_numpy(),
+            marker_color='green'
+        ))
+    
+    if 'PM2.5 Impact (%)' in comparison_df.columns:
+        fig.add_trace(go.Bar(
+            name='PM2.5 Impact',
+            x=scenario_names,
+            y=comparison_df['PM2.5 Impact (%)'].to_numpy(),
+            marker_color='orange'
+        ))
+    
+    fig.add_hline(y=0, line_dash="dash", line_color="black")
+    fig.update_layout(
+        title="Multi-Dimensional Impact Comparison",
+        xaxis_title="",
+        yaxis_title="Impact (%)",
+        barmode='group',
+        height=500,
+        xaxis_tickangle=-45
+    )
+    return fig
+
+def build_country_coverage_fig(countries, observations):
+    """Horizontal bar chart of the countries with the most observations"""
+    fig = px.bar(
+        x=observations,
+        y=countries,
+        orientation='h',
+        title='Top 20 Countries by Data Availability',
+        labels={'x': 'Observations', 'y': 'Country', 'color': 'Observations'},
+        color=observations,
+        color_continuous_scale='Viridis'
+    )
+    
+    fig.update_layout(height=600)
+    return fig
+
+def build_time_series_fig(scenario_key, countries, title):
+    """Baseline and counterfactual trajectories for the selected countries"""
+    slices = scenario_country_slices(scenario_key)
+    
+    fig = time_series_skeleton()
+    
+    baseline_segments = []
+    cf_segments = []
+    for country in countries:
+        if country not in slices:
+            continue
+        country_data = slices[country]
+        years = country_data['year'].to_numpy()
+        baseline_segments.append((country, *lttb(years, country_data['congestion_index'].to_numpy())))
+        cf_segments.append((country, *lttb(years, country_data['congestion_index_cf'].to_numpy())))
+    
+    # One trace per panel regardless of how many countries are selected
+    baseline_x, baseline_y, baseline_names = join_segments(baseline_segments)
+    cf_x, cf_y, cf_names = join_segments(cf_segments)
+    
+    # Baseline
+    fig.add_trace(
+        go.Scattergl(
+            x=baseline_x,
+            y=baseline_y,
+            mode='lines+markers',
+            name="Baseline",
+            hovertext=baseline_names,
+            hoverinfo='text+x+y',
+            connectgaps=False
+        ),
+        row=1, col=1
+    )
+    
+    # Counterfactual
+    fig.add_trace(
+        go.Scattergl(
+            x=cf_x,
+            y=cf_y,
+            mode='lines+markers',
+            name="Counterfactual",
+            hovertext=cf_names,
+            hoverinfo='text+x+y',
+            connectgaps=False,
+            line=dict(dash='dash')
+        ),
+        row=1, col=2
+    )
+    
+    fig.update_layout(title_text=title)
+    return fig
+
+def build_impact_scatter_fig(scenario_key):
+    """Deep Dive scatter of baseline congestion against policy impact"""
+    fig = px.scatter(
+        load_all_country_effects()[scenario_key],
+        x='baseline_congestion',
+        y='impact_pct',
+        hover_data=['country'],
+        title='Baseline Congestion vs Policy Impact',
+        labels={'baseline_congestion': 'Baseline Congestion Index', 'impact_pct': 'Impact (%)'},
+        color='impact_pct',
+        color_continuous_scale='RdYlGn_r',
+        size=impact_marker_sizes(scenario_key),
+        render_mode='webgl'
+    )
+    fig.add_hline(y=0, line_dash="dash", line_color="black")
+    fig.update_layout(height=500)
+    return fig
+
+# ========================================================================
+# PAGE FRAGMENTS
+# ========================================================================
+# Widget-heavy page sections run as fragments, so interacting with them
+# reruns only the section instead of the whole script.
+
+@st.fragment
+def scenario_comparison_body():
+    """Scenario selector, comparison charts and table"""
+    # One row per scenario, built once; reruns only slice it
+    all_scenarios_df = scenario_comparison_frame()
+    scenario_options = all_scenarios_df['Scenario']
+    
+    # Scenario selector
+    st.markdown("### Select Scenarios to Compare")
+    
+    selected_scenarios = st.multiselect(
+        "Choose scenarios:",
+        options=list(scenario_options.index),
+        default=list(scenario_options.index[:4]),
+        format_func=lambda x: scenario_options[x]
+    )
+    
+    if len(selected_scenarios) < 2:
+        st.warning("Please select at least 2 scenarios to compare.")
+        return
+    
+    # Comparison metrics
+    st.markdown("### Comparison Metrics")
+    
+    comparison_df = all_scenarios_df.loc[selected_scenarios]
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Bar chart comparison
+        fig = figure_skeleton('scenario_congestion')
+        
+        fig.add_trace(go.Bar(
+            name='Baseline',
+            x=comparison_df['Scenario'],
+            y=comparison_df['Baseline'],
+            marker_color='lightgray'
+        ))
+        
+        fig.add_trace(go.Bar(
+            name='Counterfactual',
+            x=comparison_df['Scenario'],
+            y=comparison_df['Counterfactual'],
+            marker_color='steelblue'
+        ))
+        
+        st.plotly_chart(fig, use_container_width=True, key='scenario_congestion')
+    
+    with col2:
+        # Impact comparison
+        fig = figure_skeleton('scenario_impact')
+        
+        impact = comparison_df['Relative Impact (%)'].to_numpy()
+        colors = np.where(impact < 0, 'green', 'red')
+        
+        fig.add_trace(go.Bar(
+            x=comparison_df['Scenario'],
+            y=impact,
+            marker_color=colors,
+            text=np.round(impact, 1),
+            textposition='outside'
+        ))
+        
+        st.plotly_chart(fig, use_container_width=True, key='scenario_impact')
+    
+    # Detailed comparison table
+    st.markdown("### Detailed Comparison")
+    st.dataframe(comparison_df.round(2), use_container_width=True, hide_index=True)
+
+@st.fragment
+def custom_simulator_body():
+    """Policy parameter sliders and the simulation result"""
+    # Input parameters
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        investment_change = st.slider(
+            "Transit Investment Change (%)",
+            min_value=-75,
+            max_value=300,
+            value=50,
+            step=5,
+            help="Percentage change in transit investment relative to baseline"
+        )
+        
+        elasticity = st.slider(
+            "Congestion Elasticity",
+            min_value=-1.0,
+            max_value=0.0,
+            value=-0.3,
+            step=0.05,
+            help="Expected % change in congestion per 1% change in investment (negative = reduction)"
+        )
+    
+    with col2:
+        implementation_lag = st.slider(
+            "Implementation Lag (years)",
+            min_value=0,
+            max_value=5,
+            value=2,
+            help="Years before policy takes full effect"
+        )
+        
+        confidence = st.slider(
+            "Confidence Level (%)",
+            min_value=80,
+            max_value=99,
+            value=95,
+            step=1,
+            help="Confidence level for impact estimates"
+        )
+    
+    # Calculate custom scenario
+    if st.button("Run Simulation", type="primary"):
+        with st.spinner("Running simulation..."):
+            if CUSTOM_SIM_DRAWS > 0:
+                expected_impact, _, lower_bound, upper_bound = simulate_impact(
+                    float(investment_change), float(elasticity),
+                    CUSTOM_SIM_DRAWS, float(confidence), 42
+                )
+            else:
+                # Closed-form estimate with a 20% standard error
+                expected_impact = investment_change * elasticity
+                std_error = abs(expected_impact) * 0.2
+                z_score = 1.96 if confidence == 95 else (1.65 if confidence == 90 else 2.58)
+                
+                lower_bound = expected_impact - (z_score * std_error)
+                upper_bound = expected_impact + (z_score * std_error)
+            
+            # Display results
+            st.success("Simulation Complete!")
+            
+            st.markdown("### Results")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric(
+                    "Expected Impact",
+                    f"{expected_impact:.1f}%",
+                    delta=f"{expected_impact:.1f}%",
+                    delta_color="inverse"
+                )
+            
+            with col2:
+                st.metric(
+                    f"{confidence}% CI Lower",
+                    f"{lower_bound:.1f}%"
+                )
+            
+            with col3:
+                st.metric(
+                    f"{confidence}% CI Upper",
+                    f"{upper_bound:.1f}%"
+                )
+            
+            # Visualization
+            fig = figure_skeleton('custom_simulation')
+            
+            # Add expected impact
+            fig.add_trace(go.Bar(
+                x=['Custom Scenario'],
+                y=[expected_impact],
+                marker_color='steelblue',
+                name='Expected Impact',
+                error_y=dict(
+                    type='data',
+                    symmetric=False,
+                    array=[upper_bound - expected_impact],
+                    arrayminus=[expected_impact - lower_bound]
+                )
+            ))
+            
+            st.plotly_chart(fig, use_container_width=True, key='custom_simulation')
+            
+            # Policy recommendation
+            st.markdown("### Policy Recommendation")
+            if expected_impact < -5:
+                st.success("**Strong Positive Impact**: This policy is expected to significantly reduce congestion.")
+            elif expected_impact < 0:
+                st.info("**Moderate Positive Impact**: This policy should help reduce congestion.")
+            elif expected_impact < 5:
+                st.warning("**Limited Impact**: This policy may have minimal effect on congestion.")
+            else:
+                st.error("**Negative Impact**: This policy may increase congestion.")
 
 # ========================================================================
 # SIDEBAR
@@ -108,12 +855,7 @@ st.sidebar.title("TransPort-PH")
 st.sidebar.markdown("### Policy Simulation Dashboard")
 
 # Navigation
-page = st.sidebar.radio(
-    "Navigation",
-    ["Overview", "Data Quality", "Scenario Comparison", "Country Analysis", 
-     "Time Series", "Uncertainty Analysis", "Custom Simulator", 
-     "Deep Dive", "Reports"]
-)
+page = st.sidebar.radio("Navigation", PAGES)
 
 st.sidebar.markdown("---")
 
@@ -135,9 +877,9 @@ st.sidebar.info(
     """
 )
 
-# Load data
+# Load data needed by the current page
 try:
-    data = load_data()
+    data = load_data(PAGE_ARTIFACTS[page])
     data_loaded = True
 except Exception as e:
     st.error(f"Error loading data: {e}")
@@ -167,13 +909,13 @@ if page == "Overview":
         
         summary = data['summary']
         sim_results = data['simulation_results']
-        baseline = summary[summary['Scenario'].str.contains('Baseline', case=False)]
-        best_scenario = summary.loc[summary['Relative Impact (%)'].idxmin()]
+        baseline = summary[summary['_scenario_lc'].str.startswith('baseline')]
+        best_scenario = summary.loc[summary.attrs['best_scenario_idx']]
         
         with col1:
             st.metric(
                 "Countries Analyzed",
-                f"{data['clean_panel']['country'].nunique()}" if 'clean_panel' in data else "N/A"
+                f"{data['clean_panel']['country'].cat.categories.size}" if 'clean_panel' in data else "N/A"
             )
         
         with col2:
@@ -201,11 +943,7 @@ if page == "Overview":
         st.markdown("### Economic & Environmental Effects")
         
         # Find best scenario key in simulation_results
-        best_scenario_key = None
-        for key, val in sim_results.items():
-            if val['scenario']['name'] == best_scenario['Scenario']:
-                best_scenario_key = key
-                break
+        best_scenario_key = load_scenario_index().get(best_scenario['Scenario'])
         
         if best_scenario_key and best_scenario_key in sim_results:
             best_results = sim_results[best_scenario_key]
@@ -257,33 +995,11 @@ if page == "Overview":
     st.markdown("## Scenario Impact Overview")
     
     if 'summary' in data:
-        fig = go.Figure()
-        
         summary_sorted = data['summary'].sort_values('Relative Impact (%)')
-        
-        colors = ['red' if x > 0 else 'green' for x in summary_sorted['Relative Impact (%)']]
-        
-        fig.add_trace(go.Bar(
-            y=summary_sorted['Scenario'],
-            x=summary_sorted['Relative Impact (%)'],
-            orientation='h',
-            marker=dict(color=colors, line=dict(color='black', width=1)),
-            text=summary_sorted['Relative Impact (%)'].round(1),
-            textposition='outside',
-            hovertemplate='<b>%{y}</b><br>Impact: %{x:.1f}%<extra></extra>'
-        ))
-        
-        fig.add_vline(x=0, line_dash="dash", line_color="black", line_width=2)
-        
-        fig.update_layout(
-            title="Expected Impact on Congestion by Scenario",
-            xaxis_title="Relative Impact (%)",
-            yaxis_title="",
-            height=400,
-            showlegend=False,
-            hovermode='closest'
+        fig = build_scenario_impact_fig(
+            summary_sorted['Scenario'].to_numpy(),
+            summary_sorted['Relative Impact (%)'].to_numpy()
         )
-        
         st.plotly_chart(fig, use_container_width=True)
     
     # Multi-Outcome Comparison
@@ -291,72 +1007,18 @@ if page == "Overview":
     
     if 'simulation_results' in data:
         # Prepare multi-outcome data
-        comparison_data = []
-        for scenario_key, results in data['simulation_results'].items():
-            row = {
-                'Scenario': results['scenario']['name'],
-                'Congestion Impact (%)': results['relative_impact']
-            }
-            if results.get('gdp_relative_impact') is not None:
-                row['GDP Impact (%)'] = results['gdp_relative_impact']
-            if results.get('pm25_relative_impact') is not None:
-                row['PM2.5 Impact (%)'] = results['pm25_relative_impact']
-            comparison_data.append(row)
+        comparison_df = multi_outcome_frame()
         
-        if comparison_data:
-            comparison_df = pd.DataFrame(comparison_data)
-            
-            # Create grouped bar chart
-            fig = go.Figure()
-            
-            fig.add_trace(go.Bar(
-                name='Congestion Impact',
-                x=comparison_df['Scenario'],
-                y=comparison_df['Congestion Impact (%)'],
-                marker_color='steelblue'
-            ))
-            
-            if 'GDP Impact (%)' in comparison_df.columns:
-                fig.add_trace(go.Bar(
-                    name='GDP Impact',
-                    x=comparison_df['Scenario'],
-                    y=comparison_df['GDP Impact (%)'],
-                    marker_color='green'
-                ))
-            
-            if 'PM2.5 Impact (%)' in comparison_df.columns:
-                fig.add_trace(go.Bar(
-                    name='PM2.5 Impact',
-                    x=comparison_df['Scenario'],
-                    y=comparison_df['PM2.5 Impact (%)'],
-                    marker_color='orange'
-                ))
-            
-            fig.add_hline(y=0, line_dash="dash", line_color="black")
-            fig.update_layout(
-                title="Multi-Dimensional Impact Comparison",
-                xaxis_title="",
-                yaxis_title="Impact (%)",
-                barmode='group',
-                height=500,
-                xaxis_tickangle=-45
-            )
-            
+        if len(comparison_df) > 0:
+            fig = build_multi_outcome_fig(comparison_df)
             st.plotly_chart(fig, use_container_width=True)
     
     # Summary table
     st.markdown("## Detailed Scenario Summary")
     
     if 'summary' in data:
-        # Select columns dynamically based on what's available
-        base_cols = ['Scenario', 'Description', 'Relative Impact (%)', 
-                     'Baseline Congestion', 'Counterfactual Congestion']
-        
-        optional_cols = ['GDP Impact (%)', 'PM2.5 Impact (%)']
-        available_cols = base_cols + [col for col in optional_cols if col in data['summary'].columns]
-        
-        display_df = data['summary'][available_cols]
-        display_df = display_df.round(2)
+        # Columns were resolved against the file once in load_summary()
+        display_df = data['summary'][list(data['summary'].attrs['display_cols'])].round(2)
         st.dataframe(display_df, use_container_width=True, hide_index=True)
 
 # ========================================================================
@@ -376,13 +1038,15 @@ elif page == "Data Quality":
     # Summary statistics
     st.markdown("## Coverage Summary")
     
+    counts = coverage_counts(df, len(df), tuple(df.columns))
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric("Total Observations", f"{len(df):,}")
     
     with col2:
-        st.metric("Countries Covered", df['country'].nunique())
+        st.metric("Countries Covered", df['country'].cat.categories.size)
     
     with col3:
         if 'year' in df.columns:
@@ -390,7 +1054,7 @@ elif page == "Data Quality":
             st.metric("Years Spanned", year_range)
     
     with col4:
-        congestion_coverage = df['congestion_index'].notna().sum() / len(df) * 100
+        congestion_coverage = counts['congestion_index'] / len(df) * 100
         st.metric("Congestion Coverage", f"{congestion_coverage:.1f}%")
     
     # Before vs After comparison
@@ -415,10 +1079,10 @@ elif page == "Data Quality":
         'Metric': ['Congestion Data', 'Countries', 'Modal Share', 'PM2.5 Data'],
         'Before': [117, 13, 14, 18],
         'After': [
-            df['congestion_index'].notna().sum(),
-            df['country'].nunique(),
-            df['modal_share_public'].notna().sum() if 'modal_share_public' in df.columns else 0,
-            df['pm25'].notna().sum() if 'pm25' in df.columns else 0
+            counts['congestion_index'],
+            df['country'].cat.categories.size,
+            counts.get('modal_share_public', 0),
+            counts.get('pm25', 0)
         ]
     })
     
@@ -480,6 +1144,9 @@ elif page == "Data Quality":
         st.markdown("### Actual vs ML-Estimated Data")
         
         data_source_counts = df['data_source'].value_counts()
+        actual_count = int(data_source_counts.get('actual_tomtom', 0))
+        ml_count = int(data_source_counts.get('ml_random_forest', 0))
+        total = actual_count + ml_count
         
         col1, col2 = st.columns(2)
         
@@ -487,10 +1154,7 @@ elif page == "Data Quality":
             # Pie chart
             fig = go.Figure(data=[go.Pie(
                 labels=['Actual TomTom', 'ML Estimated'],
-                values=[
-                    data_source_counts.get('actual_tomtom', 0),
-                    data_source_counts.get('ml_random_forest', 0)
-                ],
+                values=[actual_count, ml_count],
                 marker=dict(colors=['#2E86AB', '#A23B72']),
                 hole=0.4,
                 textinfo='label+percent',
@@ -507,10 +1171,6 @@ elif page == "Data Quality":
         with col2:
             st.markdown("#### Data Quality Breakdown")
             
-            actual_count = data_source_counts.get('actual_tomtom', 0)
-            ml_count = data_source_counts.get('ml_random_forest', 0)
-            total = actual_count + ml_count
-            
             st.metric(
                 "Actual Measurements",
                 f"{actual_count:,}",
@@ -524,8 +1184,9 @@ elif page == "Data Quality":
             )
             
             if 'estimation_method' in df.columns:
+                ml_method = next(iter(df['estimation_method'].dropna()), 'Random Forest')
                 st.info(f"""
-                **ML Method:** {df['estimation_method'].dropna().iloc[0] if len(df['estimation_method'].dropna()) > 0 else 'Random Forest'}
+                **ML Method:** {ml_method}
                 
                 **Features Used:**
                 - GDP per capita
@@ -543,20 +1204,12 @@ elif page == "Data Quality":
     
     if 'country' in df.columns:
         # Top countries by data points
-        country_counts = df.groupby('country').size().nlargest(20).reset_index()
-        country_counts.columns = ['Country', 'Observations']
+        country_counts = country_observation_counts(df, len(df), 20)
         
-        fig = px.bar(
-            country_counts,
-            x='Observations',
-            y='Country',
-            orientation='h',
-            title='Top 20 Countries by Data Availability',
-            color='Observations',
-            color_continuous_scale='Viridis'
+        fig = build_country_coverage_fig(
+            country_counts['Country'].to_numpy(),
+            country_counts['Observations'].to_numpy()
         )
-        
-        fig.update_layout(height=600)
         st.plotly_chart(fig, use_container_width=True)
     
     # Sensitivity analysis link
@@ -574,10 +1227,12 @@ elif page == "Data Quality":
     """)
     
     # Load sensitivity analysis if available
-    sensitivity_path = os.path.join(data_dir, 'sensitivity_analysis_results.csv')
-    if os.path.exists(sensitivity_path):
+    sensitivity_path = DATA_DIR / 'sensitivity_analysis_results.csv'
+    if sensitivity_path.is_file():
         st.markdown("### Sensitivity Analysis Results")
-        sensitivity_df = pd.read_csv(sensitivity_path)
+        sensitivity_df = pd.read_csv(sensitivity_path, engine='pyarrow')
+        float_cols = sensitivity_df.select_dtypes('float64').columns
+        sensitivity_df[float_cols] = sensitivity_df[float_cols].astype('float32')
         st.dataframe(sensitivity_df.round(3), use_container_width=True, hide_index=True)
     
     # Documentation links
@@ -609,97 +1264,7 @@ elif page == "Scenario Comparison":
         st.warning("No simulation results available.")
         st.stop()
     
-    sim_results = data['simulation_results']
-    
-    # Scenario selector
-    st.markdown("### Select Scenarios to Compare")
-    
-    scenario_options = {key: val['scenario']['name'] for key, val in sim_results.items()}
-    selected_scenarios = st.multiselect(
-        "Choose scenarios:",
-        options=list(scenario_options.keys()),
-        default=list(scenario_options.keys())[:4],
-        format_func=lambda x: scenario_options[x]
-    )
-    
-    if len(selected_scenarios) < 2:
-        st.warning("Please select at least 2 scenarios to compare.")
-        st.stop()
-    
-    # Comparison metrics
-    st.markdown("### Comparison Metrics")
-    
-    comparison_data = []
-    for scenario_key in selected_scenarios:
-        results = sim_results[scenario_key]
-        comparison_data.append({
-            'Scenario': results['scenario']['name'],
-            'Baseline': results['baseline_congestion'],
-            'Counterfactual': results['counterfactual_congestion'],
-            'Absolute Impact': results['absolute_impact'],
-            'Relative Impact (%)': results['relative_impact']
-        })
-    
-    comparison_df = pd.DataFrame(comparison_data)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Bar chart comparison
-        fig = go.Figure()
-        
-        fig.add_trace(go.Bar(
-            name='Baseline',
-            x=comparison_df['Scenario'],
-            y=comparison_df['Baseline'],
-            marker_color='lightgray'
-        ))
-        
-        fig.add_trace(go.Bar(
-            name='Counterfactual',
-            x=comparison_df['Scenario'],
-            y=comparison_df['Counterfactual'],
-            marker_color='steelblue'
-        ))
-        
-        fig.update_layout(
-            title="Baseline vs Counterfactual Congestion",
-            xaxis_title="",
-            yaxis_title="Congestion Index",
-            barmode='group',
-            height=400
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        # Impact comparison
-        fig = go.Figure()
-        
-        colors = ['green' if x < 0 else 'red' for x in comparison_df['Relative Impact (%)']]
-        
-        fig.add_trace(go.Bar(
-            x=comparison_df['Scenario'],
-            y=comparison_df['Relative Impact (%)'],
-            marker_color=colors,
-            text=comparison_df['Relative Impact (%)'].round(1),
-            textposition='outside'
-        ))
-        
-        fig.add_hline(y=0, line_dash="dash", line_color="black")
-        
-        fig.update_layout(
-            title="Relative Impact on Congestion",
-            xaxis_title="",
-            yaxis_title="Impact (%)",
-            height=400
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Detailed comparison table
-    st.markdown("### Detailed Comparison")
-    st.dataframe(comparison_df.round(2), use_container_width=True, hide_index=True)
+    scenario_comparison_body()
 
 # ========================================================================
 # PAGE: COUNTRY ANALYSIS
@@ -718,7 +1283,7 @@ elif page == "Country Analysis":
     countries = sorted(df['country'].unique())
     selected_country = st.selectbox("Select a country:", countries)
     
-    country_data = df[df['country'] == selected_country].copy()
+    country_data = df[df['country'] == selected_country]
     
     if len(country_data) == 0:
         st.warning(f"No data available for {selected_country}")
@@ -750,77 +1315,73 @@ elif page == "Country Analysis":
     # Time series plots
     st.markdown("### Time Series Analysis")
     
+    # Sorted once for both charts
+    if 'year' in country_data.columns:
+        cd_sorted = country_data.sort_values('year')
+    
     col1, col2 = st.columns(2)
     
     with col1:
         if 'year' in country_data.columns and 'congestion_index' in country_data.columns:
             fig = px.line(
-                country_data.sort_values('year'),
-                x='year',
-                y='congestion_index',
+                x=cd_sorted['year'].to_numpy(),
+                y=cd_sorted['congestion_index'].to_numpy(),
+                labels={'x': 'year', 'y': 'congestion_index'},
                 title='Congestion Over Time',
                 markers=True
             )
             fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, key='country_congestion')
     
     with col2:
         if 'year' in country_data.columns and 'transit_investment_gdp' in country_data.columns:
             fig = px.line(
-                country_data.sort_values('year'),
-                x='year',
-                y='transit_investment_gdp',
+                x=cd_sorted['year'].to_numpy(),
+                y=cd_sorted['transit_investment_gdp'].to_numpy(),
+                labels={'x': 'year', 'y': 'transit_investment_gdp'},
                 title='Transit Investment Over Time',
                 markers=True,
                 color_discrete_sequence=['green']
             )
             fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, key='country_investment')
     
     # Scenario comparison for this country
     if 'simulation_results' in data:
         st.markdown("### Scenario Impacts")
         
-        scenario_impacts = []
-        for scenario_key, results in data['simulation_results'].items():
-            scenario_data = results['data']
-            country_scenario = scenario_data[scenario_data['country'] == selected_country]
-            
-            if len(country_scenario) > 0:
-                baseline = country_scenario['congestion_index'].mean()
-                cf = country_scenario['congestion_index_cf'].mean()
-                impact = ((cf - baseline) / baseline) * 100
-                
-                scenario_impacts.append({
-                    'Scenario': results['scenario']['name'],
-                    'Baseline': baseline,
-                    'Counterfactual': cf,
-                    'Impact (%)': impact
-                })
+        # Lookup into the cached scenario x country means, no per-scenario scan
+        means = country_scenario_means()
+        try:
+            rows = means.xs(selected_country, level='country')
+        except KeyError:
+            rows = None
         
-        if scenario_impacts:
-            impact_df = pd.DataFrame(scenario_impacts)
+        if rows is not None:
+            impact_df = pd.DataFrame({
+                'Scenario': scenario_comparison_frame()['Scenario'].reindex(rows.index).to_numpy(),
+                'Baseline': rows['congestion_index'].to_numpy(),
+                'Counterfactual': rows['congestion_index_cf'].to_numpy(),
+            })
+            impact_df['Impact (%)'] = (
+                (impact_df['Counterfactual'] - impact_df['Baseline']) / impact_df['Baseline'] * 100
+            )
             
-            fig = go.Figure()
-            colors = ['green' if x < 0 else 'red' for x in impact_df['Impact (%)']]
+            fig = figure_skeleton('country_impact')
+            impact = impact_df['Impact (%)'].to_numpy()
+            colors = np.where(impact < 0, 'green', 'red')
             
             fig.add_trace(go.Bar(
                 x=impact_df['Scenario'],
-                y=impact_df['Impact (%)'],
+                y=impact,
                 marker_color=colors,
-                text=impact_df['Impact (%)'].round(1),
+                text=np.round(impact, 1),
                 textposition='outside'
             ))
             
-            fig.add_hline(y=0, line_dash="dash", line_color="black")
-            fig.update_layout(
-                title=f"Expected Impact on {selected_country}",
-                xaxis_title="",
-                yaxis_title="Impact (%)",
-                height=400
-            )
+            fig.update_layout(title=f"Expected Impact on {selected_country}")
             
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, key='country_impact')
 
 # ========================================================================
 # PAGE: TIME SERIES
@@ -846,8 +1407,7 @@ elif page == "Time Series":
     st.markdown("### Compare Trajectories Across Scenarios")
     
     # Scenario selector
-    scenario_options = {key: val['scenario']['name'] 
-                       for key, val in data['simulation_results'].items()}
+    scenario_options = scenario_names()
     selected_scenario = st.selectbox(
         "Select scenario:",
         options=list(scenario_options.keys()),
@@ -856,7 +1416,7 @@ elif page == "Time Series":
     
     # Get top countries by data availability
     df = data['clean_panel']
-    top_countries = df.groupby('country').size().nlargest(10).index.tolist()
+    top_countries = top_countries_by_size(df, len(df))
     
     selected_countries = st.multiselect(
         "Select countries to display:",
@@ -869,46 +1429,12 @@ elif page == "Time Series":
         st.stop()
     
     # Plot time series
-    scenario_data = data['simulation_results'][selected_scenario]['data']
-    
-    fig = make_subplots(
-        rows=1, cols=2,
-        subplot_titles=("Baseline Trajectory", "Counterfactual Trajectory")
+    fig = build_time_series_fig(
+        selected_scenario, selected_countries,
+        f"Scenario: {scenario_options[selected_scenario]}"
     )
     
-    for country in selected_countries:
-        country_data = scenario_data[scenario_data['country'] == country].sort_values('year')
-        
-        # Baseline
-        fig.add_trace(
-            go.Scatter(
-                x=country_data['year'],
-                y=country_data['congestion_index'],
-                mode='lines+markers',
-                name=f"{country}",
-                showlegend=True
-            ),
-            row=1, col=1
-        )
-        
-        # Counterfactual
-        fig.add_trace(
-            go.Scatter(
-                x=country_data['year'],
-                y=country_data['congestion_index_cf'],
-                mode='lines+markers',
-                name=f"{country} (CF)",
-                showlegend=True,
-                line=dict(dash='dash')
-            ),
-            row=1, col=2
-        )
-    
-    fig.update_xaxes(title_text="Year")
-    fig.update_yaxes(title_text="Congestion Index")
-    fig.update_layout(height=500, title_text=f"Scenario: {scenario_options[selected_scenario]}")
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, key='time_series')
 
 # ========================================================================
 # PAGE: UNCERTAINTY ANALYSIS
@@ -939,44 +1465,49 @@ elif page == "Uncertainty Analysis":
     # Display confidence intervals
     st.markdown("### 95% Confidence Intervals for Key Scenarios")
     
-    ci_data = []
-    for scenario_key, results in uncertainty_results.items():
-        scenario_name = data['simulation_results'][scenario_key]['scenario']['name'] if scenario_key in data.get('simulation_results', {}) else scenario_key
-        ci_data.append({
-            'Scenario': scenario_name,
-            'Mean Impact (%)': results['mean'],
-            'Std Dev (%)': results['std'],
-            '95% CI Lower': results['ci_95_lower'],
-            '95% CI Upper': results['ci_95_upper']
-        })
-    
-    ci_df = pd.DataFrame(ci_data)
+    labels = scenario_names()
+    
+    # Fill column arrays directly rather than building a dict per row
+    n = len(uncertainty_results)
+    names = np.empty(n, dtype=object)
+    mean = np.empty(n)
+    std = np.empty(n)
+    lower = np.empty(n)
+    upper = np.empty(n)
+    for i, (scenario_key, results) in enumerate(uncertainty_results.items()):
+        names[i] = labels.get(scenario_key, scenario_key)
+        mean[i] = results['mean']
+        std[i] = results['std']
+        lower[i] = results['ci_95_lower']
+        upper[i] = results['ci_95_upper']
+    
+    ci_df = pd.DataFrame({
+        'Scenario': names,
+        'Mean Impact (%)': mean,
+        'Std Dev (%)': std,
+        '95% CI Lower': lower,
+        '95% CI Upper': upper,
+    }, copy=False)
     
     # Visualization of confidence intervals
-    fig = go.Figure()
-    
-    for idx, row in ci_df.iterrows():
-        fig.add_trace(go.Scatter(
-            x=[row['95% CI Lower'], row['Mean Impact (%)'], row['95% CI Upper']],
-            y=[row['Scenario']] * 3,
-            mode='markers+lines',
-            name=row['Scenario'],
-            marker=dict(size=[8, 12, 8], color=['lightblue', 'blue', 'lightblue']),
-            line=dict(color='blue', width=2),
-            showlegend=False
-        ))
-    
-    fig.add_vline(x=0, line_dash="dash", line_color="red", line_width=2)
-    
-    fig.update_layout(
-        title="Impact Estimates with 95% Confidence Intervals",
-        xaxis_title="Impact on Congestion (%)",
-        yaxis_title="",
-        height=400,
-        hovermode='closest'
-    )
+    fig = figure_skeleton('uncertainty_ci')
+    
+    # All intervals in one trace: (lower, mean, upper, gap) per scenario
+    gap = np.full(n, np.nan)
+    fig.add_trace(go.Scatter(
+        x=np.column_stack([lower, mean, upper, gap]).ravel(),
+        y=np.column_stack([names, names, names, np.full(n, None, dtype=object)]).ravel(),
+        mode='markers+lines',
+        marker=dict(
+            size=np.tile([8, 12, 8, 0], n),
+            color=np.tile(['lightblue', 'blue', 'lightblue', 'blue'], n)
+        ),
+        line=dict(color='blue', width=2),
+        connectgaps=False,
+        showlegend=False
+    ))
     
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, key='uncertainty_ci')
     
     # Table of results
     st.markdown("### Detailed Uncertainty Estimates")
@@ -988,17 +1519,19 @@ elif page == "Uncertainty Analysis":
     selected_scenario = st.selectbox(
         "Select scenario to view distribution:",
         options=list(uncertainty_results.keys()),
-        format_func=lambda x: data['simulation_results'][x]['scenario']['name'] if x in data.get('simulation_results', {}) else x
+        format_func=lambda x: labels.get(x, x)
     )
     
     if selected_scenario in uncertainty_results:
-        distribution = uncertainty_results[selected_scenario]['distribution']
+        # 50 bins computed here so only the counts are sent to the browser
+        centers, counts, widths = bootstrap_histogram(selected_scenario)
         
-        fig = go.Figure()
+        fig = figure_skeleton('bootstrap_distribution')
         
-        fig.add_trace(go.Histogram(
-            x=distribution,
-            nbinsx=50,
+        fig.add_trace(go.Bar(
+            x=centers,
+            y=counts,
+            width=widths,
             name='Bootstrap Distribution',
             marker_color='steelblue',
             opacity=0.7
@@ -1017,14 +1550,10 @@ elif page == "Uncertainty Analysis":
         fig.add_vline(x=ci_upper, line_dash="dash", line_color="orange", line_width=1.5)
         
         fig.update_layout(
-            title=f"Bootstrap Distribution: {data['simulation_results'][selected_scenario]['scenario']['name']}",
-            xaxis_title="Impact on Congestion (%)",
-            yaxis_title="Frequency",
-            height=400,
-            showlegend=True
+            title=f"Bootstrap Distribution: {labels.get(selected_scenario, selected_scenario)}"
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key='bootstrap_distribution')
         
         # Summary statistics
         col1, col2, col3, col4 = st.columns(4)
@@ -1103,71 +1632,63 @@ elif page == "Deep Dive":
             color_discrete_sequence=['steelblue']
         )
         fig.add_vline(x=0, line_dash="dash", line_color="red")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key='deep_dive_histogram')
     
     with col2:
         # Box plot
-        fig = go.Figure()
+        fig = figure_skeleton('deep_dive_box')
         fig.add_trace(go.Box(
             y=country_effects_df['impact_pct'],
             name='Impact Distribution',
             marker_color='steelblue',
             boxmean='sd'
         ))
-        fig.add_hline(y=0, line_dash="dash", line_color="red")
-        fig.update_layout(
-            title='Impact Distribution (Box Plot)',
-            yaxis_title='Impact (%)',
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key='deep_dive_box')
     
     # Top and bottom performers
     st.markdown("### Top and Bottom Performers")
     
+    top_performers, bottom_performers = deep_dive_performers(selected_scenario)
+    
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("#### **Largest Congestion Reductions**")
-        top_performers = country_effects_df.nsmallest(10, 'impact_pct')[['country', 'impact_pct', 'baseline_congestion', 'counterfactual_congestion']]
-        top_performers = top_performers.round(2)
         st.dataframe(top_performers, use_container_width=True, hide_index=True)
     
     with col2:
         st.markdown("#### **Smallest/Negative Effects**")
-        bottom_performers = country_effects_df.nlargest(10, 'impact_pct')[['country', 'impact_pct', 'baseline_congestion', 'counterfactual_congestion']]
-        bottom_performers = bottom_performers.round(2)
         st.dataframe(bottom_performers, use_container_width=True, hide_index=True)
     
     # Interactive scatter plot
     st.markdown("### Interactive Exploration: Baseline vs Impact")
     
-    fig = px.scatter(
-        country_effects_df,
-        x='baseline_congestion',
-        y='impact_pct',
-        hover_data=['country'],
-        title='Baseline Congestion vs Policy Impact',
-        labels={'baseline_congestion': 'Baseline Congestion Index', 'impact_pct': 'Impact (%)'},
-        color='impact_pct',
-        color_continuous_scale='RdYlGn_r',
-        size=abs(country_effects_df['impact_pct'])
-    )
-    fig.add_hline(y=0, line_dash="dash", line_color="black")
-    fig.update_layout(height=500)
-    st.plotly_chart(fig, use_container_width=True)
+    fig = build_impact_scatter_fig(selected_scenario)
+    st.plotly_chart(fig, use_container_width=True, key='deep_dive_scatter')
     
     # Full data table with search
     st.markdown("### All Country Effects")
     
     search_query = st.text_input("Search for a country:", "")
     
+    # Rounded and sorted once per scenario; searching only filters it
+    sorted_df = sorted_country_effects(selected_scenario)
+    
     if search_query:
-        filtered_df = country_effects_df[country_effects_df['country'].str.contains(search_query, case=False, na=False)]
+        # Plain substring match on cached lower-cased names, no regex per keystroke
+        query = search_query.lower()
+        lower_names = lowercase_countries(selected_scenario)
+        mask = np.fromiter((query in name for name in lower_names), dtype=bool, count=len(lower_names))
+        filtered_df = sorted_df.iloc[mask]
     else:
-        filtered_df = country_effects_df
+        filtered_df = sorted_df
     
-    st.dataframe(filtered_df.round(2).sort_values('impact_pct'), use_container_width=True, hide_index=True)
+    # Only send one page of rows to the browser for large tables
+    if len(filtered_df) > TABLE_PAGE_ROWS:
+        start = st.slider("Start row", 0, len(filtered_df) - TABLE_PAGE_ROWS, 0)
+        filtered_df = filtered_df.iloc[start:start + TABLE_PAGE_ROWS]
+    
+    st.dataframe(filtered_df, use_container_width=True, hide_index=True)
 
 # ========================================================================
 # PAGE: CUSTOM SIMULATOR
@@ -1179,125 +1700,7 @@ elif page == "Custom Simulator":
     
     st.info("Adjust the parameters below to simulate a custom transit investment policy.")
     
-    # Input parameters
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        investment_change = st.slider(
-            "Transit Investment Change (%)",
-            min_value=-75,
-            max_value=300,
-            value=50,
-            step=5,
-            help="Percentage change in transit investment relative to baseline"
-        )
-        
-        elasticity = st.slider(
-            "Congestion Elasticity",
-            min_value=-1.0,
-            max_value=0.0,
-            value=-0.3,
-            step=0.05,
-            help="Expected % change in congestion per 1% change in investment (negative = reduction)"
-        )
-    
-    with col2:
-        implementation_lag = st.slider(
-            "Implementation Lag (years)",
-            min_value=0,
-            max_value=5,
-            value=2,
-            help="Years before policy takes full effect"
-        )
-        
-        confidence = st.slider(
-            "Confidence Level (%)",
-            min_value=80,
-            max_value=99,
-            value=95,
-            step=1,
-            help="Confidence level for impact estimates"
-        )
-    
-    # Calculate custom scenario
-    if st.button("Run Simulation", type="primary"):
-        with st.spinner("Running simulation..."):
-            # Simple simulation calculation
-            investment_multiplier = 1 + (investment_change / 100)
-            expected_impact = investment_change * elasticity
-            
-            # Add uncertainty bounds
-            std_error = abs(expected_impact) * 0.2  # 20% standard error
-            z_score = 1.96 if confidence == 95 else (1.65 if confidence == 90 else 2.58)
-            
-            lower_bound = expected_impact - (z_score * std_error)
-            upper_bound = expected_impact + (z_score * std_error)
-            
-            # Display results
-            st.success("Simulation Complete!")
-            
-            st.markdown("### Results")
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric(
-                    "Expected Impact",
-                    f"{expected_impact:.1f}%",
-                    delta=f"{expected_impact:.1f}%",
-                    delta_color="inverse"
-                )
-            
-            with col2:
-                st.metric(
-                    f"{confidence}% CI Lower",
-                    f"{lower_bound:.1f}%"
-                )
-            
-            with col3:
-                st.metric(
-                    f"{confidence}% CI Upper",
-                    f"{upper_bound:.1f}%"
-                )
-            
-            # Visualization
-            fig = go.Figure()
-            
-            # Add expected impact
-            fig.add_trace(go.Bar(
-                x=['Custom Scenario'],
-                y=[expected_impact],
-                marker_color='steelblue',
-                name='Expected Impact',
-                error_y=dict(
-                    type='data',
-                    symmetric=False,
-                    array=[upper_bound - expected_impact],
-                    arrayminus=[expected_impact - lower_bound]
-                )
-            ))
-            
-            fig.add_hline(y=0, line_dash="dash", line_color="black")
-            
-            fig.update_layout(
-                title="Custom Scenario Impact Estimate",
-                yaxis_title="Impact on Congestion (%)",
-                height=400,
-                showlegend=False
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Policy recommendation
-            st.markdown("### Policy Recommendation")
-            if expected_impact < -5:
-                st.success("**Strong Positive Impact**: This policy is expected to significantly reduce congestion.")
-            elif expected_impact < 0:
-                st.info("**Moderate Positive Impact**: This policy should help reduce congestion.")
-            elif expected_impact < 5:
-                st.warning("**Limited Impact**: This policy may have minimal effect on congestion.")
-            else:
-                st.error("**Negative Impact**: This policy may increase congestion.")
+    custom_simulator_body()
 
 # ========================================================================
 # PAGE: REPORTS
@@ -1309,28 +1712,27 @@ elif page == "Reports":
     st.markdown("### Download Results and Reports")
     
     # Check for available reports
-    reports = {
-        'Counterfactual Summary': os.path.join(output_dir, 'counterfactual_summary.csv'),
-        'Simulation Report': os.path.join(data_dir, 'counterfactual_simulation_report.txt'),
-        'Causal Analysis': os.path.join(data_dir, 'causal_analysis_report.txt'),
-        'TFT Training Report': os.path.join(data_dir, 'tft_training_report.txt'),
-    }
+    available = available_reports()
     
     st.markdown("#### Available Reports")
     
-    for report_name, report_path in reports.items():
-        if os.path.exists(report_path):
+    for report_name in REPORTS:
+        if report_name in available:
+            report_path = available[report_name]
             col1, col2 = st.columns([3, 1])
             with col1:
                 st.write(f"[Available] {report_name}")
             with col2:
-                with open(report_path, 'rb') as f:
+                stat = report_path.stat()
+                if stat.st_size <= MAX_DOWNLOAD_BYTES:
                     st.download_button(
                         label="Download",
-                        data=f,
-                        file_name=os.path.basename(report_path),
-                        mime='text/plain' if report_path.endswith('.txt') else 'text/csv'
+                        data=read_report_bytes(report_path, stat.st_mtime),
+                        file_name=report_path.name,
+                        mime='text/plain' if report_path.suffix == '.txt' else 'text/csv'
                     )
+                else:
+                    st.caption(f"Too large to download here: {report_path}")
         else:
             st.write(f"[Not Available] {report_name}")
     
@@ -1341,18 +1743,19 @@ elif page == "Reports":
     
     selected_report = st.selectbox(
         "Select a report to view:",
-        [name for name, path in reports.items() if os.path.exists(path)]
+        list(available)
     )
     
     if selected_report:
-        report_path = reports[selected_report]
+        report_path = available[selected_report]
+        
+        mtime = report_path.stat().st_mtime
         
-        if report_path.endswith('.txt'):
-            with open(report_path, 'r') as f:
-                content = f.read()
+        if report_path.suffix == '.txt':
+            content = read_report_text(report_path, mtime)
             st.text_area("Report Content", content, height=400)
-        elif report_path.endswith('.csv'):
-            df = pd.read_csv(report_path)
+        elif report_path.suffix == '.csv':
+            df = read_report_csv(report_path, mtime)
             st.dataframe(df, use_container_width=True)
 
 # ========================================================================
@@ -1,111 +1,189 @@
-import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+import lxml.html
 import pandas as pd
 import os
 import re
 import time
 
+from _http import SESSION
+from _tables import shrink, write_table
+
+# Patterns used for every project element, compiled once
+_HREF_RE = re.compile(r'/projects/\d+')
+# Loan amounts and years are found in one pass; lastgroup says which matched.
+# Element text is lower-cased before scanning, so no re.I is needed.
+# The digits group always parses as a float once commas are removed.
+_AMOUNT_YEAR_RE = re.compile(
+    r'(?P<amount>\$\s*(?P<digits>\d[\d,]*(?:\.\d+)?)\s*(?:million|billion)?)|\b(?P<year>20[0-2]\d)\b'
+)
+_TRANSPORT_RE = re.compile(r'transport|transit|rail|mrt|lrt|road|metro|bus')
+
+# Element selection runs in libxml2; class names are matched lower-cased
+_CLASS = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+_PROJECT_XPATH = etree.XPath(
+    f"//*[self::div or self::article]"
+    f"[contains({_CLASS}, 'project') or contains({_CLASS}, 'card') or contains({_CLASS}, 'item')]"
+)
+_TITLE_XPATH = etree.XPath(
+    f".//*[self::h2 or self::h3 or self::h4 or self::a]"
+    f"[contains({_CLASS}, 'title') or contains({_CLASS}, 'name')]"
+)
+_PROJECT_LINK_XPATH = etree.XPath(".//a[contains(@href, '/projects/')]")
+
+
+def _project_links(elem):
+    """Links under elem that point at a numbered project page"""
+    return [a for a in _PROJECT_LINK_XPATH(elem) if _HREF_RE.search(a.get('href'))]
+
+
 # ADB Projects: PH transit loans
 base_url = 'https://www.adb.org/projects/country/philippines'
 
-# Add headers to mimic a browser
-headers = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-}
-
-projects = []
-
-try:
-    print("Fetching ADB Philippines projects page...")
-    response = requests.get(base_url, headers=headers, timeout=30)
-    
-    if response.status_code == 200:
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Look for project links and information
-        # ADB website structure may vary, so we try multiple approaches
-        
-        # Approach 1: Look for project cards or tiles
-        project_elements = soup.find_all(['div', 'article'], class_=re.compile(r'project|card|item', re.I))
-        
-        if not project_elements:
-            # Approach 2: Look for links containing 'projects'
-            project_links = soup.find_all('a', href=re.compile(r'/projects/\d+'))
-            project_elements = [link.parent for link in project_links]
-        
-        print(f"Found {len(project_elements)} potential project elements")
-        
-        for elem in project_elements[:50]:  # Limit to first 50
-            try:
-                # Extract project name
-                title_elem = elem.find(['h2', 'h3', 'h4', 'a'], class_=re.compile(r'title|name', re.I))
-                if not title_elem:
-                    title_elem = elem.find('a', href=re.compile(r'/projects/\d+'))
-                
-                project_name = title_elem.get_text(strip=True) if title_elem else 'Unknown Project'
-                
-                # Look for transport/transit related keywords
-                text_content = elem.get_text().lower()
-                if any(keyword in text_content for keyword in ['transport', 'transit', 'rail', 'mrt', 'lrt', 'road', 'metro', 'bus']):
-                    # Try to extract loan amount
-                    amount_match = re.search(r'\$\s*([\d,.]+)\s*(million|billion)?', text_content, re.I)
+
+def _fetch_json_projects():
+    """Transport projects from ADB's JSON project feed
+
+    Returns None when the feed is not served, so the caller can fall back
+    to scraping the HTML page.
+    """
+    response = SESSION.get(
+        base_url, params={'format': 'json'}, headers={'Accept': 'application/json'}, timeout=30
+    )
+    if response.status_code != 200 or 'json' not in response.headers.get('Content-Type', ''):
+        return None
+
+    payload = response.json()
+    results = payload.get('results') if isinstance(payload, dict) else None
+    if not isinstance(results, list):
+        return None
+
+    projects = []
+    for p in results:
+        if not _TRANSPORT_RE.search(str(p.get('sector') or '').lower()):
+            continue
+        approval_year = str(p.get('approval_date') or '')[:4]
+        projects.append({
+            'project': p.get('title') or 'Unknown Project',
+            'loan_amount': p.get('amount'),
+            'year': int(approval_year) if approval_year.isdigit() else None,
+            'category': 'transport'
+        })
+    return projects
+
+
+def main():
+    """Scrape ADB Philippines transport loans and save them by country-year"""
+    projects = None
+    try:
+        print("Fetching ADB Philippines projects feed...")
+        projects = _fetch_json_projects()
+    except Exception as e:
+        print(f"ADB JSON feed unavailable: {e}")
+
+    if projects is not None:
+        print(f"Extracted {len(projects)} transport-related projects from the JSON feed")
+    else:
+        projects = []
+        try:
+            print("Fetching ADB Philippines projects page...")
+            response = SESSION.get(base_url, timeout=30)
+
+            if response.status_code == 200:
+                tree = lxml.html.fromstring(response.content)
+
+                # Look for project links and information
+                # ADB website structure may vary, so we try multiple approaches
+
+                # Approach 1: Look for project cards or tiles
+                project_elements = _PROJECT_XPATH(tree)
+
+                if not project_elements:
+                    # Approach 2: Look for links containing 'projects'
+                    project_links = _project_links(tree)
+                    project_elements = [link.getparent() for link in project_links]
+
+                print(f"Found {len(project_elements)} potential project elements")
+
+                for elem in project_elements[:50]:  # Limit to first 50
+                    # Extract project name
+                    title_elems = _TITLE_XPATH(elem) or _project_links(elem)
+                    project_name = title_elems[0].text_content().strip() if title_elems else 'Unknown Project'
+
+                    # Look for transport/transit related keywords
+                    text_content = elem.text_content().lower()
+                    if _TRANSPORT_RE.search(text_content) is None:
+                        continue
+
+                    # Find the first loan amount and the first year
+                    amount_match = year_match = None
+                    for match in _AMOUNT_YEAR_RE.finditer(text_content):
+                        if match.lastgroup == 'amount':
+                            amount_match = amount_match or match
+                        else:
+                            year_match = year_match or match
+                        if amount_match is not None and year_match is not None:
+                            break
+
+                    # Loan amount, scaled by a million/billion unit following it
                     loan_amount = None
-                    if amount_match:
-                        amount_str = amount_match.group(1).replace(',', '')
+                    if amount_match is not None:
+                        amount_str = amount_match['digits'].replace(',', '')
                         multiplier = 1000000 if 'million' in text_content[amount_match.start():amount_match.end()+20] else 1
                         multiplier = 1000000000 if 'billion' in text_content[amount_match.start():amount_match.end()+20] else multiplier
                         loan_amount = float(amount_str) * multiplier
-                    
-                    # Try to extract year
-                    year_match = re.search(r'\b(20[0-2]\d)\b', text_content)
-                    year = int(year_match.group(1)) if year_match else None
-                    
+
+                    year = int(year_match['year']) if year_match is not None else None
+
                     projects.append({
                         'project': project_name,
                         'loan_amount': loan_amount,
                         'year': year,
                         'category': 'transport'
                     })
-            except Exception as e:
-                continue
-        
-        print(f"Extracted {len(projects)} transport-related projects")
+
+                print(f"Extracted {len(projects)} transport-related projects")
+            else:
+                print(f"Error: Status {response.status_code}")
+
+        except Exception as e:
+            print(f"Error fetching ADB data: {e}")
+
+    # Filter projects to only keep those with valid year and loan amount
+    projects = [p for p in projects if p.get('year') and p.get('loan_amount') and p['year'] <= 2024]
+
+    # If no good data was extracted, add known ADB Philippines transport projects
+    if len(projects) == 0:
+        print("Using known ADB Philippines transport projects as fallback...")
+        projects = [
+            {'project': 'MRT Line 3 Rehabilitation', 'loan_amount': 100000000, 'year': 2019, 'country': 'Philippines', 'category': 'transport'},
+            {'project': 'Metro Manila Skyway Stage 3', 'loan_amount': 2700000000, 'year': 2015, 'country': 'Philippines', 'category': 'transport'},
+            {'project': 'Malolos-Clark Railway Project', 'loan_amount': 2700000000, 'year': 2018, 'country': 'Philippines', 'category': 'transport'},
+            {'project': 'Metro Manila Bus Rapid Transit', 'loan_amount': 500000000, 'year': 2021, 'country': 'Philippines', 'category': 'transport'},
+            {'project': 'Road Sector Improvement Project', 'loan_amount': 500000000, 'year': 2020, 'country': 'Philippines', 'category': 'transport'}
+        ]
+    else:
+        # Add country to scraped projects
+        for project in projects:
+            project['country'] = 'Philippines'
+
+    # Aggregate by year for time series
+    df_projects = pd.DataFrame(projects)
+    if len(df_projects) > 0 and 'year' in df_projects.columns and 'loan_amount' in df_projects.columns:
+        # Group by country and year, summing loan amounts
+        df_projects['country'] = df_projects['country'].astype('category')
+        df = df_projects.groupby(['country', 'year'], observed=True, sort=False, as_index=False).agg(
+            adb_loan_amount=('loan_amount', 'sum'),
+            num_projects=('project', 'count')
+        )
     else:
-        print(f"Error: Status {response.status_code}")
-
-except Exception as e:
-    print(f"Error fetching ADB data: {e}")
-
-# Filter projects to only keep those with valid year and loan amount
-projects = [p for p in projects if p.get('year') and p.get('loan_amount') and p['year'] <= 2024]
-
-# If no good data was extracted, add known ADB Philippines transport projects
-if len(projects) == 0:
-    print("Using known ADB Philippines transport projects as fallback...")
-    projects = [
-        {'project': 'MRT Line 3 Rehabilitation', 'loan_amount': 100000000, 'year': 2019, 'country': 'Philippines', 'category': 'transport'},
-        {'project': 'Metro Manila Skyway Stage 3', 'loan_amount': 2700000000, 'year': 2015, 'country': 'Philippines', 'category': 'transport'},
-        {'project': 'Malolos-Clark Railway Project', 'loan_amount': 2700000000, 'year': 2018, 'country': 'Philippines', 'category': 'transport'},
-        {'project': 'Metro Manila Bus Rapid Transit', 'loan_amount': 500000000, 'year': 2021, 'country': 'Philippines', 'category': 'transport'},
-        {'project': 'Road Sector Improvement Project', 'loan_amount': 500000000, 'year': 2020, 'country': 'Philippines', 'category': 'transport'}
-    ]
-else:
-    # Add country to scraped projects
-    for project in projects:
-        project['country'] = 'Philippines'
-
-# Aggregate by year for time series
-df_projects = pd.DataFrame(projects)
-if len(df_projects) > 0 and 'year' in df_projects.columns and 'loan_amount' in df_projects.columns:
-    # Group by country and year, summing loan amounts
-    df = df_projects.groupby(['country', 'year'], as_index=False).agg({
-        'loan_amount': 'sum',
-        'project': 'count'
-    }).rename(columns={'project': 'num_projects', 'loan_amount': 'adb_loan_amount'})
-else:
-    df = pd.DataFrame(projects)
-
-output_path = os.path.join('..', 'data', 'adb_projects.csv')
-df.to_csv(output_path, index=False)
-
-print(f"ADB projects data saved: {len(df)} year-country combinations")
\ No newline at end of file
+        df = pd.DataFrame(projects)
+
+    df = shrink(df)
+    output_path = os.path.join('..', 'data', 'adb_projects.csv')
+    write_table(df, output_path)
+
+    print(f"ADB projects data saved: {len(df)} year-country combinations")
+
+
+if __name__ == '__main__':
+    main()
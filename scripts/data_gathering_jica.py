@@ -1,105 +1,80 @@
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 import os
 
+from _tables import shrink, write_table
+
 # JICA Reports: MRT/LRT data from PDFs and official sources
 # Using verified data from official Philippine rail transit sources
 
 # MRT/LRT lines in Metro Manila with actual data
 # Sources: DOTr, LRTA, MRTC annual reports and official statistics
 
-rail_lines = [
-    {
-        'line': 'LRT-1',
-        'length_km': 32.4,  # Including extension
-        'passengers_per_day': 300000,  # Pre-COVID average
-        'stations': 20,
-        'operator': 'LRTA',
-        'opening_year': 1984,
-        'type': 'Light Rail'
-    },
-    {
-        'line': 'LRT-2',
-        'length_km': 13.8,
-        'passengers_per_day': 200000,  # Pre-COVID average
-        'stations': 13,
-        'operator': 'LRTA',
-        'opening_year': 2003,
-        'type': 'Light Rail'
-    },
-    {
-        'line': 'MRT-3',
-        'length_km': 16.9,
-        'passengers_per_day': 500000,  # Pre-COVID average, often exceeds capacity
-        'stations': 13,
-        'operator': 'DOTr-MRT3',
-        'opening_year': 1999,
-        'type': 'Metro Rail'
-    },
-    {
-        'line': 'MRT-7 (Cebu)',
-        'length_km': 22.0,
-        'passengers_per_day': None,  # Under construction
-        'stations': 11,
-        'operator': 'DOTr',
-        'opening_year': 2024,  # Expected
-        'type': 'Metro Rail'
-    },
-    {
-        'line': 'LRT-1 Cavite Extension',
-        'length_km': 11.7,
-        'passengers_per_day': None,  # Opened 2021, ramping up
-        'stations': 8,
-        'operator': 'LRTA',
-        'opening_year': 2021,
-        'type': 'Light Rail'
-    },
-    {
-        'line': 'MRT-4 (Planned)',
-        'length_km': 15.0,
-        'passengers_per_day': None,  # Planned
-        'stations': 10,
-        'operator': 'DOTr',
-        'opening_year': None,
-        'type': 'Metro Rail'
-    }
-]
-
-# Create time series data by aggregating operational rail by year
-years = range(2000, 2025)
-time_series_data = []
-
-for year in years:
-    # Count operational lines and cumulative stats
-    operational_lines = [line for line in rail_lines if line['opening_year'] and line['opening_year'] <= year]
-    
-    total_length = sum([line['length_km'] for line in operational_lines])
-    total_stations = sum([line['stations'] for line in operational_lines])
-    
-    # Calculate average daily passengers (0 if no operational lines)
-    operational_with_pax = [line for line in operational_lines if line['passengers_per_day']]
-    avg_daily_passengers = sum([line['passengers_per_day'] for line in operational_with_pax]) if operational_with_pax else 0
-    
-    # Apply COVID impact (2020-2021)
-    if year == 2020:
-        avg_daily_passengers *= 0.3  # 70% reduction
-    elif year == 2021:
-        avg_daily_passengers *= 0.5  # 50% reduction
-    elif year == 2022:
-        avg_daily_passengers *= 0.7  # 30% reduction
-    
-    time_series_data.append({
+rail_lines = {
+    'line': ['LRT-1', 'LRT-2', 'MRT-3', 'MRT-7 (Cebu)', 'LRT-1 Cavite Extension', 'MRT-4 (Planned)'],
+    # LRT-1 includes extension
+    'length_km': [32.4, 13.8, 16.9, 22.0, 11.7, 15.0],
+    # Pre-COVID averages (MRT-3 often exceeds capacity); None for lines under
+    # construction, ramping up (Cavite Extension opened 2021) or planned
+    'passengers_per_day': [300000, 200000, 500000, None, None, None],
+    'stations': [20, 13, 13, 11, 8, 10],
+    'operator': ['LRTA', 'LRTA', 'DOTr-MRT3', 'DOTr', 'LRTA', 'DOTr'],
+    # MRT-7 expected 2024; MRT-4 not yet scheduled
+    'opening_year': [1984, 2003, 1999, 2024, 2021, None],
+    'type': ['Light Rail', 'Light Rail', 'Metro Rail', 'Metro Rail', 'Light Rail', 'Metro Rail'],
+}
+
+# COVID ridership factors: 70% / 50% / 30% reduction
+_COVID_FACTOR = {2020: 0.3, 2021: 0.5, 2022: 0.7}
+
+# Per-line columns as arrays; missing values become NaN (opening year) or 0 (ridership)
+_OPENING_YEAR = np.array(rail_lines['opening_year'], dtype=float)
+_LENGTH_KM = np.array(rail_lines['length_km'])
+_STATIONS = np.array(rail_lines['stations'])
+_PASSENGERS = np.array([p or 0 for p in rail_lines['passengers_per_day']], dtype=float)
+
+
+@lru_cache(maxsize=1)
+def build_frame():
+    """Yearly operational rail totals (built once per process; do not mutate)"""
+    # Create time series data by aggregating operational rail by year
+    years = np.arange(2000, 2025)
+
+    # operational[i, j]: line i is open in years[j] (NaN opening years never are)
+    operational = _OPENING_YEAR[:, None] <= years[None, :]
+
+    total_lines = operational.sum(axis=0)
+    # Lengths are given to 0.1 km; round away the matmul's summation noise
+    total_length = np.round(operational.T @ _LENGTH_KM, 1)
+    total_stations = operational.T @ _STATIONS
+
+    # Daily passengers over lines with ridership data (0 if none operational)
+    avg_daily_passengers = operational.T @ _PASSENGERS
+
+    # Apply COVID impact (ridership multiplier per year, 1.0 otherwise)
+    avg_daily_passengers = avg_daily_passengers * pd.Series(years).map(_COVID_FACTOR).fillna(1.0).to_numpy()
+
+    return shrink(pd.DataFrame({
         'country': 'Philippines',
-        'year': year,
-        'total_rail_lines': len(operational_lines),
+        'year': years,
+        'total_rail_lines': total_lines,
         'total_rail_length_km': total_length,
         'total_rail_stations': total_stations,
         'avg_daily_rail_passengers': avg_daily_passengers,
         'source': 'JICA/DOTr/LRTA Reports'
-    })
+    }))
+
+
+def main():
+    """Aggregate operational rail lines by year and save the series"""
+    data = build_frame()
+    output_path = os.path.join('..', 'data', 'jica_mrt_lrt.csv')
+    write_table(data, output_path)
 
-data = pd.DataFrame(time_series_data)
+    print(f"JICA MRT/LRT data saved: {len(data)} years of rail transit data (official data)")
 
-output_path = os.path.join('..', 'data', 'jica_mrt_lrt.csv')
-data.to_csv(output_path, index=False)
 
-print(f"JICA MRT/LRT data saved: {len(data)} years of rail transit data (official data)")
\ No newline at end of file
+if __name__ == '__main__':
+    main()
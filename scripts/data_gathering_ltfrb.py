@@ -1,147 +1,80 @@
-import requests
-from bs4 import BeautifulSoup
+from functools import lru_cache
+
 import pandas as pd
 import os
 
+from _http import CACHE_PATH, SESSION, uncached
+from _tables import shrink, write_table
+
 # LTFRB/DOTr: Fleet and fares data
 # Using known data from official reports
 
 # Historical data from LTFRB reports and DOTr statistics
-ltfrb_data = [
-    {
-        'country': 'Philippines',
-        'year': 2015,
-        'fleet_size': 42000,
-        'jeepney_count': 35000,
-        'bus_count': 7000,
-        'base_fare_jeepney': 8.0,
-        'base_fare_bus': 12.0,
-        'farebox_recovery': 0.75,
-        'source': 'LTFRB Annual Report'
-    },
-    {
-        'country': 'Philippines',
-        'year': 2016,
-        'fleet_size': 43500,
-        'jeepney_count': 36000,
-        'bus_count': 7500,
-        'base_fare_jeepney': 8.0,
-        'base_fare_bus': 12.0,
-        'farebox_recovery': 0.76,
-        'source': 'LTFRB Annual Report'
-    },
-    {
-        'country': 'Philippines',
-        'year': 2017,
-        'fleet_size': 45000,
-        'jeepney_count': 37000,
-        'bus_count': 8000,
-        'base_fare_jeepney': 8.0,
-        'base_fare_bus': 12.0,
-        'farebox_recovery': 0.77,
-        'source': 'LTFRB Annual Report'
-    },
-    {
-        'country': 'Philippines',
-        'year': 2018,
-        'fleet_size': 46500,
-        'jeepney_count': 38000,
-        'bus_count': 8500,
-        'base_fare_jeepney': 9.0,
-        'base_fare_bus': 13.0,
-        'farebox_recovery': 0.78,
-        'source': 'LTFRB Annual Report'
-    },
-    {
-        'country': 'Philippines',
-        'year': 2019,
-        'fleet_size': 48000,
-        'jeepney_count': 39000,
-        'bus_count': 9000,
-        'base_fare_jeepney': 9.0,
-        'base_fare_bus': 13.0,
-        'farebox_recovery': 0.79,
-        'source': 'LTFRB Annual Report'
-    },
-    {
-        'country': 'Philippines',
-        'year': 2020,
-        'fleet_size': 45000,  # Reduced due to COVID-19
-        'jeepney_count': 37000,
-        'bus_count': 8000,
-        'base_fare_jeepney': 9.0,
-        'base_fare_bus': 13.0,
-        'farebox_recovery': 0.65,  # Reduced due to capacity limits
-        'source': 'DOTr COVID Report'
-    },
-    {
-        'country': 'Philippines',
-        'year': 2021,
-        'fleet_size': 46000,
-        'jeepney_count': 38000,
-        'bus_count': 8000,
-        'base_fare_jeepney': 9.0,
-        'base_fare_bus': 13.0,
-        'farebox_recovery': 0.68,
-        'source': 'DOTr Recovery Report'
-    },
-    {
-        'country': 'Philippines',
-        'year': 2022,
-        'fleet_size': 47500,
-        'jeepney_count': 39000,
-        'bus_count': 8500,
-        'base_fare_jeepney': 10.0,
-        'base_fare_bus': 14.0,
-        'farebox_recovery': 0.72,
-        'source': 'LTFRB Report'
-    },
-    {
-        'country': 'Philippines',
-        'year': 2023,
-        'fleet_size': 49000,
-        'jeepney_count': 40000,
-        'bus_count': 9000,
-        'base_fare_jeepney': 11.0,  # After fare hike
-        'base_fare_bus': 15.0,
-        'farebox_recovery': 0.75,
-        'source': 'LTFRB Report'
-    },
-    {
-        'country': 'Philippines',
-        'year': 2024,
-        'fleet_size': 50000,
-        'jeepney_count': 41000,
-        'bus_count': 9000,
-        'base_fare_jeepney': 12.0,  # Modern jeepney program
-        'base_fare_bus': 15.0,
-        'farebox_recovery': 0.76,
-        'source': 'LTFRB Modernization Report'
-    }
-]
-
-# Try to scrape additional data from LTFRB website
-url = 'https://ltfrb.gov.ph/'
-headers = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+ltfrb_data = {
+    'country': ['Philippines'] * 10,
+    'year': list(range(2015, 2025)),
+    # 2020 dip due to COVID-19
+    'fleet_size': [42000, 43500, 45000, 46500, 48000, 45000, 46000, 47500, 49000, 50000],
+    'jeepney_count': [35000, 36000, 37000, 38000, 39000, 37000, 38000, 39000, 40000, 41000],
+    'bus_count': [7000, 7500, 8000, 8500, 9000, 8000, 8000, 8500, 9000, 9000],
+    # 2023 fare hike, 2024 modern jeepney program
+    'base_fare_jeepney': [8.0, 8.0, 8.0, 9.0, 9.0, 9.0, 9.0, 10.0, 11.0, 12.0],
+    'base_fare_bus': [12.0, 12.0, 12.0, 13.0, 13.0, 13.0, 13.0, 14.0, 15.0, 15.0],
+    # 2020 reduced due to capacity limits
+    'farebox_recovery': [0.75, 0.76, 0.77, 0.78, 0.79, 0.65, 0.68, 0.72, 0.75, 0.76],
+    'source': [
+        'LTFRB Annual Report', 'LTFRB Annual Report', 'LTFRB Annual Report',
+        'LTFRB Annual Report', 'LTFRB Annual Report', 'DOTr COVID Report',
+        'DOTr Recovery Report', 'LTFRB Report', 'LTFRB Report',
+        'LTFRB Modernization Report',
+    ],
 }
 
-try:
-    print("Attempting to fetch additional data from LTFRB website...")
-    response = requests.get(url, headers=headers, timeout=15)
-    
-    if response.status_code == 200:
-        soup = BeautifulSoup(response.content, 'html.parser')
-        # Could potentially extract news or statistics if available
-        print("Successfully connected to LTFRB website")
-    else:
-        print(f"LTFRB website returned status {response.status_code}")
-except Exception as e:
-    print(f"Could not fetch from LTFRB website: {e}")
+# Last-Modified header of the LTFRB homepage seen on the previous run
+LAST_MODIFIED_PATH = CACHE_PATH.parent / 'ltfrb_last_modified'
+
+
+@lru_cache(maxsize=1)
+def build_frame():
+    """Historical LTFRB table (built once per process; do not mutate)"""
+    return shrink(pd.DataFrame(ltfrb_data))
+
+
+def main():
+    """Check the LTFRB website and save the historical fleet and fare data"""
+    # Check the LTFRB website for updates
+    url = 'https://ltfrb.gov.ph/'
+    headers = {}
+    if LAST_MODIFIED_PATH.exists():
+        headers['If-Modified-Since'] = LAST_MODIFIED_PATH.read_text().strip()
+
+    try:
+        print("Checking the LTFRB website for updates...")
+        # Nothing is parsed from the page, so only the headers are requested.
+        # The reply must come from the server for If-Modified-Since to apply.
+        with uncached():
+            response = SESSION.head(url, headers=headers, timeout=15, allow_redirects=True)
+
+        if response.status_code == 304:
+            print("LTFRB website unchanged since the last run")
+        elif response.status_code == 200:
+            print("Successfully connected to LTFRB website")
+            last_modified = response.headers.get('Last-Modified')
+            if last_modified:
+                LAST_MODIFIED_PATH.parent.mkdir(parents=True, exist_ok=True)
+                LAST_MODIFIED_PATH.write_text(last_modified)
+        else:
+            print(f"LTFRB website returned status {response.status_code}")
+    except Exception as e:
+        print(f"Could not reach the LTFRB website: {e}")
+
+    # Save historical data
+    data = build_frame()
+    output_path = os.path.join('..', 'data', 'ltfrb_data.csv')
+    write_table(data, output_path)
+
+    print(f"LTFRB data saved: {len(data)} years of data (official sources)")
 
-# Save historical data
-data = pd.DataFrame(ltfrb_data)
-output_path = os.path.join('..', 'data', 'ltfrb_data.csv')
-data.to_csv(output_path, index=False)
 
-print(f"LTFRB data saved: {len(data)} years of data (official sources)")
\ No newline at end of file
+if __name__ == '__main__':
+    main()
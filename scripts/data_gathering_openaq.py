@@ -1,8 +1,13 @@
-import requests
+import numpy as np
+import orjson
 import pandas as pd
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-import time
+from pathlib import Path
+
+from _http import SESSION, RateLimiter
+from _tables import write_table
 
 # OpenAQ API for air quality (PM2.5) - EXPANDED VERSION
 # Dramatically increase coverage by fetching data for ALL countries
@@ -12,173 +17,218 @@ print("OpenAQ PM2.5 Data Gathering - EXPANDED COVERAGE")
 print("="*70)
 
 # STRATEGY 1: Use OpenAQ API v2 with proper pagination for more countries
-all_data = []
+# Annual mean PM2.5 frame for each country that returned data, by country name
+country_frames = {}
+total_measurements = 0
 base_url = 'https://api.openaq.org/v2/measurements'
 
-# Expanded list of countries to fetch data for
-countries = [
+# Annual PM2.5 averages from WHO/IQAir reports (country, year, pm25, source)
+HISTORICAL_PM25_PATH = Path(__file__).with_name('assets') / 'historical_pm25.csv'
+
+# Expanded list of countries to fetch data for, as (ISO code, name)
+COUNTRIES = (
     # Asia-Pacific
-    {'code': 'PH', 'name': 'Philippines'},
-    {'code': 'SG', 'name': 'Singapore'},
-    {'code': 'TH', 'name': 'Thailand'},
-    {'code': 'ID', 'name': 'Indonesia'},
-    {'code': 'MY', 'name': 'Malaysia'},
-    {'code': 'VN', 'name': 'Vietnam'},
-    {'code': 'IN', 'name': 'India'},
-    {'code': 'CN', 'name': 'China'},
-    {'code': 'JP', 'name': 'Japan'},
-    {'code': 'KR', 'name': 'South Korea'},
-    {'code': 'AU', 'name': 'Australia'},
-    {'code': 'NZ', 'name': 'New Zealand'},
-    {'code': 'BD', 'name': 'Bangladesh'},
-    {'code': 'PK', 'name': 'Pakistan'},
-    {'code': 'LK', 'name': 'Sri Lanka'},
-    {'code': 'NP', 'name': 'Nepal'},
-    {'code': 'MM', 'name': 'Myanmar'},
-    {'code': 'KH', 'name': 'Cambodia'},
-    {'code': 'LA', 'name': 'Laos'},
+    ('PH', 'Philippines'),
+    ('SG', 'Singapore'),
+    ('TH', 'Thailand'),
+    ('ID', 'Indonesia'),
+    ('MY', 'Malaysia'),
+    ('VN', 'Vietnam'),
+    ('IN', 'India'),
+    ('CN', 'China'),
+    ('JP', 'Japan'),
+    ('KR', 'South Korea'),
+    ('AU', 'Australia'),
+    ('NZ', 'New Zealand'),
+    ('BD', 'Bangladesh'),
+    ('PK', 'Pakistan'),
+    ('LK', 'Sri Lanka'),
+    ('NP', 'Nepal'),
+    ('MM', 'Myanmar'),
+    ('KH', 'Cambodia'),
+    ('LA', 'Laos'),
     
     # Middle East
-    {'code': 'TR', 'name': 'Turkey'},
-    {'code': 'EG', 'name': 'Egypt'},
-    {'code': 'SA', 'name': 'Saudi Arabia'},
-    {'code': 'AE', 'name': 'United Arab Emirates'},
-    {'code': 'IL', 'name': 'Israel'},
-    {'code': 'JO', 'name': 'Jordan'},
-    {'code': 'LB', 'name': 'Lebanon'},
-    {'code': 'KW', 'name': 'Kuwait'},
-    {'code': 'QA', 'name': 'Qatar'},
-    {'code': 'BH', 'name': 'Bahrain'},
-    {'code': 'OM', 'name': 'Oman'},
+    ('TR', 'Turkey'),
+    ('EG', 'Egypt'),
+    ('SA', 'Saudi Arabia'),
+    ('AE', 'United Arab Emirates'),
+    ('IL', 'Israel'),
+    ('JO', 'Jordan'),
+    ('LB', 'Lebanon'),
+    ('KW', 'Kuwait'),
+    ('QA', 'Qatar'),
+    ('BH', 'Bahrain'),
+    ('OM', 'Oman'),
     
     # Europe
-    {'code': 'GB', 'name': 'United Kingdom'},
-    {'code': 'FR', 'name': 'France'},
-    {'code': 'DE', 'name': 'Germany'},
-    {'code': 'IT', 'name': 'Italy'},
-    {'code': 'ES', 'name': 'Spain'},
-    {'code': 'PL', 'name': 'Poland'},
-    {'code': 'NL', 'name': 'Netherlands'},
-    {'code': 'BE', 'name': 'Belgium'},
-    {'code': 'SE', 'name': 'Sweden'},
-    {'code': 'NO', 'name': 'Norway'},
-    {'code': 'DK', 'name': 'Denmark'},
-    {'code': 'FI', 'name': 'Finland'},
-    {'code': 'CH', 'name': 'Switzerland'},
-    {'code': 'AT', 'name': 'Austria'},
-    {'code': 'PT', 'name': 'Portugal'},
-    {'code': 'GR', 'name': 'Greece'},
-    {'code': 'CZ', 'name': 'Czech Republic'},
-    {'code': 'RO', 'name': 'Romania'},
-    {'code': 'HU', 'name': 'Hungary'},
-    {'code': 'BG', 'name': 'Bulgaria'},
-    {'code': 'HR', 'name': 'Croatia'},
-    {'code': 'RS', 'name': 'Serbia'},
-    {'code': 'UA', 'name': 'Ukraine'},
-    {'code': 'RU', 'name': 'Russia'},
+    ('GB', 'United Kingdom'),
+    ('FR', 'France'),
+    ('DE', 'Germany'),
+    ('IT', 'Italy'),
+    ('ES', 'Spain'),
+    ('PL', 'Poland'),
+    ('NL', 'Netherlands'),
+    ('BE', 'Belgium'),
+    ('SE', 'Sweden'),
+    ('NO', 'Norway'),
+    ('DK', 'Denmark'),
+    ('FI', 'Finland'),
+    ('CH', 'Switzerland'),
+    ('AT', 'Austria'),
+    ('PT', 'Portugal'),
+    ('GR', 'Greece'),
+    ('CZ', 'Czech Republic'),
+    ('RO', 'Romania'),
+    ('HU', 'Hungary'),
+    ('BG', 'Bulgaria'),
+    ('HR', 'Croatia'),
+    ('RS', 'Serbia'),
+    ('UA', 'Ukraine'),
+    ('RU', 'Russia'),
     
     # Americas
-    {'code': 'US', 'name': 'United States'},
-    {'code': 'CA', 'name': 'Canada'},
-    {'code': 'MX', 'name': 'Mexico'},
-    {'code': 'BR', 'name': 'Brazil'},
-    {'code': 'AR', 'name': 'Argentina'},
-    {'code': 'CL', 'name': 'Chile'},
-    {'code': 'CO', 'name': 'Colombia'},
-    {'code': 'PE', 'name': 'Peru'},
-    {'code': 'VE', 'name': 'Venezuela'},
-    {'code': 'EC', 'name': 'Ecuador'},
-    {'code': 'BO', 'name': 'Bolivia'},
-    {'code': 'UY', 'name': 'Uruguay'},
+    ('US', 'United States'),
+    ('CA', 'Canada'),
+    ('MX', 'Mexico'),
+    ('BR', 'Brazil'),
+    ('AR', 'Argentina'),
+    ('CL', 'Chile'),
+    ('CO', 'Colombia'),
+    ('PE', 'Peru'),
+    ('VE', 'Venezuela'),
+    ('EC', 'Ecuador'),
+    ('BO', 'Bolivia'),
+    ('UY', 'Uruguay'),
     
     # Africa
-    {'code': 'ZA', 'name': 'South Africa'},
-    {'code': 'NG', 'name': 'Nigeria'},
-    {'code': 'KE', 'name': 'Kenya'},
-    {'code': 'ET', 'name': 'Ethiopia'},
-    {'code': 'GH', 'name': 'Ghana'},
-    {'code': 'TZ', 'name': 'Tanzania'},
-    {'code': 'UG', 'name': 'Uganda'},
-    {'code': 'DZ', 'name': 'Algeria'},
-    {'code': 'MA', 'name': 'Morocco'},
-    {'code': 'AO', 'name': 'Angola'},
-]
+    ('ZA', 'South Africa'),
+    ('NG', 'Nigeria'),
+    ('KE', 'Kenya'),
+    ('ET', 'Ethiopia'),
+    ('GH', 'Ghana'),
+    ('TZ', 'Tanzania'),
+    ('UG', 'Uganda'),
+    ('DZ', 'Algeria'),
+    ('MA', 'Morocco'),
+    ('AO', 'Angola'),
+)
+
+# One categorical dtype for country names everywhere, so API and historical
+# frames group, concatenate and merge on shared integer codes
+COUNTRY_DTYPE = pd.CategoricalDtype(sorted(name for _, name in COUNTRIES))
+
+# Historical annual means, loaded up front so covered countries are not fetched
+historical_data = pd.read_csv(
+    HISTORICAL_PM25_PATH,
+    dtype={'country': COUNTRY_DTYPE, 'year': 'int16', 'pm25': 'float32', 'source': 'category'}
+)
+
+# Fetch recent data for annual aggregation
+# Get last 2 years of data for better coverage
+date_to = datetime.now()
+date_from = date_to - timedelta(days=730)
+
+# Countries whose historical data already covers every year in the fetch window
+window_years = set(range(date_from.year, date_to.year + 1))
+historical_years = historical_data.groupby('country', observed=True)['year'].agg(set)
+covered = {country for country, years in historical_years.items() if window_years <= years}
+countries_to_fetch = [(code, name) for code, name in COUNTRIES if name not in covered]
 
-print(f"\nAttempting to fetch PM2.5 data for {len(countries)} countries from OpenAQ API...")
+print(f"\nAttempting to fetch PM2.5 data for {len(countries_to_fetch)} countries from OpenAQ API...")
+if covered:
+    print(f"(skipping {len(covered)} countries already covered by historical data for {min(window_years)}-{max(window_years)})")
 print("This may take a few minutes...\n")
 
+# OpenAQ allows 300 requests/minute; requests from all workers share this budget
+rate_limit = RateLimiter(per_second=5)
+# Requests in flight at once; each worker spends its time waiting on the server
+MAX_CONCURRENT_REQUESTS = 10
+
+
+def fetch_country(country_code):
+    """Request one page of PM2.5 measurements for a country"""
+    params = {
+        'country': country_code,
+        'parameter': 'pm25',
+        'limit': 1000,
+        'page': 1,
+        'date_from': date_from.strftime('%Y-%m-%d'),
+        'date_to': date_to.strftime('%Y-%m-%d')
+    }
+    rate_limit.wait()
+    return SESSION.get(base_url, params=params, timeout=30)
+
+
+def annual_means(measurements, country_name):
+    """Annual mean PM2.5 (country, year, pm25) from one country's measurements"""
+    # Parse dates and extract year; OpenAQ nests the timestamp as {'utc': ..., 'local': ...}
+    utc_dates = measurements['date'].str.get('utc').fillna(measurements['date'])
+    years = pd.to_datetime(utc_dates, format='ISO8601', utc=True, errors='coerce').dt.year
+    
+    # Filter valid PM2.5 values in one pass (NaN and extreme outliers fail the range check;
+    # rows with unparseable dates have no year)
+    values = measurements['value']
+    valid = values.between(0, 500, inclusive='neither') & years.notna()
+    
+    # Sum and count per year with bincount
+    group, keys = pd.factorize(years[valid].to_numpy(np.int32))
+    means = np.bincount(group, weights=values[valid].to_numpy(np.float64)) / np.bincount(group)
+    return pd.DataFrame({
+        'country': pd.Categorical([country_name] * len(keys), dtype=COUNTRY_DTYPE),
+        'year': keys.astype('int16'),
+        'pm25': means.astype('float32'),
+    })
+
+
 successful_countries = []
+# Responses served from the on-disk cache in _http (requests-cache)
+cached_responses = 0
 failed_countries = []
 
-for country_info in countries:
-    country_code = country_info['code']
-    country_name = country_info['name']
-    
-    try:
-        # Fetch recent data for annual aggregation
-        # Get last 2 years of data for better coverage
-        params = {
-            'country': country_code,
-            'parameter': 'pm25',
-            'limit': 1000,
-            'page': 1,
-            'date_from': (datetime.now() - timedelta(days=730)).strftime('%Y-%m-%d'),
-            'date_to': datetime.now().strftime('%Y-%m-%d')
-        }
+with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+    futures = {executor.submit(fetch_country, code): name for code, name in countries_to_fetch}
+
+    for future in as_completed(futures):
+        country_name = futures[future]
     
-        response = requests.get(base_url, params=params, timeout=30)
+        try:
+            response = future.result()
+            cached_responses += getattr(response, 'from_cache', False)
         
-        if response.status_code == 200:
-            data = response.json()
-            if 'results' in data and len(data['results']) > 0:
-                # Add country name to each record
-                for record in data['results']:
-                    record['country_name'] = country_name
-                all_data.extend(data['results'])
-                successful_countries.append(country_name)
-                print(f"✓ {country_name:25s}: {len(data['results']):4d} measurements")
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                if 'results' in data and len(data['results']) > 0:
+                    # Aggregate this country now, while the remaining requests are in flight
+                    measurements = pd.DataFrame(data['results'])
+                    if 'date' in measurements.columns and 'value' in measurements.columns:
+                        country_frames[country_name] = annual_means(measurements, country_name)
+                    total_measurements += len(measurements)
+                    successful_countries.append(country_name)
+                    print(f"✓ {country_name:25s}: {len(data['results']):4d} measurements")
+                else:
+                    failed_countries.append((country_name, "No data available"))
+                    print(f"✗ {country_name:25s}: No data available")
             else:
-                failed_countries.append((country_name, "No data available"))
-                print(f"✗ {country_name:25s}: No data available")
-        else:
-            failed_countries.append((country_name, f"HTTP {response.status_code}"))
-            print(f"✗ {country_name:25s}: HTTP {response.status_code}")
-            
-        # Rate limiting: small delay between requests
-        time.sleep(0.5)
+                failed_countries.append((country_name, f"HTTP {response.status_code}"))
+                print(f"✗ {country_name:25s}: HTTP {response.status_code}")
         
-    except Exception as e:
-        failed_countries.append((country_name, str(e)))
-        print(f"✗ {country_name:25s}: Error - {str(e)[:40]}")
+        except Exception as e:
+            failed_countries.append((country_name, str(e)))
+            print(f"✗ {country_name:25s}: Error - {str(e)[:40]}")
 
 print(f"\n{'='*70}")
 print(f"API Fetch Summary:")
 print(f"  ✓ Successful: {len(successful_countries)} countries")
 print(f"  ✗ Failed: {len(failed_countries)} countries")
-print(f"  Total measurements: {len(all_data)}")
+print(f"  Total measurements: {total_measurements}")
+print(f"  Served from local cache: {cached_responses}/{len(countries_to_fetch)} requests")
 print(f"{'='*70}\n")
 
-# Process API data if available
-if len(all_data) > 0:
-    df = pd.DataFrame(all_data)
-    
-    # Extract date and value
-    if 'date' in df.columns and 'value' in df.columns and 'country_name' in df.columns:
-        # Parse dates and extract year
-        df['date'] = pd.to_datetime(df['date'].apply(lambda x: x['utc'] if isinstance(x, dict) else x))
-        df['year'] = df['date'].dt.year
-        
-        # Filter valid PM2.5 values (remove outliers)
-        df = df[df['value'].notna()]
-        df = df[(df['value'] > 0) & (df['value'] < 500)]  # Remove extreme outliers
-        
-        # Aggregate by country and year - calculate annual mean PM2.5
-        annual_data_api = df.groupby(['country_name', 'year'])['value'].mean().reset_index()
-        annual_data_api.columns = ['country', 'year', 'pm25']
-        
-        print(f"✓ Processed {len(annual_data_api)} country-year pairs from API")
-    else:
-        annual_data_api = pd.DataFrame()
+# Combine the per-country annual means from the API, in country order
+if len(country_frames) > 0:
+    annual_data_api = pd.concat([country_frames[name] for name in sorted(country_frames)], ignore_index=True)
+    print(f"✓ Processed {len(annual_data_api)} country-year pairs from API")
 else:
     annual_data_api = pd.DataFrame()
 
@@ -186,287 +236,19 @@ else:
 # This provides broad coverage for countries not in OpenAQ
 print("\nAdding comprehensive historical PM2.5 data from WHO/IQAir/World Bank...\n")
 
-historical_data = pd.DataFrame([
-    # Philippines
-    {'country': 'Philippines', 'year': 2015, 'pm25': 22.1, 'source': 'WHO'},
-    {'country': 'Philippines', 'year': 2016, 'pm25': 21.8, 'source': 'WHO'},
-    {'country': 'Philippines', 'year': 2017, 'pm25': 21.5, 'source': 'WHO'},
-    {'country': 'Philippines', 'year': 2018, 'pm25': 20.9, 'source': 'IQAir'},
-    {'country': 'Philippines', 'year': 2019, 'pm25': 18.2, 'source': 'IQAir'},
-    {'country': 'Philippines', 'year': 2020, 'pm25': 15.8, 'source': 'IQAir'},
-    {'country': 'Philippines', 'year': 2021, 'pm25': 17.4, 'source': 'IQAir'},
-    {'country': 'Philippines', 'year': 2022, 'pm25': 19.1, 'source': 'IQAir'},
-    {'country': 'Philippines', 'year': 2023, 'pm25': 19.8, 'source': 'IQAir'},
-    
-    # Singapore
-    {'country': 'Singapore', 'year': 2015, 'pm25': 19.2, 'source': 'NEA'},
-    {'country': 'Singapore', 'year': 2016, 'pm25': 18.1, 'source': 'NEA'},
-    {'country': 'Singapore', 'year': 2017, 'pm25': 17.6, 'source': 'NEA'},
-    {'country': 'Singapore', 'year': 2018, 'pm25': 16.3, 'source': 'IQAir'},
-    {'country': 'Singapore', 'year': 2019, 'pm25': 14.7, 'source': 'IQAir'},
-    {'country': 'Singapore', 'year': 2020, 'pm25': 13.2, 'source': 'IQAir'},
-    {'country': 'Singapore', 'year': 2021, 'pm25': 12.8, 'source': 'IQAir'},
-    {'country': 'Singapore', 'year': 2022, 'pm25': 13.5, 'source': 'IQAir'},
-    {'country': 'Singapore', 'year': 2023, 'pm25': 14.1, 'source': 'IQAir'},
-    
-    # India (major cities average)
-    {'country': 'India', 'year': 2015, 'pm25': 91.2, 'source': 'WHO'},
-    {'country': 'India', 'year': 2016, 'pm25': 89.5, 'source': 'WHO'},
-    {'country': 'India', 'year': 2017, 'pm25': 88.1, 'source': 'WHO'},
-    {'country': 'India', 'year': 2018, 'pm25': 84.1, 'source': 'IQAir'},
-    {'country': 'India', 'year': 2019, 'pm25': 58.1, 'source': 'IQAir'},
-    {'country': 'India', 'year': 2020, 'pm25': 51.9, 'source': 'IQAir'},
-    {'country': 'India', 'year': 2021, 'pm25': 58.7, 'source': 'IQAir'},
-    {'country': 'India', 'year': 2022, 'pm25': 53.3, 'source': 'IQAir'},
-    {'country': 'India', 'year': 2023, 'pm25': 54.4, 'source': 'IQAir'},
-    
-    # China
-    {'country': 'China', 'year': 2015, 'pm25': 54.3, 'source': 'WHO'},
-    {'country': 'China', 'year': 2016, 'pm25': 49.2, 'source': 'WHO'},
-    {'country': 'China', 'year': 2017, 'pm25': 44.5, 'source': 'WHO'},
-    {'country': 'China', 'year': 2018, 'pm25': 40.8, 'source': 'IQAir'},
-    {'country': 'China', 'year': 2019, 'pm25': 39.1, 'source': 'IQAir'},
-    {'country': 'China', 'year': 2020, 'pm25': 37.2, 'source': 'IQAir'},
-    {'country': 'China', 'year': 2021, 'pm25': 35.7, 'source': 'IQAir'},
-    {'country': 'China', 'year': 2022, 'pm25': 34.2, 'source': 'IQAir'},
-    {'country': 'China', 'year': 2023, 'pm25': 32.6, 'source': 'IQAir'},
-    
-    # Indonesia
-    {'country': 'Indonesia', 'year': 2015, 'pm25': 16.5, 'source': 'WHO'},
-    {'country': 'Indonesia', 'year': 2016, 'pm25': 17.2, 'source': 'WHO'},
-    {'country': 'Indonesia', 'year': 2017, 'pm25': 16.8, 'source': 'WHO'},
-    {'country': 'Indonesia', 'year': 2018, 'pm25': 15.4, 'source': 'IQAir'},
-    {'country': 'Indonesia', 'year': 2019, 'pm25': 34.3, 'source': 'IQAir'},
-    {'country': 'Indonesia', 'year': 2020, 'pm25': 34.8, 'source': 'IQAir'},
-    {'country': 'Indonesia', 'year': 2021, 'pm25': 31.2, 'source': 'IQAir'},
-    {'country': 'Indonesia', 'year': 2022, 'pm25': 34.4, 'source': 'IQAir'},
-    {'country': 'Indonesia', 'year': 2023, 'pm25': 35.1, 'source': 'IQAir'},
-    
-    # Thailand
-    {'country': 'Thailand', 'year': 2015, 'pm25': 26.2, 'source': 'WHO'},
-    {'country': 'Thailand', 'year': 2016, 'pm25': 25.8, 'source': 'WHO'},
-    {'country': 'Thailand', 'year': 2017, 'pm25': 24.9, 'source': 'WHO'},
-    {'country': 'Thailand', 'year': 2018, 'pm25': 24.3, 'source': 'IQAir'},
-    {'country': 'Thailand', 'year': 2019, 'pm25': 33.1, 'source': 'IQAir'},
-    {'country': 'Thailand', 'year': 2020, 'pm25': 32.8, 'source': 'IQAir'},
-    {'country': 'Thailand', 'year': 2021, 'pm25': 37.2, 'source': 'IQAir'},
-    {'country': 'Thailand', 'year': 2022, 'pm25': 31.9, 'source': 'IQAir'},
-    {'country': 'Thailand', 'year': 2023, 'pm25': 31.4, 'source': 'IQAir'},
-    
-    # Vietnam
-    {'country': 'Vietnam', 'year': 2015, 'pm25': 26.8, 'source': 'WHO'},
-    {'country': 'Vietnam', 'year': 2016, 'pm25': 27.1, 'source': 'WHO'},
-    {'country': 'Vietnam', 'year': 2017, 'pm25': 26.5, 'source': 'WHO'},
-    {'country': 'Vietnam', 'year': 2018, 'pm25': 27.3, 'source': 'IQAir'},
-    {'country': 'Vietnam', 'year': 2019, 'pm25': 34.1, 'source': 'IQAir'},
-    {'country': 'Vietnam', 'year': 2020, 'pm25': 36.7, 'source': 'IQAir'},
-    {'country': 'Vietnam', 'year': 2021, 'pm25': 33.2, 'source': 'IQAir'},
-    {'country': 'Vietnam', 'year': 2022, 'pm25': 34.1, 'source': 'IQAir'},
-    {'country': 'Vietnam', 'year': 2023, 'pm25': 35.9, 'source': 'IQAir'},
-    
-    # Malaysia
-    {'country': 'Malaysia', 'year': 2015, 'pm25': 18.5, 'source': 'WHO'},
-    {'country': 'Malaysia', 'year': 2016, 'pm25': 17.9, 'source': 'WHO'},
-    {'country': 'Malaysia', 'year': 2017, 'pm25': 17.2, 'source': 'WHO'},
-    {'country': 'Malaysia', 'year': 2018, 'pm25': 17.8, 'source': 'IQAir'},
-    {'country': 'Malaysia', 'year': 2019, 'pm25': 31.7, 'source': 'IQAir'},
-    {'country': 'Malaysia', 'year': 2020, 'pm25': 27.4, 'source': 'IQAir'},
-    {'country': 'Malaysia', 'year': 2021, 'pm25': 30.1, 'source': 'IQAir'},
-    {'country': 'Malaysia', 'year': 2022, 'pm25': 28.9, 'source': 'IQAir'},
-    {'country': 'Malaysia', 'year': 2023, 'pm25': 29.6, 'source': 'IQAir'},
-    
-    # Japan
-    {'country': 'Japan', 'year': 2015, 'pm25': 13.1, 'source': 'WHO'},
-    {'country': 'Japan', 'year': 2016, 'pm25': 12.5, 'source': 'WHO'},
-    {'country': 'Japan', 'year': 2017, 'pm25': 12.0, 'source': 'WHO'},
-    {'country': 'Japan', 'year': 2018, 'pm25': 11.7, 'source': 'IQAir'},
-    {'country': 'Japan', 'year': 2019, 'pm25': 11.7, 'source': 'IQAir'},
-    {'country': 'Japan', 'year': 2020, 'pm25': 10.8, 'source': 'IQAir'},
-    {'country': 'Japan', 'year': 2021, 'pm25': 10.5, 'source': 'IQAir'},
-    {'country': 'Japan', 'year': 2022, 'pm25': 10.9, 'source': 'IQAir'},
-    {'country': 'Japan', 'year': 2023, 'pm25': 11.2, 'source': 'IQAir'},
-    
-    # South Korea
-    {'country': 'South Korea', 'year': 2015, 'pm25': 26.9, 'source': 'WHO'},
-    {'country': 'South Korea', 'year': 2016, 'pm25': 25.1, 'source': 'WHO'},
-    {'country': 'South Korea', 'year': 2017, 'pm25': 24.8, 'source': 'WHO'},
-    {'country': 'South Korea', 'year': 2018, 'pm25': 24.8, 'source': 'IQAir'},
-    {'country': 'South Korea', 'year': 2019, 'pm25': 24.8, 'source': 'IQAir'},
-    {'country': 'South Korea', 'year': 2020, 'pm25': 21.1, 'source': 'IQAir'},
-    {'country': 'South Korea', 'year': 2021, 'pm25': 22.6, 'source': 'IQAir'},
-    {'country': 'South Korea', 'year': 2022, 'pm25': 23.7, 'source': 'IQAir'},
-    {'country': 'South Korea', 'year': 2023, 'pm25': 24.1, 'source': 'IQAir'},
-    
-    # United States
-    {'country': 'United States', 'year': 2015, 'pm25': 8.4, 'source': 'EPA'},
-    {'country': 'United States', 'year': 2016, 'pm25': 8.1, 'source': 'EPA'},
-    {'country': 'United States', 'year': 2017, 'pm25': 8.2, 'source': 'EPA'},
-    {'country': 'United States', 'year': 2018, 'pm25': 8.5, 'source': 'IQAir'},
-    {'country': 'United States', 'year': 2019, 'pm25': 7.5, 'source': 'IQAir'},
-    {'country': 'United States', 'year': 2020, 'pm25': 8.2, 'source': 'IQAir'},
-    {'country': 'United States', 'year': 2021, 'pm25': 9.9, 'source': 'IQAir'},
-    {'country': 'United States', 'year': 2022, 'pm25': 8.6, 'source': 'IQAir'},
-    {'country': 'United States', 'year': 2023, 'pm25': 9.1, 'source': 'IQAir'},
-    
-    # United Kingdom
-    {'country': 'United Kingdom', 'year': 2015, 'pm25': 11.8, 'source': 'WHO'},
-    {'country': 'United Kingdom', 'year': 2016, 'pm25': 10.9, 'source': 'WHO'},
-    {'country': 'United Kingdom', 'year': 2017, 'pm25': 10.2, 'source': 'WHO'},
-    {'country': 'United Kingdom', 'year': 2018, 'pm25': 10.4, 'source': 'IQAir'},
-    {'country': 'United Kingdom', 'year': 2019, 'pm25': 10.5, 'source': 'IQAir'},
-    {'country': 'United Kingdom', 'year': 2020, 'pm25': 8.5, 'source': 'IQAir'},
-    {'country': 'United Kingdom', 'year': 2021, 'pm25': 9.2, 'source': 'IQAir'},
-    {'country': 'United Kingdom', 'year': 2022, 'pm25': 9.6, 'source': 'IQAir'},
-    {'country': 'United Kingdom', 'year': 2023, 'pm25': 9.8, 'source': 'IQAir'},
-    
-    # Germany
-    {'country': 'Germany', 'year': 2015, 'pm25': 13.1, 'source': 'EEA'},
-    {'country': 'Germany', 'year': 2016, 'pm25': 12.4, 'source': 'EEA'},
-    {'country': 'Germany', 'year': 2017, 'pm25': 11.9, 'source': 'EEA'},
-    {'country': 'Germany', 'year': 2018, 'pm25': 12.1, 'source': 'IQAir'},
-    {'country': 'Germany', 'year': 2019, 'pm25': 11.5, 'source': 'IQAir'},
-    {'country': 'Germany', 'year': 2020, 'pm25': 9.8, 'source': 'IQAir'},
-    {'country': 'Germany', 'year': 2021, 'pm25': 10.4, 'source': 'IQAir'},
-    {'country': 'Germany', 'year': 2022, 'pm25': 10.9, 'source': 'IQAir'},
-    {'country': 'Germany', 'year': 2023, 'pm25': 11.1, 'source': 'IQAir'},
-    
-    # France
-    {'country': 'France', 'year': 2015, 'pm25': 11.9, 'source': 'EEA'},
-    {'country': 'France', 'year': 2016, 'pm25': 11.2, 'source': 'EEA'},
-    {'country': 'France', 'year': 2017, 'pm25': 10.8, 'source': 'EEA'},
-    {'country': 'France', 'year': 2018, 'pm25': 12.4, 'source': 'IQAir'},
-    {'country': 'France', 'year': 2019, 'pm25': 11.7, 'source': 'IQAir'},
-    {'country': 'France', 'year': 2020, 'pm25': 9.4, 'source': 'IQAir'},
-    {'country': 'France', 'year': 2021, 'pm25': 10.2, 'source': 'IQAir'},
-    {'country': 'France', 'year': 2022, 'pm25': 11.1, 'source': 'IQAir'},
-    {'country': 'France', 'year': 2023, 'pm25': 11.5, 'source': 'IQAir'},
-    
-    # Brazil
-    {'country': 'Brazil', 'year': 2015, 'pm25': 12.7, 'source': 'WHO'},
-    {'country': 'Brazil', 'year': 2016, 'pm25': 12.2, 'source': 'WHO'},
-    {'country': 'Brazil', 'year': 2017, 'pm25': 11.9, 'source': 'WHO'},
-    {'country': 'Brazil', 'year': 2018, 'pm25': 14.7, 'source': 'IQAir'},
-    {'country': 'Brazil', 'year': 2019, 'pm25': 14.5, 'source': 'IQAir'},
-    {'country': 'Brazil', 'year': 2020, 'pm25': 16.9, 'source': 'IQAir'},
-    {'country': 'Brazil', 'year': 2021, 'pm25': 18.8, 'source': 'IQAir'},
-    {'country': 'Brazil', 'year': 2022, 'pm25': 16.2, 'source': 'IQAir'},
-    {'country': 'Brazil', 'year': 2023, 'pm25': 15.8, 'source': 'IQAir'},
-    
-    # Mexico
-    {'country': 'Mexico', 'year': 2015, 'pm25': 20.8, 'source': 'WHO'},
-    {'country': 'Mexico', 'year': 2016, 'pm25': 19.9, 'source': 'WHO'},
-    {'country': 'Mexico', 'year': 2017, 'pm25': 19.2, 'source': 'WHO'},
-    {'country': 'Mexico', 'year': 2018, 'pm25': 19.5, 'source': 'IQAir'},
-    {'country': 'Mexico', 'year': 2019, 'pm25': 19.3, 'source': 'IQAir'},
-    {'country': 'Mexico', 'year': 2020, 'pm25': 17.8, 'source': 'IQAir'},
-    {'country': 'Mexico', 'year': 2021, 'pm25': 18.4, 'source': 'IQAir'},
-    {'country': 'Mexico', 'year': 2022, 'pm25': 19.1, 'source': 'IQAir'},
-    {'country': 'Mexico', 'year': 2023, 'pm25': 19.7, 'source': 'IQAir'},
-    
-    # Australia
-    {'country': 'Australia', 'year': 2015, 'pm25': 5.7, 'source': 'WHO'},
-    {'country': 'Australia', 'year': 2016, 'pm25': 5.5, 'source': 'WHO'},
-    {'country': 'Australia', 'year': 2017, 'pm25': 5.2, 'source': 'WHO'},
-    {'country': 'Australia', 'year': 2018, 'pm25': 6.9, 'source': 'IQAir'},
-    {'country': 'Australia', 'year': 2019, 'pm25': 9.0, 'source': 'IQAir'},
-    {'country': 'Australia', 'year': 2020, 'pm25': 7.7, 'source': 'IQAir'},
-    {'country': 'Australia', 'year': 2021, 'pm25': 6.5, 'source': 'IQAir'},
-    {'country': 'Australia', 'year': 2022, 'pm25': 5.9, 'source': 'IQAir'},
-    {'country': 'Australia', 'year': 2023, 'pm25': 6.2, 'source': 'IQAir'},
-    
-    # Canada
-    {'country': 'Canada', 'year': 2015, 'pm25': 6.9, 'source': 'WHO'},
-    {'country': 'Canada', 'year': 2016, 'pm25': 6.5, 'source': 'WHO'},
-    {'country': 'Canada', 'year': 2017, 'pm25': 6.2, 'source': 'WHO'},
-    {'country': 'Canada', 'year': 2018, 'pm25': 6.3, 'source': 'IQAir'},
-    {'country': 'Canada', 'year': 2019, 'pm25': 6.4, 'source': 'IQAir'},
-    {'country': 'Canada', 'year': 2020, 'pm25': 7.1, 'source': 'IQAir'},
-    {'country': 'Canada', 'year': 2021, 'pm25': 9.0, 'source': 'IQAir'},
-    {'country': 'Canada', 'year': 2022, 'pm25': 7.9, 'source': 'IQAir'},
-    {'country': 'Canada', 'year': 2023, 'pm25': 7.2, 'source': 'IQAir'},
-    
-    # Turkey
-    {'country': 'Turkey', 'year': 2015, 'pm25': 30.8, 'source': 'WHO'},
-    {'country': 'Turkey', 'year': 2016, 'pm25': 29.4, 'source': 'WHO'},
-    {'country': 'Turkey', 'year': 2017, 'pm25': 28.7, 'source': 'WHO'},
-    {'country': 'Turkey', 'year': 2018, 'pm25': 32.1, 'source': 'IQAir'},
-    {'country': 'Turkey', 'year': 2019, 'pm25': 30.9, 'source': 'IQAir'},
-    {'country': 'Turkey', 'year': 2020, 'pm25': 29.5, 'source': 'IQAir'},
-    {'country': 'Turkey', 'year': 2021, 'pm25': 30.7, 'source': 'IQAir'},
-    {'country': 'Turkey', 'year': 2022, 'pm25': 32.8, 'source': 'IQAir'},
-    {'country': 'Turkey', 'year': 2023, 'pm25': 33.2, 'source': 'IQAir'},
-    
-    # Egypt
-    {'country': 'Egypt', 'year': 2015, 'pm25': 93.2, 'source': 'WHO'},
-    {'country': 'Egypt', 'year': 2016, 'pm25': 90.8, 'source': 'WHO'},
-    {'country': 'Egypt', 'year': 2017, 'pm25': 88.5, 'source': 'WHO'},
-    {'country': 'Egypt', 'year': 2018, 'pm25': 86.7, 'source': 'IQAir'},
-    {'country': 'Egypt', 'year': 2019, 'pm25': 87.7, 'source': 'IQAir'},
-    {'country': 'Egypt', 'year': 2020, 'pm25': 76.7, 'source': 'IQAir'},
-    {'country': 'Egypt', 'year': 2021, 'pm25': 79.4, 'source': 'IQAir'},
-    {'country': 'Egypt', 'year': 2022, 'pm25': 81.2, 'source': 'IQAir'},
-    {'country': 'Egypt', 'year': 2023, 'pm25': 82.6, 'source': 'IQAir'},
-    
-    # South Africa
-    {'country': 'South Africa', 'year': 2015, 'pm25': 23.8, 'source': 'WHO'},
-    {'country': 'South Africa', 'year': 2016, 'pm25': 23.1, 'source': 'WHO'},
-    {'country': 'South Africa', 'year': 2017, 'pm25': 22.6, 'source': 'WHO'},
-    {'country': 'South Africa', 'year': 2018, 'pm25': 22.9, 'source': 'IQAir'},
-    {'country': 'South Africa', 'year': 2019, 'pm25': 28.5, 'source': 'IQAir'},
-    {'country': 'South Africa', 'year': 2020, 'pm25': 26.2, 'source': 'IQAir'},
-    {'country': 'South Africa', 'year': 2021, 'pm25': 24.8, 'source': 'IQAir'},
-    {'country': 'South Africa', 'year': 2022, 'pm25': 23.7, 'source': 'IQAir'},
-    {'country': 'South Africa', 'year': 2023, 'pm25': 24.1, 'source': 'IQAir'},
-    
-    # Russia
-    {'country': 'Russia', 'year': 2015, 'pm25': 14.8, 'source': 'WHO'},
-    {'country': 'Russia', 'year': 2016, 'pm25': 14.2, 'source': 'WHO'},
-    {'country': 'Russia', 'year': 2017, 'pm25': 13.9, 'source': 'WHO'},
-    {'country': 'Russia', 'year': 2018, 'pm25': 13.5, 'source': 'IQAir'},
-    {'country': 'Russia', 'year': 2019, 'pm25': 13.5, 'source': 'IQAir'},
-    {'country': 'Russia', 'year': 2020, 'pm25': 12.7, 'source': 'IQAir'},
-    {'country': 'Russia', 'year': 2021, 'pm25': 13.2, 'source': 'IQAir'},
-    {'country': 'Russia', 'year': 2022, 'pm25': 14.1, 'source': 'IQAir'},
-    {'country': 'Russia', 'year': 2023, 'pm25': 14.5, 'source': 'IQAir'},
-    
-    # Colombia
-    {'country': 'Colombia', 'year': 2015, 'pm25': 17.2, 'source': 'WHO'},
-    {'country': 'Colombia', 'year': 2016, 'pm25': 16.8, 'source': 'WHO'},
-    {'country': 'Colombia', 'year': 2017, 'pm25': 16.4, 'source': 'WHO'},
-    {'country': 'Colombia', 'year': 2018, 'pm25': 17.9, 'source': 'IQAir'},
-    {'country': 'Colombia', 'year': 2019, 'pm25': 17.5, 'source': 'IQAir'},
-    {'country': 'Colombia', 'year': 2020, 'pm25': 16.1, 'source': 'IQAir'},
-    {'country': 'Colombia', 'year': 2021, 'pm25': 16.8, 'source': 'IQAir'},
-    {'country': 'Colombia', 'year': 2022, 'pm25': 17.3, 'source': 'IQAir'},
-    {'country': 'Colombia', 'year': 2023, 'pm25': 17.8, 'source': 'IQAir'},
-    
-    # Peru
-    {'country': 'Peru', 'year': 2015, 'pm25': 34.1, 'source': 'WHO'},
-    {'country': 'Peru', 'year': 2016, 'pm25': 33.2, 'source': 'WHO'},
-    {'country': 'Peru', 'year': 2017, 'pm25': 32.5, 'source': 'WHO'},
-    {'country': 'Peru', 'year': 2018, 'pm25': 31.8, 'source': 'IQAir'},
-    {'country': 'Peru', 'year': 2019, 'pm25': 31.4, 'source': 'IQAir'},
-    {'country': 'Peru', 'year': 2020, 'pm25': 28.7, 'source': 'IQAir'},
-    {'country': 'Peru', 'year': 2021, 'pm25': 29.5, 'source': 'IQAir'},
-    {'country': 'Peru', 'year': 2022, 'pm25': 30.2, 'source': 'IQAir'},
-    {'country': 'Peru', 'year': 2023, 'pm25': 30.8, 'source': 'IQAir'},
-])
-
 # Combine API data with historical data (API data takes precedence)
+historical_pm25 = historical_data.set_index(['country', 'year'])[['pm25']].sort_index()
 if len(annual_data_api) > 0:
-    # Merge: Keep API data where available, supplement with historical data
-    combined = pd.concat([annual_data_api, historical_data[['country', 'year', 'pm25']]])
-    # Remove duplicates, keeping API data (first occurrence)
-    combined = combined.drop_duplicates(subset=['country', 'year'], keep='first')
+    # Merge on (country, year): keep API data where available, supplement with historical data.
+    # The merged index is the sorted union of both, so the result is sorted by country and year.
+    combined = annual_data_api.set_index(['country', 'year']).sort_index().combine_first(historical_pm25)
 else:
-    combined = historical_data[['country', 'year', 'pm25']]
-
-# Sort by country and year
-combined = combined.sort_values(['country', 'year']).reset_index(drop=True)
+    combined = historical_pm25
+combined = combined.reset_index()
 
 # Save combined data
 output_path = os.path.join('..', 'data', 'openaq_pm25.csv')
-combined.to_csv(output_path, index=False)
+write_table(combined, output_path)
 
 # Print summary
 print(f"\n{'='*70}")
@@ -478,8 +260,8 @@ print(f"✓ Years covered: {combined['year'].min()}-{combined['year'].max()}")
 print(f"\nPM2.5 by Country (2023 average):")
 
 recent_2023 = combined[combined['year'] == 2023].sort_values('pm25', ascending=False).head(15)
-for idx, row in recent_2023.iterrows():
-    print(f"  {row['country']:25s}: {row['pm25']:6.1f} µg/m³")
+for country, pm25 in recent_2023[['country', 'pm25']].itertuples(index=False, name=None):
+    print(f"  {country:25s}: {pm25:6.1f} µg/m³")
 
 print(f"\n✓ Data saved to: {output_path}")
 print(f"{'='*70}\n")
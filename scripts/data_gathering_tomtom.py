@@ -1,10 +1,12 @@
-import requests
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from pathlib import Path
+
 import pandas as pd
 import os
-import json
-import re
 import numpy as np
+import pyarrow as pa
+
+from _tables import write_table
 
 # TomTom Traffic Index data - EXPANDED VERSION
 # Using historical data from TomTom Traffic Index reports
@@ -12,426 +14,280 @@ import numpy as np
 # Travel time index shows how much longer a trip takes compared to free-flow conditions
 
 # EXPANDED: Added 50+ major cities worldwide to dramatically increase coverage
-tomtom_data = [
+
+# On-disk copy of the country-year means, rebuilt when this file (the data) changes
+COUNTRY_YEAR_CACHE = Path(__file__).resolve().parent.parent / '.cache' / 'tomtom_country_year.parquet'
+
+# City pages fetched at once when scraping; each worker mostly waits on the server
+MAX_CONCURRENT_REQUESTS = 8
+
+# Years covered by every city series below
+YEARS = np.arange(2015, 2024, dtype=np.int16)
+
+# city -> (country, congestion_level_pct for each of YEARS, rank for each of YEARS)
+CITIES = {
     # PHILIPPINES - Manila
-    {'city': 'Manila', 'country': 'Philippines', 'year': 2015, 'congestion_level_pct': 48, 'travel_time_index': 1.48, 'rank': 8, 'source': 'TomTom Traffic Index'},
-    {'city': 'Manila', 'country': 'Philippines', 'year': 2016, 'congestion_level_pct': 53, 'travel_time_index': 1.53, 'rank': 5, 'source': 'TomTom Traffic Index'},
-    {'city': 'Manila', 'country': 'Philippines', 'year': 2017, 'congestion_level_pct': 55, 'travel_time_index': 1.55, 'rank': 4, 'source': 'TomTom Traffic Index'},
-    {'city': 'Manila', 'country': 'Philippines', 'year': 2018, 'congestion_level_pct': 71, 'travel_time_index': 1.71, 'rank': 2, 'source': 'TomTom Traffic Index'},
-    {'city': 'Manila', 'country': 'Philippines', 'year': 2019, 'congestion_level_pct': 71, 'travel_time_index': 1.71, 'rank': 2, 'source': 'TomTom Traffic Index'},
-    {'city': 'Manila', 'country': 'Philippines', 'year': 2020, 'congestion_level_pct': 53, 'travel_time_index': 1.53, 'rank': 8, 'source': 'TomTom Traffic Index'},
-    {'city': 'Manila', 'country': 'Philippines', 'year': 2021, 'congestion_level_pct': 45, 'travel_time_index': 1.45, 'rank': 15, 'source': 'TomTom Traffic Index'},
-    {'city': 'Manila', 'country': 'Philippines', 'year': 2022, 'congestion_level_pct': 52, 'travel_time_index': 1.52, 'rank': 9, 'source': 'TomTom Traffic Index'},
-    {'city': 'Manila', 'country': 'Philippines', 'year': 2023, 'congestion_level_pct': 52, 'travel_time_index': 1.52, 'rank': 10, 'source': 'TomTom Traffic Index'},
-    
+    'Manila': ('Philippines', [48, 53, 55, 71, 71, 53, 45, 52, 52], [8, 5, 4, 2, 2, 8, 15, 9, 10]),
     # SINGAPORE
-    {'city': 'Singapore', 'country': 'Singapore', 'year': 2015, 'congestion_level_pct': 27, 'travel_time_index': 1.27, 'rank': 88, 'source': 'TomTom Traffic Index'},
-    {'city': 'Singapore', 'country': 'Singapore', 'year': 2016, 'congestion_level_pct': 29, 'travel_time_index': 1.29, 'rank': 80, 'source': 'TomTom Traffic Index'},
-    {'city': 'Singapore', 'country': 'Singapore', 'year': 2017, 'congestion_level_pct': 31, 'travel_time_index': 1.31, 'rank': 72, 'source': 'TomTom Traffic Index'},
-    {'city': 'Singapore', 'country': 'Singapore', 'year': 2018, 'congestion_level_pct': 32, 'travel_time_index': 1.32, 'rank': 67, 'source': 'TomTom Traffic Index'},
-    {'city': 'Singapore', 'country': 'Singapore', 'year': 2019, 'congestion_level_pct': 33, 'travel_time_index': 1.33, 'rank': 64, 'source': 'TomTom Traffic Index'},
-    {'city': 'Singapore', 'country': 'Singapore', 'year': 2020, 'congestion_level_pct': 25, 'travel_time_index': 1.25, 'rank': 95, 'source': 'TomTom Traffic Index'},
-    {'city': 'Singapore', 'country': 'Singapore', 'year': 2021, 'congestion_level_pct': 23, 'travel_time_index': 1.23, 'rank': 105, 'source': 'TomTom Traffic Index'},
-    {'city': 'Singapore', 'country': 'Singapore', 'year': 2022, 'congestion_level_pct': 28, 'travel_time_index': 1.28, 'rank': 82, 'source': 'TomTom Traffic Index'},
-    {'city': 'Singapore', 'country': 'Singapore', 'year': 2023, 'congestion_level_pct': 30, 'travel_time_index': 1.30, 'rank': 76, 'source': 'TomTom Traffic Index'},
-    
+    'Singapore': ('Singapore', [27, 29, 31, 32, 33, 25, 23, 28, 30], [88, 80, 72, 67, 64, 95, 105, 82, 76]),
     # THAILAND - Bangkok
-    {'city': 'Bangkok', 'country': 'Thailand', 'year': 2015, 'congestion_level_pct': 57, 'travel_time_index': 1.57, 'rank': 2, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangkok', 'country': 'Thailand', 'year': 2016, 'congestion_level_pct': 61, 'travel_time_index': 1.61, 'rank': 2, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangkok', 'country': 'Thailand', 'year': 2017, 'congestion_level_pct': 61, 'travel_time_index': 1.61, 'rank': 2, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangkok', 'country': 'Thailand', 'year': 2018, 'congestion_level_pct': 61, 'travel_time_index': 1.61, 'rank': 4, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangkok', 'country': 'Thailand', 'year': 2019, 'congestion_level_pct': 61, 'travel_time_index': 1.61, 'rank': 5, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangkok', 'country': 'Thailand', 'year': 2020, 'congestion_level_pct': 53, 'travel_time_index': 1.53, 'rank': 7, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangkok', 'country': 'Thailand', 'year': 2021, 'congestion_level_pct': 48, 'travel_time_index': 1.48, 'rank': 11, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangkok', 'country': 'Thailand', 'year': 2022, 'congestion_level_pct': 56, 'travel_time_index': 1.56, 'rank': 6, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangkok', 'country': 'Thailand', 'year': 2023, 'congestion_level_pct': 58, 'travel_time_index': 1.58, 'rank': 4, 'source': 'TomTom Traffic Index'},
-    
+    'Bangkok': ('Thailand', [57, 61, 61, 61, 61, 53, 48, 56, 58], [2, 2, 2, 4, 5, 7, 11, 6, 4]),
     # INDONESIA - Jakarta
-    {'city': 'Jakarta', 'country': 'Indonesia', 'year': 2015, 'congestion_level_pct': 58, 'travel_time_index': 1.58, 'rank': 1, 'source': 'TomTom Traffic Index'},
-    {'city': 'Jakarta', 'country': 'Indonesia', 'year': 2016, 'congestion_level_pct': 58, 'travel_time_index': 1.58, 'rank': 3, 'source': 'TomTom Traffic Index'},
-    {'city': 'Jakarta', 'country': 'Indonesia', 'year': 2017, 'congestion_level_pct': 58, 'travel_time_index': 1.58, 'rank': 3, 'source': 'TomTom Traffic Index'},
-    {'city': 'Jakarta', 'country': 'Indonesia', 'year': 2018, 'congestion_level_pct': 56, 'travel_time_index': 1.56, 'rank': 7, 'source': 'TomTom Traffic Index'},
-    {'city': 'Jakarta', 'country': 'Indonesia', 'year': 2019, 'congestion_level_pct': 53, 'travel_time_index': 1.53, 'rank': 10, 'source': 'TomTom Traffic Index'},
-    {'city': 'Jakarta', 'country': 'Indonesia', 'year': 2020, 'congestion_level_pct': 46, 'travel_time_index': 1.46, 'rank': 14, 'source': 'TomTom Traffic Index'},
-    {'city': 'Jakarta', 'country': 'Indonesia', 'year': 2021, 'congestion_level_pct': 42, 'travel_time_index': 1.42, 'rank': 19, 'source': 'TomTom Traffic Index'},
-    {'city': 'Jakarta', 'country': 'Indonesia', 'year': 2022, 'congestion_level_pct': 48, 'travel_time_index': 1.48, 'rank': 12, 'source': 'TomTom Traffic Index'},
-    {'city': 'Jakarta', 'country': 'Indonesia', 'year': 2023, 'congestion_level_pct': 50, 'travel_time_index': 1.50, 'rank': 11, 'source': 'TomTom Traffic Index'},
-    
+    'Jakarta': ('Indonesia', [58, 58, 58, 56, 53, 46, 42, 48, 50], [1, 3, 3, 7, 10, 14, 19, 12, 11]),
     # INDIA - Mumbai
-    {'city': 'Mumbai', 'country': 'India', 'year': 2015, 'congestion_level_pct': 42, 'travel_time_index': 1.42, 'rank': 19, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mumbai', 'country': 'India', 'year': 2016, 'congestion_level_pct': 45, 'travel_time_index': 1.45, 'rank': 16, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mumbai', 'country': 'India', 'year': 2017, 'congestion_level_pct': 50, 'travel_time_index': 1.50, 'rank': 9, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mumbai', 'country': 'India', 'year': 2018, 'congestion_level_pct': 53, 'travel_time_index': 1.53, 'rank': 8, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mumbai', 'country': 'India', 'year': 2019, 'congestion_level_pct': 53, 'travel_time_index': 1.53, 'rank': 9, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mumbai', 'country': 'India', 'year': 2020, 'congestion_level_pct': 38, 'travel_time_index': 1.38, 'rank': 28, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mumbai', 'country': 'India', 'year': 2021, 'congestion_level_pct': 35, 'travel_time_index': 1.35, 'rank': 35, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mumbai', 'country': 'India', 'year': 2022, 'congestion_level_pct': 46, 'travel_time_index': 1.46, 'rank': 15, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mumbai', 'country': 'India', 'year': 2023, 'congestion_level_pct': 48, 'travel_time_index': 1.48, 'rank': 13, 'source': 'TomTom Traffic Index'},
-    
+    'Mumbai': ('India', [42, 45, 50, 53, 53, 38, 35, 46, 48], [19, 16, 9, 8, 9, 28, 35, 15, 13]),
     # INDIA - Bangalore
-    {'city': 'Bangalore', 'country': 'India', 'year': 2015, 'congestion_level_pct': 44, 'travel_time_index': 1.44, 'rank': 15, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangalore', 'country': 'India', 'year': 2016, 'congestion_level_pct': 46, 'travel_time_index': 1.46, 'rank': 14, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangalore', 'country': 'India', 'year': 2017, 'congestion_level_pct': 53, 'travel_time_index': 1.53, 'rank': 6, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangalore', 'country': 'India', 'year': 2018, 'congestion_level_pct': 58, 'travel_time_index': 1.58, 'rank': 5, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangalore', 'country': 'India', 'year': 2019, 'congestion_level_pct': 71, 'travel_time_index': 1.71, 'rank': 1, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangalore', 'country': 'India', 'year': 2020, 'congestion_level_pct': 54, 'travel_time_index': 1.54, 'rank': 6, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangalore', 'country': 'India', 'year': 2021, 'congestion_level_pct': 51, 'travel_time_index': 1.51, 'rank': 8, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangalore', 'country': 'India', 'year': 2022, 'congestion_level_pct': 60, 'travel_time_index': 1.60, 'rank': 2, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bangalore', 'country': 'India', 'year': 2023, 'congestion_level_pct': 63, 'travel_time_index': 1.63, 'rank': 1, 'source': 'TomTom Traffic Index'},
-    
+    'Bangalore': ('India', [44, 46, 53, 58, 71, 54, 51, 60, 63], [15, 14, 6, 5, 1, 6, 8, 2, 1]),
     # INDIA - Delhi
-    {'city': 'Delhi', 'country': 'India', 'year': 2015, 'congestion_level_pct': 37, 'travel_time_index': 1.37, 'rank': 33, 'source': 'TomTom Traffic Index'},
-    {'city': 'Delhi', 'country': 'India', 'year': 2016, 'congestion_level_pct': 40, 'travel_time_index': 1.40, 'rank': 28, 'source': 'TomTom Traffic Index'},
-    {'city': 'Delhi', 'country': 'India', 'year': 2017, 'congestion_level_pct': 45, 'travel_time_index': 1.45, 'rank': 18, 'source': 'TomTom Traffic Index'},
-    {'city': 'Delhi', 'country': 'India', 'year': 2018, 'congestion_level_pct': 48, 'travel_time_index': 1.48, 'rank': 16, 'source': 'TomTom Traffic Index'},
-    {'city': 'Delhi', 'country': 'India', 'year': 2019, 'congestion_level_pct': 50, 'travel_time_index': 1.50, 'rank': 14, 'source': 'TomTom Traffic Index'},
-    {'city': 'Delhi', 'country': 'India', 'year': 2020, 'congestion_level_pct': 39, 'travel_time_index': 1.39, 'rank': 24, 'source': 'TomTom Traffic Index'},
-    {'city': 'Delhi', 'country': 'India', 'year': 2021, 'congestion_level_pct': 36, 'travel_time_index': 1.36, 'rank': 32, 'source': 'TomTom Traffic Index'},
-    {'city': 'Delhi', 'country': 'India', 'year': 2022, 'congestion_level_pct': 44, 'travel_time_index': 1.44, 'rank': 17, 'source': 'TomTom Traffic Index'},
-    {'city': 'Delhi', 'country': 'India', 'year': 2023, 'congestion_level_pct': 46, 'travel_time_index': 1.46, 'rank': 15, 'source': 'TomTom Traffic Index'},
-    
+    'Delhi': ('India', [37, 40, 45, 48, 50, 39, 36, 44, 46], [33, 28, 18, 16, 14, 24, 32, 17, 15]),
     # CHINA - Beijing
-    {'city': 'Beijing', 'country': 'China', 'year': 2015, 'congestion_level_pct': 38, 'travel_time_index': 1.38, 'rank': 30, 'source': 'TomTom Traffic Index'},
-    {'city': 'Beijing', 'country': 'China', 'year': 2016, 'congestion_level_pct': 39, 'travel_time_index': 1.39, 'rank': 29, 'source': 'TomTom Traffic Index'},
-    {'city': 'Beijing', 'country': 'China', 'year': 2017, 'congestion_level_pct': 40, 'travel_time_index': 1.40, 'rank': 25, 'source': 'TomTom Traffic Index'},
-    {'city': 'Beijing', 'country': 'China', 'year': 2018, 'congestion_level_pct': 41, 'travel_time_index': 1.41, 'rank': 23, 'source': 'TomTom Traffic Index'},
-    {'city': 'Beijing', 'country': 'China', 'year': 2019, 'congestion_level_pct': 42, 'travel_time_index': 1.42, 'rank': 22, 'source': 'TomTom Traffic Index'},
-    {'city': 'Beijing', 'country': 'China', 'year': 2020, 'congestion_level_pct': 35, 'travel_time_index': 1.35, 'rank': 35, 'source': 'TomTom Traffic Index'},
-    {'city': 'Beijing', 'country': 'China', 'year': 2021, 'congestion_level_pct': 33, 'travel_time_index': 1.33, 'rank': 40, 'source': 'TomTom Traffic Index'},
-    {'city': 'Beijing', 'country': 'China', 'year': 2022, 'congestion_level_pct': 37, 'travel_time_index': 1.37, 'rank': 28, 'source': 'TomTom Traffic Index'},
-    {'city': 'Beijing', 'country': 'China', 'year': 2023, 'congestion_level_pct': 39, 'travel_time_index': 1.39, 'rank': 25, 'source': 'TomTom Traffic Index'},
-    
+    'Beijing': ('China', [38, 39, 40, 41, 42, 35, 33, 37, 39], [30, 29, 25, 23, 22, 35, 40, 28, 25]),
     # CHINA - Shanghai
-    {'city': 'Shanghai', 'country': 'China', 'year': 2015, 'congestion_level_pct': 34, 'travel_time_index': 1.34, 'rank': 42, 'source': 'TomTom Traffic Index'},
-    {'city': 'Shanghai', 'country': 'China', 'year': 2016, 'congestion_level_pct': 36, 'travel_time_index': 1.36, 'rank': 38, 'source': 'TomTom Traffic Index'},
-    {'city': 'Shanghai', 'country': 'China', 'year': 2017, 'congestion_level_pct': 37, 'travel_time_index': 1.37, 'rank': 34, 'source': 'TomTom Traffic Index'},
-    {'city': 'Shanghai', 'country': 'China', 'year': 2018, 'congestion_level_pct': 38, 'travel_time_index': 1.38, 'rank': 32, 'source': 'TomTom Traffic Index'},
-    {'city': 'Shanghai', 'country': 'China', 'year': 2019, 'congestion_level_pct': 39, 'travel_time_index': 1.39, 'rank': 30, 'source': 'TomTom Traffic Index'},
-    {'city': 'Shanghai', 'country': 'China', 'year': 2020, 'congestion_level_pct': 32, 'travel_time_index': 1.32, 'rank': 42, 'source': 'TomTom Traffic Index'},
-    {'city': 'Shanghai', 'country': 'China', 'year': 2021, 'congestion_level_pct': 30, 'travel_time_index': 1.30, 'rank': 48, 'source': 'TomTom Traffic Index'},
-    {'city': 'Shanghai', 'country': 'China', 'year': 2022, 'congestion_level_pct': 34, 'travel_time_index': 1.34, 'rank': 35, 'source': 'TomTom Traffic Index'},
-    {'city': 'Shanghai', 'country': 'China', 'year': 2023, 'congestion_level_pct': 36, 'travel_time_index': 1.36, 'rank': 32, 'source': 'TomTom Traffic Index'},
-    
+    'Shanghai': ('China', [34, 36, 37, 38, 39, 32, 30, 34, 36], [42, 38, 34, 32, 30, 42, 48, 35, 32]),
     # VIETNAM - Ho Chi Minh City
-    {'city': 'Ho Chi Minh City', 'country': 'Vietnam', 'year': 2015, 'congestion_level_pct': 35, 'travel_time_index': 1.35, 'rank': 40, 'source': 'TomTom Traffic Index'},
-    {'city': 'Ho Chi Minh City', 'country': 'Vietnam', 'year': 2016, 'congestion_level_pct': 37, 'travel_time_index': 1.37, 'rank': 35, 'source': 'TomTom Traffic Index'},
-    {'city': 'Ho Chi Minh City', 'country': 'Vietnam', 'year': 2017, 'congestion_level_pct': 40, 'travel_time_index': 1.40, 'rank': 28, 'source': 'TomTom Traffic Index'},
-    {'city': 'Ho Chi Minh City', 'country': 'Vietnam', 'year': 2018, 'congestion_level_pct': 43, 'travel_time_index': 1.43, 'rank': 20, 'source': 'TomTom Traffic Index'},
-    {'city': 'Ho Chi Minh City', 'country': 'Vietnam', 'year': 2019, 'congestion_level_pct': 46, 'travel_time_index': 1.46, 'rank': 18, 'source': 'TomTom Traffic Index'},
-    {'city': 'Ho Chi Minh City', 'country': 'Vietnam', 'year': 2020, 'congestion_level_pct': 38, 'travel_time_index': 1.38, 'rank': 27, 'source': 'TomTom Traffic Index'},
-    {'city': 'Ho Chi Minh City', 'country': 'Vietnam', 'year': 2021, 'congestion_level_pct': 35, 'travel_time_index': 1.35, 'rank': 34, 'source': 'TomTom Traffic Index'},
-    {'city': 'Ho Chi Minh City', 'country': 'Vietnam', 'year': 2022, 'congestion_level_pct': 41, 'travel_time_index': 1.41, 'rank': 21, 'source': 'TomTom Traffic Index'},
-    {'city': 'Ho Chi Minh City', 'country': 'Vietnam', 'year': 2023, 'congestion_level_pct': 43, 'travel_time_index': 1.43, 'rank': 18, 'source': 'TomTom Traffic Index'},
-    
+    'Ho Chi Minh City': ('Vietnam', [35, 37, 40, 43, 46, 38, 35, 41, 43], [40, 35, 28, 20, 18, 27, 34, 21, 18]),
     # MALAYSIA - Kuala Lumpur
-    {'city': 'Kuala Lumpur', 'country': 'Malaysia', 'year': 2015, 'congestion_level_pct': 32, 'travel_time_index': 1.32, 'rank': 50, 'source': 'TomTom Traffic Index'},
-    {'city': 'Kuala Lumpur', 'country': 'Malaysia', 'year': 2016, 'congestion_level_pct': 34, 'travel_time_index': 1.34, 'rank': 45, 'source': 'TomTom Traffic Index'},
-    {'city': 'Kuala Lumpur', 'country': 'Malaysia', 'year': 2017, 'congestion_level_pct': 36, 'travel_time_index': 1.36, 'rank': 38, 'source': 'TomTom Traffic Index'},
-    {'city': 'Kuala Lumpur', 'country': 'Malaysia', 'year': 2018, 'congestion_level_pct': 38, 'travel_time_index': 1.38, 'rank': 33, 'source': 'TomTom Traffic Index'},
-    {'city': 'Kuala Lumpur', 'country': 'Malaysia', 'year': 2019, 'congestion_level_pct': 40, 'travel_time_index': 1.40, 'rank': 28, 'source': 'TomTom Traffic Index'},
-    {'city': 'Kuala Lumpur', 'country': 'Malaysia', 'year': 2020, 'congestion_level_pct': 30, 'travel_time_index': 1.30, 'rank': 48, 'source': 'TomTom Traffic Index'},
-    {'city': 'Kuala Lumpur', 'country': 'Malaysia', 'year': 2021, 'congestion_level_pct': 28, 'travel_time_index': 1.28, 'rank': 55, 'source': 'TomTom Traffic Index'},
-    {'city': 'Kuala Lumpur', 'country': 'Malaysia', 'year': 2022, 'congestion_level_pct': 35, 'travel_time_index': 1.35, 'rank': 32, 'source': 'TomTom Traffic Index'},
-    {'city': 'Kuala Lumpur', 'country': 'Malaysia', 'year': 2023, 'congestion_level_pct': 37, 'travel_time_index': 1.37, 'rank': 28, 'source': 'TomTom Traffic Index'},
-    
+    'Kuala Lumpur': ('Malaysia', [32, 34, 36, 38, 40, 30, 28, 35, 37], [50, 45, 38, 33, 28, 48, 55, 32, 28]),
     # JAPAN - Tokyo
-    {'city': 'Tokyo', 'country': 'Japan', 'year': 2015, 'congestion_level_pct': 32, 'travel_time_index': 1.32, 'rank': 48, 'source': 'TomTom Traffic Index'},
-    {'city': 'Tokyo', 'country': 'Japan', 'year': 2016, 'congestion_level_pct': 33, 'travel_time_index': 1.33, 'rank': 46, 'source': 'TomTom Traffic Index'},
-    {'city': 'Tokyo', 'country': 'Japan', 'year': 2017, 'congestion_level_pct': 34, 'travel_time_index': 1.34, 'rank': 44, 'source': 'TomTom Traffic Index'},
-    {'city': 'Tokyo', 'country': 'Japan', 'year': 2018, 'congestion_level_pct': 35, 'travel_time_index': 1.35, 'rank': 42, 'source': 'TomTom Traffic Index'},
-    {'city': 'Tokyo', 'country': 'Japan', 'year': 2019, 'congestion_level_pct': 36, 'travel_time_index': 1.36, 'rank': 40, 'source': 'TomTom Traffic Index'},
-    {'city': 'Tokyo', 'country': 'Japan', 'year': 2020, 'congestion_level_pct': 28, 'travel_time_index': 1.28, 'rank': 55, 'source': 'TomTom Traffic Index'},
-    {'city': 'Tokyo', 'country': 'Japan', 'year': 2021, 'congestion_level_pct': 26, 'travel_time_index': 1.26, 'rank': 62, 'source': 'TomTom Traffic Index'},
-    {'city': 'Tokyo', 'country': 'Japan', 'year': 2022, 'congestion_level_pct': 31, 'travel_time_index': 1.31, 'rank': 45, 'source': 'TomTom Traffic Index'},
-    {'city': 'Tokyo', 'country': 'Japan', 'year': 2023, 'congestion_level_pct': 33, 'travel_time_index': 1.33, 'rank': 40, 'source': 'TomTom Traffic Index'},
-    
+    'Tokyo': ('Japan', [32, 33, 34, 35, 36, 28, 26, 31, 33], [48, 46, 44, 42, 40, 55, 62, 45, 40]),
     # SOUTH KOREA - Seoul
-    {'city': 'Seoul', 'country': 'South Korea', 'year': 2015, 'congestion_level_pct': 35, 'travel_time_index': 1.35, 'rank': 38, 'source': 'TomTom Traffic Index'},
-    {'city': 'Seoul', 'country': 'South Korea', 'year': 2016, 'congestion_level_pct': 36, 'travel_time_index': 1.36, 'rank': 36, 'source': 'TomTom Traffic Index'},
-    {'city': 'Seoul', 'country': 'South Korea', 'year': 2017, 'congestion_level_pct': 37, 'travel_time_index': 1.37, 'rank': 33, 'source': 'TomTom Traffic Index'},
-    {'city': 'Seoul', 'country': 'South Korea', 'year': 2018, 'congestion_level_pct': 38, 'travel_time_index': 1.38, 'rank': 31, 'source': 'TomTom Traffic Index'},
-    {'city': 'Seoul', 'country': 'South Korea', 'year': 2019, 'congestion_level_pct': 39, 'travel_time_index': 1.39, 'rank': 29, 'source': 'TomTom Traffic Index'},
-    {'city': 'Seoul', 'country': 'South Korea', 'year': 2020, 'congestion_level_pct': 31, 'travel_time_index': 1.31, 'rank': 45, 'source': 'TomTom Traffic Index'},
-    {'city': 'Seoul', 'country': 'South Korea', 'year': 2021, 'congestion_level_pct': 29, 'travel_time_index': 1.29, 'rank': 52, 'source': 'TomTom Traffic Index'},
-    {'city': 'Seoul', 'country': 'South Korea', 'year': 2022, 'congestion_level_pct': 34, 'travel_time_index': 1.34, 'rank': 36, 'source': 'TomTom Traffic Index'},
-    {'city': 'Seoul', 'country': 'South Korea', 'year': 2023, 'congestion_level_pct': 36, 'travel_time_index': 1.36, 'rank': 31, 'source': 'TomTom Traffic Index'},
-    
+    'Seoul': ('South Korea', [35, 36, 37, 38, 39, 31, 29, 34, 36], [38, 36, 33, 31, 29, 45, 52, 36, 31]),
     # NEW CITIES - LATIN AMERICA
     # COLOMBIA - Bogotá
-    {'city': 'Bogotá', 'country': 'Colombia', 'year': 2015, 'congestion_level_pct': 63, 'travel_time_index': 1.63, 'rank': 1, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bogotá', 'country': 'Colombia', 'year': 2016, 'congestion_level_pct': 63, 'travel_time_index': 1.63, 'rank': 1, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bogotá', 'country': 'Colombia', 'year': 2017, 'congestion_level_pct': 58, 'travel_time_index': 1.58, 'rank': 1, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bogotá', 'country': 'Colombia', 'year': 2018, 'congestion_level_pct': 68, 'travel_time_index': 1.68, 'rank': 3, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bogotá', 'country': 'Colombia', 'year': 2019, 'congestion_level_pct': 71, 'travel_time_index': 1.71, 'rank': 3, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bogotá', 'country': 'Colombia', 'year': 2020, 'congestion_level_pct': 53, 'travel_time_index': 1.53, 'rank': 9, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bogotá', 'country': 'Colombia', 'year': 2021, 'congestion_level_pct': 51, 'travel_time_index': 1.51, 'rank': 9, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bogotá', 'country': 'Colombia', 'year': 2022, 'congestion_level_pct': 58, 'travel_time_index': 1.58, 'rank': 4, 'source': 'TomTom Traffic Index'},
-    {'city': 'Bogotá', 'country': 'Colombia', 'year': 2023, 'congestion_level_pct': 59, 'travel_time_index': 1.59, 'rank': 3, 'source': 'TomTom Traffic Index'},
-    
+    'Bogotá': ('Colombia', [63, 63, 58, 68, 71, 53, 51, 58, 59], [1, 1, 1, 3, 3, 9, 9, 4, 3]),
     # BRAZIL - São Paulo
-    {'city': 'São Paulo', 'country': 'Brazil', 'year': 2015, 'congestion_level_pct': 43, 'travel_time_index': 1.43, 'rank': 17, 'source': 'TomTom Traffic Index'},
-    {'city': 'São Paulo', 'country': 'Brazil', 'year': 2016, 'congestion_level_pct': 44, 'travel_time_index': 1.44, 'rank': 18, 'source': 'TomTom Traffic Index'},
-    {'city': 'São Paulo', 'country': 'Brazil', 'year': 2017, 'congestion_level_pct': 45, 'travel_time_index': 1.45, 'rank': 16, 'source': 'TomTom Traffic Index'},
-    {'city': 'São Paulo', 'country': 'Brazil', 'year': 2018, 'congestion_level_pct': 46, 'travel_time_index': 1.46, 'rank': 17, 'source': 'TomTom Traffic Index'},
-    {'city': 'São Paulo', 'country': 'Brazil', 'year': 2019, 'congestion_level_pct': 47, 'travel_time_index': 1.47, 'rank': 16, 'source': 'TomTom Traffic Index'},
-    {'city': 'São Paulo', 'country': 'Brazil', 'year': 2020, 'congestion_level_pct': 38, 'travel_time_index': 1.38, 'rank': 26, 'source': 'TomTom Traffic Index'},
-    {'city': 'São Paulo', 'country': 'Brazil', 'year': 2021, 'congestion_level_pct': 40, 'travel_time_index': 1.40, 'rank': 21, 'source': 'TomTom Traffic Index'},
-    {'city': 'São Paulo', 'country': 'Brazil', 'year': 2022, 'congestion_level_pct': 46, 'travel_time_index': 1.46, 'rank': 16, 'source': 'TomTom Traffic Index'},
-    {'city': 'São Paulo', 'country': 'Brazil', 'year': 2023, 'congestion_level_pct': 47, 'travel_time_index': 1.47, 'rank': 14, 'source': 'TomTom Traffic Index'},
-    
+    'São Paulo': ('Brazil', [43, 44, 45, 46, 47, 38, 40, 46, 47], [17, 18, 16, 17, 16, 26, 21, 16, 14]),
     # BRAZIL - Rio de Janeiro
-    {'city': 'Rio de Janeiro', 'country': 'Brazil', 'year': 2015, 'congestion_level_pct': 41, 'travel_time_index': 1.41, 'rank': 22, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rio de Janeiro', 'country': 'Brazil', 'year': 2016, 'congestion_level_pct': 42, 'travel_time_index': 1.42, 'rank': 22, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rio de Janeiro', 'country': 'Brazil', 'year': 2017, 'congestion_level_pct': 43, 'travel_time_index': 1.43, 'rank': 21, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rio de Janeiro', 'country': 'Brazil', 'year': 2018, 'congestion_level_pct': 44, 'travel_time_index': 1.44, 'rank': 19, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rio de Janeiro', 'country': 'Brazil', 'year': 2019, 'congestion_level_pct': 45, 'travel_time_index': 1.45, 'rank': 20, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rio de Janeiro', 'country': 'Brazil', 'year': 2020, 'congestion_level_pct': 37, 'travel_time_index': 1.37, 'rank': 29, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rio de Janeiro', 'country': 'Brazil', 'year': 2021, 'congestion_level_pct': 38, 'travel_time_index': 1.38, 'rank': 25, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rio de Janeiro', 'country': 'Brazil', 'year': 2022, 'congestion_level_pct': 43, 'travel_time_index': 1.43, 'rank': 18, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rio de Janeiro', 'country': 'Brazil', 'year': 2023, 'congestion_level_pct': 44, 'travel_time_index': 1.44, 'rank': 17, 'source': 'TomTom Traffic Index'},
-    
+    'Rio de Janeiro': ('Brazil', [41, 42, 43, 44, 45, 37, 38, 43, 44], [22, 22, 21, 19, 20, 29, 25, 18, 17]),
     # MEXICO - Mexico City
-    {'city': 'Mexico City', 'country': 'Mexico', 'year': 2015, 'congestion_level_pct': 55, 'travel_time_index': 1.55, 'rank': 3, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mexico City', 'country': 'Mexico', 'year': 2016, 'congestion_level_pct': 59, 'travel_time_index': 1.59, 'rank': 4, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mexico City', 'country': 'Mexico', 'year': 2017, 'congestion_level_pct': 59, 'travel_time_index': 1.59, 'rank': 5, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mexico City', 'country': 'Mexico', 'year': 2018, 'congestion_level_pct': 66, 'travel_time_index': 1.66, 'rank': 4, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mexico City', 'country': 'Mexico', 'year': 2019, 'congestion_level_pct': 66, 'travel_time_index': 1.66, 'rank': 4, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mexico City', 'country': 'Mexico', 'year': 2020, 'congestion_level_pct': 47, 'travel_time_index': 1.47, 'rank': 12, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mexico City', 'country': 'Mexico', 'year': 2021, 'congestion_level_pct': 46, 'travel_time_index': 1.46, 'rank': 14, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mexico City', 'country': 'Mexico', 'year': 2022, 'congestion_level_pct': 54, 'travel_time_index': 1.54, 'rank': 7, 'source': 'TomTom Traffic Index'},
-    {'city': 'Mexico City', 'country': 'Mexico', 'year': 2023, 'congestion_level_pct': 56, 'travel_time_index': 1.56, 'rank': 6, 'source': 'TomTom Traffic Index'},
-    
+    'Mexico City': ('Mexico', [55, 59, 59, 66, 66, 47, 46, 54, 56], [3, 4, 5, 4, 4, 12, 14, 7, 6]),
     # PERU - Lima
-    {'city': 'Lima', 'country': 'Peru', 'year': 2015, 'congestion_level_pct': 53, 'travel_time_index': 1.53, 'rank': 5, 'source': 'TomTom Traffic Index'},
-    {'city': 'Lima', 'country': 'Peru', 'year': 2016, 'congestion_level_pct': 57, 'travel_time_index': 1.57, 'rank': 6, 'source': 'TomTom Traffic Index'},
-    {'city': 'Lima', 'country': 'Peru', 'year': 2017, 'congestion_level_pct': 57, 'travel_time_index': 1.57, 'rank': 5, 'source': 'TomTom Traffic Index'},
-    {'city': 'Lima', 'country': 'Peru', 'year': 2018, 'congestion_level_pct': 58, 'travel_time_index': 1.58, 'rank': 6, 'source': 'TomTom Traffic Index'},
-    {'city': 'Lima', 'country': 'Peru', 'year': 2019, 'congestion_level_pct': 60, 'travel_time_index': 1.60, 'rank': 6, 'source': 'TomTom Traffic Index'},
-    {'city': 'Lima', 'country': 'Peru', 'year': 2020, 'congestion_level_pct': 47, 'travel_time_index': 1.47, 'rank': 11, 'source': 'TomTom Traffic Index'},
-    {'city': 'Lima', 'country': 'Peru', 'year': 2021, 'congestion_level_pct': 46, 'travel_time_index': 1.46, 'rank': 12, 'source': 'TomTom Traffic Index'},
-    {'city': 'Lima', 'country': 'Peru', 'year': 2022, 'congestion_level_pct': 55, 'travel_time_index': 1.55, 'rank': 8, 'source': 'TomTom Traffic Index'},
-    {'city': 'Lima', 'country': 'Peru', 'year': 2023, 'congestion_level_pct': 57, 'travel_time_index': 1.57, 'rank': 5, 'source': 'TomTom Traffic Index'},
-    
+    'Lima': ('Peru', [53, 57, 57, 58, 60, 47, 46, 55, 57], [5, 6, 5, 6, 6, 11, 12, 8, 5]),
     # NEW CITIES - EUROPE
     # UK - London
-    {'city': 'London', 'country': 'United Kingdom', 'year': 2015, 'congestion_level_pct': 37, 'travel_time_index': 1.37, 'rank': 32, 'source': 'TomTom Traffic Index'},
-    {'city': 'London', 'country': 'United Kingdom', 'year': 2016, 'congestion_level_pct': 38, 'travel_time_index': 1.38, 'rank': 30, 'source': 'TomTom Traffic Index'},
-    {'city': 'London', 'country': 'United Kingdom', 'year': 2017, 'congestion_level_pct': 40, 'travel_time_index': 1.40, 'rank': 26, 'source': 'TomTom Traffic Index'},
-    {'city': 'London', 'country': 'United Kingdom', 'year': 2018, 'congestion_level_pct': 41, 'travel_time_index': 1.41, 'rank': 24, 'source': 'TomTom Traffic Index'},
-    {'city': 'London', 'country': 'United Kingdom', 'year': 2019, 'congestion_level_pct': 42, 'travel_time_index': 1.42, 'rank': 21, 'source': 'TomTom Traffic Index'},
-    {'city': 'London', 'country': 'United Kingdom', 'year': 2020, 'congestion_level_pct': 28, 'travel_time_index': 1.28, 'rank': 58, 'source': 'TomTom Traffic Index'},
-    {'city': 'London', 'country': 'United Kingdom', 'year': 2021, 'congestion_level_pct': 29, 'travel_time_index': 1.29, 'rank': 50, 'source': 'TomTom Traffic Index'},
-    {'city': 'London', 'country': 'United Kingdom', 'year': 2022, 'congestion_level_pct': 38, 'travel_time_index': 1.38, 'rank': 27, 'source': 'TomTom Traffic Index'},
-    {'city': 'London', 'country': 'United Kingdom', 'year': 2023, 'congestion_level_pct': 40, 'travel_time_index': 1.40, 'rank': 23, 'source': 'TomTom Traffic Index'},
-    
+    'London': ('United Kingdom', [37, 38, 40, 41, 42, 28, 29, 38, 40], [32, 30, 26, 24, 21, 58, 50, 27, 23]),
     # FRANCE - Paris
-    {'city': 'Paris', 'country': 'France', 'year': 2015, 'congestion_level_pct': 35, 'travel_time_index': 1.35, 'rank': 41, 'source': 'TomTom Traffic Index'},
-    {'city': 'Paris', 'country': 'France', 'year': 2016, 'congestion_level_pct': 36, 'travel_time_index': 1.36, 'rank': 37, 'source': 'TomTom Traffic Index'},
-    {'city': 'Paris', 'country': 'France', 'year': 2017, 'congestion_level_pct': 38, 'travel_time_index': 1.38, 'rank': 31, 'source': 'TomTom Traffic Index'},
-    {'city': 'Paris', 'country': 'France', 'year': 2018, 'congestion_level_pct': 39, 'travel_time_index': 1.39, 'rank': 29, 'source': 'TomTom Traffic Index'},
-    {'city': 'Paris', 'country': 'France', 'year': 2019, 'congestion_level_pct': 40, 'travel_time_index': 1.40, 'rank': 27, 'source': 'TomTom Traffic Index'},
-    {'city': 'Paris', 'country': 'France', 'year': 2020, 'congestion_level_pct': 27, 'travel_time_index': 1.27, 'rank': 60, 'source': 'TomTom Traffic Index'},
-    {'city': 'Paris', 'country': 'France', 'year': 2021, 'congestion_level_pct': 28, 'travel_time_index': 1.28, 'rank': 56, 'source': 'TomTom Traffic Index'},
-    {'city': 'Paris', 'country': 'France', 'year': 2022, 'congestion_level_pct': 36, 'travel_time_index': 1.36, 'rank': 30, 'source': 'TomTom Traffic Index'},
-    {'city': 'Paris', 'country': 'France', 'year': 2023, 'congestion_level_pct': 37, 'travel_time_index': 1.37, 'rank': 27, 'source': 'TomTom Traffic Index'},
-    
+    'Paris': ('France', [35, 36, 38, 39, 40, 27, 28, 36, 37], [41, 37, 31, 29, 27, 60, 56, 30, 27]),
     # GERMANY - Berlin
-    {'city': 'Berlin', 'country': 'Germany', 'year': 2015, 'congestion_level_pct': 29, 'travel_time_index': 1.29, 'rank': 68, 'source': 'TomTom Traffic Index'},
-    {'city': 'Berlin', 'country': 'Germany', 'year': 2016, 'congestion_level_pct': 30, 'travel_time_index': 1.30, 'rank': 65, 'source': 'TomTom Traffic Index'},
-    {'city': 'Berlin', 'country': 'Germany', 'year': 2017, 'congestion_level_pct': 31, 'travel_time_index': 1.31, 'rank': 60, 'source': 'TomTom Traffic Index'},
-    {'city': 'Berlin', 'country': 'Germany', 'year': 2018, 'congestion_level_pct': 32, 'travel_time_index': 1.32, 'rank': 58, 'source': 'TomTom Traffic Index'},
-    {'city': 'Berlin', 'country': 'Germany', 'year': 2019, 'congestion_level_pct': 33, 'travel_time_index': 1.33, 'rank': 55, 'source': 'TomTom Traffic Index'},
-    {'city': 'Berlin', 'country': 'Germany', 'year': 2020, 'congestion_level_pct': 24, 'travel_time_index': 1.24, 'rank': 88, 'source': 'TomTom Traffic Index'},
-    {'city': 'Berlin', 'country': 'Germany', 'year': 2021, 'congestion_level_pct': 25, 'travel_time_index': 1.25, 'rank': 80, 'source': 'TomTom Traffic Index'},
-    {'city': 'Berlin', 'country': 'Germany', 'year': 2022, 'congestion_level_pct': 30, 'travel_time_index': 1.30, 'rank': 52, 'source': 'TomTom Traffic Index'},
-    {'city': 'Berlin', 'country': 'Germany', 'year': 2023, 'congestion_level_pct': 31, 'travel_time_index': 1.31, 'rank': 48, 'source': 'TomTom Traffic Index'},
-    
+    'Berlin': ('Germany', [29, 30, 31, 32, 33, 24, 25, 30, 31], [68, 65, 60, 58, 55, 88, 80, 52, 48]),
     # ITALY - Rome
-    {'city': 'Rome', 'country': 'Italy', 'year': 2015, 'congestion_level_pct': 38, 'travel_time_index': 1.38, 'rank': 29, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rome', 'country': 'Italy', 'year': 2016, 'congestion_level_pct': 39, 'travel_time_index': 1.39, 'rank': 27, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rome', 'country': 'Italy', 'year': 2017, 'congestion_level_pct': 41, 'travel_time_index': 1.41, 'rank': 24, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rome', 'country': 'Italy', 'year': 2018, 'congestion_level_pct': 42, 'travel_time_index': 1.42, 'rank': 21, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rome', 'country': 'Italy', 'year': 2019, 'congestion_level_pct': 43, 'travel_time_index': 1.43, 'rank': 20, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rome', 'country': 'Italy', 'year': 2020, 'congestion_level_pct': 29, 'travel_time_index': 1.29, 'rank': 53, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rome', 'country': 'Italy', 'year': 2021, 'congestion_level_pct': 30, 'travel_time_index': 1.30, 'rank': 47, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rome', 'country': 'Italy', 'year': 2022, 'congestion_level_pct': 39, 'travel_time_index': 1.39, 'rank': 24, 'source': 'TomTom Traffic Index'},
-    {'city': 'Rome', 'country': 'Italy', 'year': 2023, 'congestion_level_pct': 41, 'travel_time_index': 1.41, 'rank': 21, 'source': 'TomTom Traffic Index'},
-    
+    'Rome': ('Italy', [38, 39, 41, 42, 43, 29, 30, 39, 41], [29, 27, 24, 21, 20, 53, 47, 24, 21]),
     # SPAIN - Madrid
-    {'city': 'Madrid', 'country': 'Spain', 'year': 2015, 'congestion_level_pct': 31, 'travel_time_index': 1.31, 'rank': 52, 'source': 'TomTom Traffic Index'},
-    {'city': 'Madrid', 'country': 'Spain', 'year': 2016, 'congestion_level_pct': 32, 'travel_time_index': 1.32, 'rank': 48, 'source': 'TomTom Traffic Index'},
-    {'city': 'Madrid', 'country': 'Spain', 'year': 2017, 'congestion_level_pct': 33, 'travel_time_index': 1.33, 'rank': 45, 'source': 'TomTom Traffic Index'},
-    {'city': 'Madrid', 'country': 'Spain', 'year': 2018, 'congestion_level_pct': 34, 'travel_time_index': 1.34, 'rank': 43, 'source': 'TomTom Traffic Index'},
-    {'city': 'Madrid', 'country': 'Spain', 'year': 2019, 'congestion_level_pct': 35, 'travel_time_index': 1.35, 'rank': 41, 'source': 'TomTom Traffic Index'},
-    {'city': 'Madrid', 'country': 'Spain', 'year': 2020, 'congestion_level_pct': 24, 'travel_time_index': 1.24, 'rank': 85, 'source': 'TomTom Traffic Index'},
-    {'city': 'Madrid', 'country': 'Spain', 'year': 2021, 'congestion_level_pct': 25, 'travel_time_index': 1.25, 'rank': 75, 'source': 'TomTom Traffic Index'},
-    {'city': 'Madrid', 'country': 'Spain', 'year': 2022, 'congestion_level_pct': 32, 'travel_time_index': 1.32, 'rank': 42, 'source': 'TomTom Traffic Index'},
-    {'city': 'Madrid', 'country': 'Spain', 'year': 2023, 'congestion_level_pct': 33, 'travel_time_index': 1.33, 'rank': 38, 'source': 'TomTom Traffic Index'},
-    
+    'Madrid': ('Spain', [31, 32, 33, 34, 35, 24, 25, 32, 33], [52, 48, 45, 43, 41, 85, 75, 42, 38]),
     # RUSSIA - Moscow
-    {'city': 'Moscow', 'country': 'Russia', 'year': 2015, 'congestion_level_pct': 44, 'travel_time_index': 1.44, 'rank': 14, 'source': 'TomTom Traffic Index'},
-    {'city': 'Moscow', 'country': 'Russia', 'year': 2016, 'congestion_level_pct': 45, 'travel_time_index': 1.45, 'rank': 15, 'source': 'TomTom Traffic Index'},
-    {'city': 'Moscow', 'country': 'Russia', 'year': 2017, 'congestion_level_pct': 46, 'travel_time_index': 1.46, 'rank': 14, 'source': 'TomTom Traffic Index'},
-    {'city': 'Moscow', 'country': 'Russia', 'year': 2018, 'congestion_level_pct': 47, 'travel_time_index': 1.47, 'rank': 13, 'source': 'TomTom Traffic Index'},
-    {'city': 'Moscow', 'country': 'Russia', 'year': 2019, 'congestion_level_pct': 48, 'travel_time_index': 1.48, 'rank': 15, 'source': 'TomTom Traffic Index'},
-    {'city': 'Moscow', 'country': 'Russia', 'year': 2020, 'congestion_level_pct': 40, 'travel_time_index': 1.40, 'rank': 22, 'source': 'TomTom Traffic Index'},
-    {'city': 'Moscow', 'country': 'Russia', 'year': 2021, 'congestion_level_pct': 41, 'travel_time_index': 1.41, 'rank': 20, 'source': 'TomTom Traffic Index'},
-    {'city': 'Moscow', 'country': 'Russia', 'year': 2022, 'congestion_level_pct': 45, 'travel_time_index': 1.45, 'rank': 14, 'source': 'TomTom Traffic Index'},
-    {'city': 'Moscow', 'country': 'Russia', 'year': 2023, 'congestion_level_pct': 46, 'travel_time_index': 1.46, 'rank': 12, 'source': 'TomTom Traffic Index'},
-    
+    'Moscow': ('Russia', [44, 45, 46, 47, 48, 40, 41, 45, 46], [14, 15, 14, 13, 15, 22, 20, 14, 12]),
     # NEW CITIES - MIDDLE EAST & AFRICA
     # TURKEY - Istanbul
-    {'city': 'Istanbul', 'country': 'Turkey', 'year': 2015, 'congestion_level_pct': 50, 'travel_time_index': 1.50, 'rank': 7, 'source': 'TomTom Traffic Index'},
-    {'city': 'Istanbul', 'country': 'Turkey', 'year': 2016, 'congestion_level_pct': 52, 'travel_time_index': 1.52, 'rank': 7, 'source': 'TomTom Traffic Index'},
-    {'city': 'Istanbul', 'country': 'Turkey', 'year': 2017, 'congestion_level_pct': 53, 'travel_time_index': 1.53, 'rank': 7, 'source': 'TomTom Traffic Index'},
-    {'city': 'Istanbul', 'country': 'Turkey', 'year': 2018, 'congestion_level_pct': 55, 'travel_time_index': 1.55, 'rank': 9, 'source': 'TomTom Traffic Index'},
-    {'city': 'Istanbul', 'country': 'Turkey', 'year': 2019, 'congestion_level_pct': 56, 'travel_time_index': 1.56, 'rank': 8, 'source': 'TomTom Traffic Index'},
-    {'city': 'Istanbul', 'country': 'Turkey', 'year': 2020, 'congestion_level_pct': 45, 'travel_time_index': 1.45, 'rank': 16, 'source': 'TomTom Traffic Index'},
-    {'city': 'Istanbul', 'country': 'Turkey', 'year': 2021, 'congestion_level_pct': 46, 'travel_time_index': 1.46, 'rank': 13, 'source': 'TomTom Traffic Index'},
-    {'city': 'Istanbul', 'country': 'Turkey', 'year': 2022, 'congestion_level_pct': 53, 'travel_time_index': 1.53, 'rank': 10, 'source': 'TomTom Traffic Index'},
-    {'city': 'Istanbul', 'country': 'Turkey', 'year': 2023, 'congestion_level_pct': 55, 'travel_time_index': 1.55, 'rank': 7, 'source': 'TomTom Traffic Index'},
-    
+    'Istanbul': ('Turkey', [50, 52, 53, 55, 56, 45, 46, 53, 55], [7, 7, 7, 9, 8, 16, 13, 10, 7]),
     # EGYPT - Cairo
-    {'city': 'Cairo', 'country': 'Egypt', 'year': 2015, 'congestion_level_pct': 46, 'travel_time_index': 1.46, 'rank': 12, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cairo', 'country': 'Egypt', 'year': 2016, 'congestion_level_pct': 48, 'travel_time_index': 1.48, 'rank': 11, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cairo', 'country': 'Egypt', 'year': 2017, 'congestion_level_pct': 49, 'travel_time_index': 1.49, 'rank': 10, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cairo', 'country': 'Egypt', 'year': 2018, 'congestion_level_pct': 51, 'travel_time_index': 1.51, 'rank': 11, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cairo', 'country': 'Egypt', 'year': 2019, 'congestion_level_pct': 52, 'travel_time_index': 1.52, 'rank': 11, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cairo', 'country': 'Egypt', 'year': 2020, 'congestion_level_pct': 43, 'travel_time_index': 1.43, 'rank': 19, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cairo', 'country': 'Egypt', 'year': 2021, 'congestion_level_pct': 44, 'travel_time_index': 1.44, 'rank': 16, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cairo', 'country': 'Egypt', 'year': 2022, 'congestion_level_pct': 50, 'travel_time_index': 1.50, 'rank': 11, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cairo', 'country': 'Egypt', 'year': 2023, 'congestion_level_pct': 51, 'travel_time_index': 1.51, 'rank': 9, 'source': 'TomTom Traffic Index'},
-    
+    'Cairo': ('Egypt', [46, 48, 49, 51, 52, 43, 44, 50, 51], [12, 11, 10, 11, 11, 19, 16, 11, 9]),
     # SOUTH AFRICA - Cape Town
-    {'city': 'Cape Town', 'country': 'South Africa', 'year': 2015, 'congestion_level_pct': 30, 'travel_time_index': 1.30, 'rank': 58, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cape Town', 'country': 'South Africa', 'year': 2016, 'congestion_level_pct': 31, 'travel_time_index': 1.31, 'rank': 55, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cape Town', 'country': 'South Africa', 'year': 2017, 'congestion_level_pct': 32, 'travel_time_index': 1.32, 'rank': 52, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cape Town', 'country': 'South Africa', 'year': 2018, 'congestion_level_pct': 33, 'travel_time_index': 1.33, 'rank': 50, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cape Town', 'country': 'South Africa', 'year': 2019, 'congestion_level_pct': 34, 'travel_time_index': 1.34, 'rank': 48, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cape Town', 'country': 'South Africa', 'year': 2020, 'congestion_level_pct': 25, 'travel_time_index': 1.25, 'rank': 72, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cape Town', 'country': 'South Africa', 'year': 2021, 'congestion_level_pct': 26, 'travel_time_index': 1.26, 'rank': 65, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cape Town', 'country': 'South Africa', 'year': 2022, 'congestion_level_pct': 31, 'travel_time_index': 1.31, 'rank': 48, 'source': 'TomTom Traffic Index'},
-    {'city': 'Cape Town', 'country': 'South Africa', 'year': 2023, 'congestion_level_pct': 32, 'travel_time_index': 1.32, 'rank': 43, 'source': 'TomTom Traffic Index'},
-    
+    'Cape Town': ('South Africa', [30, 31, 32, 33, 34, 25, 26, 31, 32], [58, 55, 52, 50, 48, 72, 65, 48, 43]),
     # USA - Los Angeles
-    {'city': 'Los Angeles', 'country': 'United States', 'year': 2015, 'congestion_level_pct': 39, 'travel_time_index': 1.39, 'rank': 25, 'source': 'TomTom Traffic Index'},
-    {'city': 'Los Angeles', 'country': 'United States', 'year': 2016, 'congestion_level_pct': 41, 'travel_time_index': 1.41, 'rank': 23, 'source': 'TomTom Traffic Index'},
-    {'city': 'Los Angeles', 'country': 'United States', 'year': 2017, 'congestion_level_pct': 42, 'travel_time_index': 1.42, 'rank': 22, 'source': 'TomTom Traffic Index'},
-    {'city': 'Los Angeles', 'country': 'United States', 'year': 2018, 'congestion_level_pct': 43, 'travel_time_index': 1.43, 'rank': 18, 'source': 'TomTom Traffic Index'},
-    {'city': 'Los Angeles', 'country': 'United States', 'year': 2019, 'congestion_level_pct': 44, 'travel_time_index': 1.44, 'rank': 19, 'source': 'TomTom Traffic Index'},
-    {'city': 'Los Angeles', 'country': 'United States', 'year': 2020, 'congestion_level_pct': 32, 'travel_time_index': 1.32, 'rank': 41, 'source': 'TomTom Traffic Index'},
-    {'city': 'Los Angeles', 'country': 'United States', 'year': 2021, 'congestion_level_pct': 33, 'travel_time_index': 1.33, 'rank': 38, 'source': 'TomTom Traffic Index'},
-    {'city': 'Los Angeles', 'country': 'United States', 'year': 2022, 'congestion_level_pct': 40, 'travel_time_index': 1.40, 'rank': 22, 'source': 'TomTom Traffic Index'},
-    {'city': 'Los Angeles', 'country': 'United States', 'year': 2023, 'congestion_level_pct': 42, 'travel_time_index': 1.42, 'rank': 20, 'source': 'TomTom Traffic Index'},
-    
+    'Los Angeles': ('United States', [39, 41, 42, 43, 44, 32, 33, 40, 42], [25, 23, 22, 18, 19, 41, 38, 22, 20]),
     # USA - New York
-    {'city': 'New York', 'country': 'United States', 'year': 2015, 'congestion_level_pct': 35, 'travel_time_index': 1.35, 'rank': 39, 'source': 'TomTom Traffic Index'},
-    {'city': 'New York', 'country': 'United States', 'year': 2016, 'congestion_level_pct': 36, 'travel_time_index': 1.36, 'rank': 34, 'source': 'TomTom Traffic Index'},
-    {'city': 'New York', 'country': 'United States', 'year': 2017, 'congestion_level_pct': 37, 'travel_time_index': 1.37, 'rank': 32, 'source': 'TomTom Traffic Index'},
-    {'city': 'New York', 'country': 'United States', 'year': 2018, 'congestion_level_pct': 38, 'travel_time_index': 1.38, 'rank': 30, 'source': 'TomTom Traffic Index'},
-    {'city': 'New York', 'country': 'United States', 'year': 2019, 'congestion_level_pct': 39, 'travel_time_index': 1.39, 'rank': 28, 'source': 'TomTom Traffic Index'},
-    {'city': 'New York', 'country': 'United States', 'year': 2020, 'congestion_level_pct': 26, 'travel_time_index': 1.26, 'rank': 68, 'source': 'TomTom Traffic Index'},
-    {'city': 'New York', 'country': 'United States', 'year': 2021, 'congestion_level_pct': 27, 'travel_time_index': 1.27, 'rank': 60, 'source': 'TomTom Traffic Index'},
-    {'city': 'New York', 'country': 'United States', 'year': 2022, 'congestion_level_pct': 35, 'travel_time_index': 1.35, 'rank': 33, 'source': 'TomTom Traffic Index'},
-    {'city': 'New York', 'country': 'United States', 'year': 2023, 'congestion_level_pct': 37, 'travel_time_index': 1.37, 'rank': 29, 'source': 'TomTom Traffic Index'},
-    
+    'New York': ('United States', [35, 36, 37, 38, 39, 26, 27, 35, 37], [39, 34, 32, 30, 28, 68, 60, 33, 29]),
     # CANADA - Toronto
-    {'city': 'Toronto', 'country': 'Canada', 'year': 2015, 'congestion_level_pct': 31, 'travel_time_index': 1.31, 'rank': 51, 'source': 'TomTom Traffic Index'},
-    {'city': 'Toronto', 'country': 'Canada', 'year': 2016, 'congestion_level_pct': 32, 'travel_time_index': 1.32, 'rank': 47, 'source': 'TomTom Traffic Index'},
-    {'city': 'Toronto', 'country': 'Canada', 'year': 2017, 'congestion_level_pct': 33, 'travel_time_index': 1.33, 'rank': 46, 'source': 'TomTom Traffic Index'},
-    {'city': 'Toronto', 'country': 'Canada', 'year': 2018, 'congestion_level_pct': 34, 'travel_time_index': 1.34, 'rank': 44, 'source': 'TomTom Traffic Index'},
-    {'city': 'Toronto', 'country': 'Canada', 'year': 2019, 'congestion_level_pct': 35, 'travel_time_index': 1.35, 'rank': 42, 'source': 'TomTom Traffic Index'},
-    {'city': 'Toronto', 'country': 'Canada', 'year': 2020, 'congestion_level_pct': 25, 'travel_time_index': 1.25, 'rank': 75, 'source': 'TomTom Traffic Index'},
-    {'city': 'Toronto', 'country': 'Canada', 'year': 2021, 'congestion_level_pct': 26, 'travel_time_index': 1.26, 'rank': 68, 'source': 'TomTom Traffic Index'},
-    {'city': 'Toronto', 'country': 'Canada', 'year': 2022, 'congestion_level_pct': 32, 'travel_time_index': 1.32, 'rank': 40, 'source': 'TomTom Traffic Index'},
-    {'city': 'Toronto', 'country': 'Canada', 'year': 2023, 'congestion_level_pct': 33, 'travel_time_index': 1.33, 'rank': 37, 'source': 'TomTom Traffic Index'},
-    
+    'Toronto': ('Canada', [31, 32, 33, 34, 35, 25, 26, 32, 33], [51, 47, 46, 44, 42, 75, 68, 40, 37]),
     # AUSTRALIA - Sydney
-    {'city': 'Sydney', 'country': 'Australia', 'year': 2015, 'congestion_level_pct': 30, 'travel_time_index': 1.30, 'rank': 56, 'source': 'TomTom Traffic Index'},
-    {'city': 'Sydney', 'country': 'Australia', 'year': 2016, 'congestion_level_pct': 31, 'travel_time_index': 1.31, 'rank': 52, 'source': 'TomTom Traffic Index'},
-    {'city': 'Sydney', 'country': 'Australia', 'year': 2017, 'congestion_level_pct': 32, 'travel_time_index': 1.32, 'rank': 50, 'source': 'TomTom Traffic Index'},
-    {'city': 'Sydney', 'country': 'Australia', 'year': 2018, 'congestion_level_pct': 33, 'travel_time_index': 1.33, 'rank': 48, 'source': 'TomTom Traffic Index'},
-    {'city': 'Sydney', 'country': 'Australia', 'year': 2019, 'congestion_level_pct': 34, 'travel_time_index': 1.34, 'rank': 46, 'source': 'TomTom Traffic Index'},
-    {'city': 'Sydney', 'country': 'Australia', 'year': 2020, 'congestion_level_pct': 25, 'travel_time_index': 1.25, 'rank': 78, 'source': 'TomTom Traffic Index'},
-    {'city': 'Sydney', 'country': 'Australia', 'year': 2021, 'congestion_level_pct': 26, 'travel_time_index': 1.26, 'rank': 70, 'source': 'TomTom Traffic Index'},
-    {'city': 'Sydney', 'country': 'Australia', 'year': 2022, 'congestion_level_pct': 31, 'travel_time_index': 1.31, 'rank': 46, 'source': 'TomTom Traffic Index'},
-    {'city': 'Sydney', 'country': 'Australia', 'year': 2023, 'congestion_level_pct': 32, 'travel_time_index': 1.32, 'rank': 42, 'source': 'TomTom Traffic Index'},
-]
+    'Sydney': ('Australia', [30, 31, 32, 33, 34, 25, 26, 31, 32], [56, 52, 50, 48, 46, 78, 70, 46, 42]),
+}
+
+@lru_cache(maxsize=1)
+def get_tomtom_df():
+    """City-year TomTom table (built once per process; do not mutate)"""
+    # Expand to one row per city and year, built column by column in the narrowest
+    # dtype that holds it (congestion <= 100, rank and year < 32768)
+    series = CITIES.values()
+    n_rows = len(CITIES) * len(YEARS)
+    congestion = np.concatenate([cong for _, cong, _ in series]).astype(np.int8)
+
+    # Repeated labels are stored once, with small integer codes per row. The
+    # labels are deduplicated per city rather than per row, and the codes are
+    # repeated across years, so no per-row string is ever hashed.
+    cities, city_codes = np.unique(list(CITIES), return_inverse=True)
+    countries, country_codes = np.unique([country for country, _, _ in series], return_inverse=True)
+
+    return pd.DataFrame({
+        'city': pd.Categorical.from_codes(np.repeat(city_codes, len(YEARS)), categories=cities),
+        'country': pd.Categorical.from_codes(np.repeat(country_codes, len(YEARS)), categories=countries),
+        'year': np.tile(YEARS, len(CITIES)),
+        'congestion_level_pct': congestion,
+        'rank': np.concatenate([rank for _, _, rank in series]).astype(np.int16),
+        'source': pd.Categorical.from_codes(np.zeros(n_rows, dtype=np.int8), categories=['TomTom Traffic Index']),
+    })
+
+@lru_cache(maxsize=1)
+def get_tomtom_arrow():
+    """The city table as an Arrow table, for Arrow-native readers such as Polars or DuckDB
+
+    The categorical columns become dictionary-encoded Arrow strings, so each
+    label is converted once per category rather than once per row.
+    """
+    return pa.Table.from_pandas(get_tomtom_df(), preserve_index=False)
+
+@lru_cache(maxsize=1)
+def congestion_runs():
+    """city -> [(first_year, last_year, congestion_level_pct), ...] (do not mutate)
+
+    Consecutive years with the same congestion collapse into one run, e.g.
+    Bangkok 2016-2019 at 61%. Sums and means can be taken over the runs
+    (value * run length) without expanding to one row per year.
+    """
+    runs = {}
+    for city, (_, cong, _) in CITIES.items():
+        cong = np.asarray(cong)
+        # Index of the first year of each run
+        starts = np.flatnonzero(np.r_[True, cong[1:] != cong[:-1]])
+        ends = np.r_[starts[1:], len(cong)] - 1
+        runs[city] = [(int(YEARS[s]), int(YEARS[e]), int(cong[s])) for s, e in zip(starts, ends)]
+    return runs
+
+def mean_congestion(runs):
+    """Mean congestion_level_pct over the years covered by a city's runs"""
+    years = sum(last - first + 1 for first, last, _ in runs)
+    return sum(pct * (last - first + 1) for first, last, pct in runs) / years
+
+def add_travel_time_index(df):
+    """Insert travel_time_index after congestion_level_pct, derived from it
+
+    A trip takes (1 + congestion share) times its free-flow time, so the
+    index is not stored with the data; callers that need it add it here.
+    """
+    # Computed in float32 throughout; (100 + x) / 100 rounds once, so it gives
+    # the float32 nearest to 1.xx, which 1 + x * 0.01 does not always do
+    congestion = df['congestion_level_pct'].to_numpy(np.float32)
+    df.insert(
+        df.columns.get_loc('congestion_level_pct') + 1,
+        'travel_time_index',
+        (np.float32(100) + congestion) / np.float32(100),
+    )
+    return df
+
+@lru_cache(maxsize=1)
+def country_year_mean():
+    """Mean congestion per country and year (cached on disk; do not mutate)"""
+    if COUNTRY_YEAR_CACHE.exists() and COUNTRY_YEAR_CACHE.stat().st_mtime >= os.path.getmtime(__file__):
+        return pd.read_parquet(COUNTRY_YEAR_CACHE)
+
+    means = get_tomtom_df().groupby(['country', 'year'], observed=True)['congestion_level_pct'].mean().reset_index()
+    COUNTRY_YEAR_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    means.to_parquet(COUNTRY_YEAR_CACHE, index=False)
+    return means
 
 # NEW: Create country-level aggregations for countries not covered by city-level data
-def generate_country_level_estimates(city_data):
+def generate_country_level_estimates():
     """
     Generate country-level congestion estimates based on city data.
     This helps fill gaps for countries without specific city data.
     """
-    df_cities = pd.DataFrame(city_data)
-    
-    # Calculate average congestion by country
-    country_avgs = df_cities.groupby(['country', 'year']).agg({
-        'congestion_level_pct': 'mean',
-        'travel_time_index': 'mean'
-    }).reset_index()
-    
-    return country_avgs
-
-# Try to fetch current data from TomTom API or website
-url = 'https://www.tomtom.com/traffic-index/'
-headers = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-}
+    # The index is linear in congestion, so the mean index follows from the mean congestion
+    return add_travel_time_index(country_year_mean().copy())
+
+def to_jsonl(path):
+    """Write the city table (with travel_time_index) as JSON Lines, one record per row"""
+    df = add_travel_time_index(get_tomtom_df().copy())
+    # JSON numbers are doubles: widen the float32 index through its shortest
+    # repr so 1.31 is written, not 1.3099999427795
+    df['travel_time_index'] = df['travel_time_index'].astype(str).astype(np.float64)
+    df.to_json(path, orient='records', lines=True)
 
-try:
-    print("Attempting to fetch current TomTom Traffic Index data...")
-    response = requests.get(url, headers=headers, timeout=15)
-    
-    if response.status_code == 200:
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Look for JSON data in script tags
-        scripts = soup.find_all('script', type='application/json')
-        for script in scripts:
-            try:
-                json_data = json.loads(script.string)
-                # Try to find Manila data in the JSON
-                # This would require knowing the exact structure of TomTom's data
+def read_jsonl(path, chunksize=10_000):
+    """Iterate over a JSON Lines file in frames of at most chunksize rows
+
+    Lets a consumer process the file in bounded memory however large it grows.
+    """
+    with pd.read_json(path, lines=True, chunksize=chunksize, precise_float=True) as reader:
+        yield from reader
+
+def probe_website():
+    """Check whether the TomTom Traffic Index site is reachable and embeds JSON
+
+    The HTTP and HTML modules are imported here, so importing this module
+    for get_tomtom_df() does not load them.
+    """
+    import lxml.html
+    import orjson
+    from _http import SESSION
+
+    url = 'https://www.tomtom.com/traffic-index/'
+    try:
+        print("Attempting to fetch current TomTom Traffic Index data...")
+        response = SESSION.get(url, timeout=15)
+
+        if response.status_code == 200:
+            # Look for JSON data in script tags
+            doc = lxml.html.fromstring(response.content)
+            for text in doc.xpath('//script[@type="application/json"]/text()'):
+                try:
+                    orjson.loads(text)
+                except orjson.JSONDecodeError:
+                    continue
+                # Finding Manila in the JSON would require knowing the exact structure of TomTom's data
                 print("Found JSON data on TomTom website (structure may need parsing)")
-            except:
-                pass
-        
-        print("Successfully connected to TomTom Traffic Index website")
-    else:
-        print(f"TomTom website returned status {response.status_code}")
-except Exception as e:
-    print(f"Could not fetch from TomTom website: {e}")
-
-# Process and save data
-city_data = pd.DataFrame(tomtom_data)
-
-# Generate country-level aggregations
-country_data = generate_country_level_estimates(tomtom_data)
-
-# Combine city and country data
-all_data = city_data.copy()
-
-# Add country field if it doesn't exist at country level
-if 'city' in country_data.columns:
-    country_data = country_data.drop('city', axis=1)
-
-print(f"\n{'='*60}")
-print(f"TOMTOM TRAFFIC DATA - EXPANDED COVERAGE")
-print(f"{'='*60}")
-print(f"✓ City-level records: {len(city_data)}")
-print(f"✓ Countries covered: {city_data['country'].nunique()}")
-print(f"✓ Cities covered: {city_data['city'].nunique()}")
-print(f"✓ Years covered: {city_data['year'].min()}-{city_data['year'].max()}")
-print(f"\nTop 10 Most Congested Cities (2023):")
-recent = city_data[city_data['year'] == 2023].nlargest(10, 'congestion_level_pct')[['city', 'country', 'congestion_level_pct', 'rank']]
-for idx, row in recent.iterrows():
-    print(f"  {row['rank']:3d}. {row['city']:20s} ({row['country']:15s}): {row['congestion_level_pct']}%")
-
-# Save city-level data
-output_path = os.path.join('..', 'data', 'tomtom_traffic_data.csv')
-city_data.to_csv(output_path, index=False)
-
-print(f"\n✓ Data saved to: {output_path}")
-print(f"{'='*60}\n")
\ No newline at end of file
+
+            print("Successfully connected to TomTom Traffic Index website")
+        else:
+            print(f"TomTom website returned status {response.status_code}")
+    except Exception as e:
+        print(f"Could not fetch from TomTom website: {e}")
+
+def fetch_city_pages(urls, per_second=5):
+    """Fetch TomTom city pages concurrently, at most per_second requests a second
+
+    Returns {url: response}. Nothing parses the pages yet (CITIES is still
+    transcribed from the published reports); a per-city scrape should fetch
+    through here rather than one page at a time.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from _http import SESSION, RateLimiter
+
+    rate_limit = RateLimiter(per_second=per_second)
+
+    def fetch(url):
+        rate_limit.wait()
+        return SESSION.get(url, timeout=15)
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        return dict(zip(urls, executor.map(fetch, urls)))
+
+def main():
+    """Probe the TomTom website, then summarise and save the city table"""
+    city_data = get_tomtom_df()
+
+    probe_website()
+
+    # Generate country-level aggregations
+    country_data = generate_country_level_estimates()
+
+    # Combine city and country data
+    all_data = city_data.copy()
+
+    # Add country field if it doesn't exist at country level
+    if 'city' in country_data.columns:
+        country_data = country_data.drop('city', axis=1)
+
+    print(f"\n{'='*60}")
+    print(f"TOMTOM TRAFFIC DATA - EXPANDED COVERAGE")
+    print(f"{'='*60}")
+    print(f"✓ City-level records: {len(city_data)}")
+    print(f"✓ Countries covered: {city_data['country'].nunique()}")
+    print(f"✓ Cities covered: {city_data['city'].nunique()}")
+    print(f"✓ Years covered: {city_data['year'].min()}-{city_data['year'].max()}")
+    print(f"\nTop 10 Most Congested Cities (2023):")
+    recent = city_data[city_data['year'] == 2023].nlargest(10, 'congestion_level_pct')[['city', 'country', 'congestion_level_pct', 'rank']]
+    for idx, row in recent.iterrows():
+        print(f"  {row['rank']:3d}. {row['city']:20s} ({row['country']:15s}): {row['congestion_level_pct']}%")
+
+    # Save city-level data (with the derived travel time index, which consumers read)
+    output_path = os.path.join('..', 'data', 'tomtom_traffic_data.csv')
+    write_table(add_travel_time_index(city_data.copy()), output_path)
+    # Line-delimited copy for pipelines that stream records
+    to_jsonl(os.path.splitext(output_path)[0] + '.jsonl')
+
+    print(f"\n✓ Data saved to: {output_path}")
+    print(f"{'='*60}\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -17,7 +17,7 @@ from pytorch_forecasting import TemporalFusionTransformer
 import os
 from datetime import datetime
 import warnings
-import pickle
+from results_io import save_pickle, save_sim_results, save_uncertainty
 warnings.filterwarnings('ignore')
 
 # Set random seeds
@@ -461,10 +461,14 @@ for scenario_key, results in simulation_results.items():
 
 # Save pickled results for dashboard
 pickle_path = os.path.join(output_dir, 'simulation_results.pkl')
-with open(pickle_path, 'wb') as f:
-    pickle.dump(simulation_results, f)
+save_pickle(pickle_path, simulation_results)
 print(f"\n✓ Pickled results saved to: {pickle_path}")
 
+# Save msgpack/Parquet results for fast dashboard loading
+results_dir = os.path.join(output_dir, 'simulation_results')
+save_sim_results(results_dir, simulation_results)
+print(f"✓ Msgpack/Parquet results saved to: {results_dir}")
+
 # ========================================================================
 # UNCERTAINTY QUANTIFICATION
 # ========================================================================
@@ -520,9 +524,9 @@ for scenario_key in ['moderate_increase', 'high_investment']:
 
 # Save uncertainty quantification results
 uncertainty_path = os.path.join(output_dir, 'uncertainty_quantification.pkl')
-with open(uncertainty_path, 'wb') as f:
-    pickle.dump(bootstrap_results, f)
+save_pickle(uncertainty_path, bootstrap_results)
 print(f"\n✓ Uncertainty results saved to: {uncertainty_path}")
+save_uncertainty(os.path.join(output_dir, 'uncertainty_quantification.msgpack'), bootstrap_results)
 
 # ========================================================================
 # GENERATE REPORT
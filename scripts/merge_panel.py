@@ -2,6 +2,8 @@ import pandas as pd
 import os
 from datetime import datetime
 
+from _tables import read_table
+
 data_dir = '../data'
 output_dir = '../output'
 
@@ -53,7 +55,7 @@ if os.path.exists(congestion_comp_path):
     
 elif os.path.exists(tomtom_path):
     print("\nMerging TomTom traffic data (basic dataset)...")
-    tomtom = pd.read_csv(tomtom_path)
+    tomtom = read_table(tomtom_path)
     before_merge = len(df)
     df = df.merge(tomtom, on=['country', 'year'], how='left', suffixes=('', '_tomtom'))
     print(f"  Rows after merge: {len(df)} (added {len(df) - before_merge} from TomTom)")
@@ -99,7 +101,7 @@ if os.path.exists(psa_path):
 openaq_path = os.path.join(data_dir, 'openaq_pm25.csv')
 if os.path.exists(openaq_path):
     print("\nMerging OpenAQ air quality data...")
-    openaq = pd.read_csv(openaq_path)
+    openaq = read_table(openaq_path)
     before_merge = len(df)
     df = df.merge(openaq, on=['country', 'year'], how='left', suffixes=('', '_openaq'))
     print(f"  Rows after merge: {len(df)}")
@@ -126,7 +128,7 @@ if os.path.exists(overpass_path):
 ltfrb_path = os.path.join(data_dir, 'ltfrb_data.csv')
 if os.path.exists(ltfrb_path):
     print("\nMerging LTFRB data...")
-    ltfrb = pd.read_csv(ltfrb_path)
+    ltfrb = read_table(ltfrb_path)
     before_merge = len(df)
     df = df.merge(ltfrb, on=['country', 'year'], how='left', suffixes=('', '_ltfrb'))
     print(f"  Rows after merge: {len(df)}")
@@ -136,7 +138,7 @@ if os.path.exists(ltfrb_path):
 jica_path = os.path.join(data_dir, 'jica_mrt_lrt.csv')
 if os.path.exists(jica_path):
     print("\nMerging JICA MRT/LRT data...")
-    jica = pd.read_csv(jica_path)
+    jica = read_table(jica_path)
     before_merge = len(df)
     df = df.merge(jica, on=['country', 'year'], how='left', suffixes=('', '_jica'))
     print(f"  Rows after merge: {len(df)}")
@@ -146,7 +148,7 @@ if os.path.exists(jica_path):
 adb_path = os.path.join(data_dir, 'adb_projects.csv')
 if os.path.exists(adb_path):
     print("\nMerging ADB projects data...")
-    adb = pd.read_csv(adb_path)
+    adb = read_table(adb_path)
     before_merge = len(df)
     df = df.merge(adb, on=['country', 'year'], how='left', suffixes=('', '_adb'))
     print(f"  Rows after merge: {len(df)}")
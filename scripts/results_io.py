@@ -0,0 +1,138 @@
+"""
+Simulation Results Storage
+==========================
+Read/write helpers for counterfactual simulation artifacts.
+
+Scalar results are stored as msgpack; per-scenario DataFrames are stored
+as Parquet so they can be loaded on demand instead of unpickling the
+whole results tree up front.
+
+Layout of a results directory:
+    scenarios.msgpack       - scalar results for every scenario
+    data_<scenario>.parquet - counterfactual panel for each scenario
+
+Values round-trip through msgpack as follows: dicts, lists, strings,
+numbers and None come back unchanged (tuples load as lists); NumPy
+arrays keep their dtype and shape but are read-only views over the
+loaded bytes; NumPy scalars become the equivalent Python int or float,
+so a float32 0.3 loads as 0.30000001192092896, its exact float32 value.
+
+Legacy pickles are written with protocol 5, with array payloads kept
+out-of-band in a ``<file>.bin`` sidecar so loading does not copy them
+through the pickle stream.
+"""
+
+import os
+import pickle
+import struct
+
+import msgpack
+import numpy as np
+import pandas as pd
+
+SCENARIOS_FILE = 'scenarios.msgpack'
+
+
+def _encode(obj):
+    """msgpack fallback encoder for NumPy scalars and arrays"""
+    if isinstance(obj, np.ndarray):
+        return {'__ndarray__': obj.tobytes(), 'dtype': obj.dtype.str, 'shape': list(obj.shape)}
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+
+def _decode(obj):
+    """msgpack object hook that restores NumPy arrays"""
+    if '__ndarray__' in obj:
+        return np.frombuffer(obj['__ndarray__'], dtype=obj['dtype']).reshape(obj['shape'])
+    return obj
+
+
+def _pack(path, obj):
+    with open(path, 'wb') as f:
+        f.write(msgpack.packb(obj, default=_encode, use_bin_type=True))
+
+
+def _unpack(path):
+    with open(path, 'rb') as f:
+        return msgpack.unpackb(f.read(), raw=False, object_hook=_decode)
+
+
+def save_sim_results(directory, simulation_results):
+    """Save simulation results as msgpack scalars plus per-scenario Parquet frames"""
+    os.makedirs(directory, exist_ok=True)
+
+    scalars = {}
+    for scenario_key, results in simulation_results.items():
+        scalars[scenario_key] = {k: v for k, v in results.items() if k != 'data'}
+        if 'data' in results:
+            results['data'].to_parquet(
+                os.path.join(directory, f'data_{scenario_key}.parquet'), index=False
+            )
+
+    _pack(os.path.join(directory, SCENARIOS_FILE), scalars)
+
+
+def load_sim_results(directory):
+    """Load scalar simulation results (without per-scenario data frames)"""
+    return _unpack(os.path.join(directory, SCENARIOS_FILE))
+
+
+def load_scenario_data(directory, scenario_key):
+    """Load the counterfactual panel for a single scenario"""
+    return pd.read_parquet(os.path.join(directory, f'data_{scenario_key}.parquet'))
+
+
+def save_uncertainty(path, bootstrap_results):
+    """Save bootstrap uncertainty results (NumPy distributions included) as msgpack"""
+    _pack(path, bootstrap_results)
+
+
+def load_uncertainty(path):
+    """Load bootstrap uncertainty results saved by save_uncertainty()"""
+    return _unpack(path)
+
+
+def _buffers_path(path):
+    return f"{os.fspath(path)}.bin"
+
+
+def save_pickle(path, obj):
+    """Pickle with protocol 5, writing out-of-band buffers to a .bin sidecar
+
+    Sidecar layout: buffer count, then each buffer length (int64), then
+    the concatenated buffer bytes.
+    """
+    buffers = []
+    with open(path, 'wb') as f:
+        pickle.dump(obj, f, protocol=5, buffer_callback=buffers.append)
+
+    raw = [buf.raw() for buf in buffers]
+    with open(_buffers_path(path), 'wb') as f:
+        f.write(struct.pack(f'<{len(raw) + 1}q', len(raw), *(r.nbytes for r in raw)))
+        for r in raw:
+            f.write(r)
+
+
+def iter_buffers(path):
+    """Yield the out-of-band buffers stored next to a protocol 5 pickle"""
+    with open(_buffers_path(path), 'rb') as f:
+        data = bytearray(os.fstat(f.fileno()).st_size)
+        f.readinto(data)
+
+    view = memoryview(data)
+    (count,) = struct.unpack_from('<q', view)
+    lengths = struct.unpack_from(f'<{count}q', view, 8)
+    offset = 8 * (count + 1)
+    for length in lengths:
+        yield view[offset:offset + length]
+        offset += length
+
+
+def load_pickle(path):
+    """Load a pickle saved by save_pickle(), or a legacy in-band pickle"""
+    with open(path, 'rb') as f:
+        if not os.path.exists(_buffers_path(path)):
+            return pickle.load(f)
+        return pickle.Unpickler(f, buffers=iter_buffers(path)).load()
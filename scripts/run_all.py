@@ -16,6 +16,7 @@ import os
 import sys
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Color codes for terminal output
@@ -91,6 +92,20 @@ def run_script(script_name, description):
         print_error(f"{description} (exception: {e})")
         return False
 
+# Scrapers with no data dependency on each other, run concurrently so
+# their network waits overlap
+PARALLEL_SCRAPERS = (
+    ('data_gathering_adb.py', 'Scrape ADB project data'),
+    ('data_gathering_ltfrb.py', 'Fetch LTFRB fleet and fare data'),
+    ('data_gathering_jica.py', 'Extract JICA MRT/LRT data'),
+)
+
+def run_parallel(scripts):
+    """Run independent scripts concurrently; succeeds only if all of them do"""
+    with ThreadPoolExecutor(max_workers=len(scripts)) as executor:
+        results = list(executor.map(lambda step: run_script(*step), scripts))
+    return all(results)
+
 def check_data_exists():
     """Check if key data files already exist"""
     # Check for data directory
@@ -148,11 +163,9 @@ def main():
             ('data_gathering_congestion_proxy.py', 'Generate ML-based congestion estimates (NEW: 277 countries)'),
             ('data_gathering_uitp.py', 'Fetch UITP modal share data (ENHANCED: 29 cities)'),
             ('data_gathering_psa.py', 'Fetch PSA demographic data'),
-            ('data_gathering_ltfrb.py', 'Fetch LTFRB fleet and fare data'),
             ('data_gathering_openaq.py', 'Fetch OpenAQ air quality data (ENHANCED: 24 countries)'),
             ('data_gathering_overpass.py', 'Fetch Overpass OSM infrastructure data'),
-            ('data_gathering_adb.py', 'Scrape ADB project data'),
-            ('data_gathering_jica.py', 'Extract JICA MRT/LRT data'),
+            (PARALLEL_SCRAPERS, 'Fetch ADB, LTFRB and JICA data (in parallel)'),
             ('data_gathering_sws.py', 'Gather SWS satisfaction survey data'),
             ('data_gathering_dpwh.py', 'Fetch DPWH infrastructure data'),
         ])
@@ -318,7 +331,13 @@ def main():
     for i, (script, description) in enumerate(steps, 1):
         print_step(i, total_steps, description)
         
-        if run_script(script, description):
+        if isinstance(script, tuple):
+            succeeded = run_parallel(script)
+            script = ', '.join(name for name, _ in script)
+        else:
+            succeeded = run_script(script, description)
+        
+        if succeeded:
             successful_steps += 1
         else:
             failed_steps.append((script, description))
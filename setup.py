@@ -36,6 +36,7 @@ setup(
         "scikit-learn>=1.3.0",
         "scipy>=1.11.0",
         "statsmodels>=0.14.0",
+        "pyarrow>=14.0.0",
         "torch>=2.0.0",
         "torchvision>=0.15.0",
         "pytorch-forecasting>=1.0.0",
@@ -45,15 +46,19 @@ setup(
         "matplotlib>=3.7.0",
         "seaborn>=0.12.0",
         "plotly>=5.14.0",
-        "streamlit>=1.28.0",
+        "streamlit>=1.37.0",
         "requests>=2.31.0",
+        "requests-cache>=1.1.0,<2.0.0",
         "beautifulsoup4>=4.12.0",
+        "lxml>=4.9.0",
         "selenium>=4.10.0",
         "pandas-datareader>=0.10.0",
         "tabula-py>=2.7.0",
         "tqdm>=4.65.0",
         "python-dotenv>=1.0.0",
         "pyyaml>=6.0",
+        "msgpack>=1.0.0",
+        "orjson>=3.9.0",
     ],
     extras_require={
         "dev": [
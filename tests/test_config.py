@@ -22,6 +22,7 @@ from config import (
     OUTPUT_FILES,
     MODEL_FILES,
     get_path,
+    refresh_env_cache,
 )
 
 
@@ -106,6 +107,25 @@ def test_config_structure():
     print("✓ All configuration dictionaries are properly structured")
 
 
+def test_refresh_env_cache():
+    """Test that API keys are re-resolved after refreshing the env snapshot."""
+    import os
+    from config import config as cfg
+    
+    previous = os.environ.get("TOMTOM_API_KEY")
+    try:
+        os.environ["TOMTOM_API_KEY"] = "test-key"
+        refresh_env_cache()
+        assert cfg.API_KEYS["tomtom"] == "test-key", "API key should reflect refreshed environment"
+        print("✓ refresh_env_cache picks up new environment values")
+    finally:
+        if previous is None:
+            os.environ.pop("TOMTOM_API_KEY", None)
+        else:
+            os.environ["TOMTOM_API_KEY"] = previous
+        refresh_env_cache()
+
+
 def run_all_tests():
     """Run all tests."""
     tests = [
@@ -115,6 +135,7 @@ def run_all_tests():
         test_processed_data_paths,
         test_get_path_function,
         test_config_structure,
+        test_refresh_env_cache,
     ]
     
     print("=" * 80)
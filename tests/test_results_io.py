@@ -0,0 +1,162 @@
+"""
+Test Results Storage Module
+===========================
+Round-trip tests for scripts/results_io.py.
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("msgpack")
+
+# results_io lives with the scripts that import it
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'scripts'))
+
+import results_io
+
+
+def make_simulation_results():
+    """Simulation results shaped like deep_counterfactual_simulation.py output"""
+    data = pd.DataFrame({
+        'country': ['Philippines', 'Philippines', 'Thailand', 'Thailand'],
+        'year': [2019, 2020, 2019, 2020],
+        'congestion_index': [71.0, 53.0, 61.0, 53.0],
+        'congestion_index_cf': [63.9, 47.7, 54.9, 47.7],
+    })
+    return {
+        'moderate_increase': {
+            'scenario': {
+                'name': 'Moderate Increase (+50%)',
+                'description': 'Increase transit investment by 50%',
+                'transit_multiplier': 1.5,
+                'color': 'orange',
+            },
+            'data': data,
+            'baseline_congestion': np.float64(59.5),
+            'counterfactual_congestion': np.float64(53.55),
+            'absolute_impact': np.float64(-5.95),
+            'relative_impact': np.float64(-10.0),
+            'baseline_pm25': None,
+            'cf_pm25': None,
+            'pm25_impact': None,
+            'pm25_relative_impact': None,
+            'baseline_gdp': None,
+            'cf_gdp': None,
+            'gdp_impact': None,
+            'gdp_relative_impact': None,
+            'affected_population': 4000000,
+            'country_effects': [
+                {'country': 'Philippines', 'baseline_congestion': 62.0,
+                 'counterfactual_congestion': 55.8, 'impact_pct': -10.0},
+                {'country': 'Thailand', 'baseline_congestion': 57.0,
+                 'counterfactual_congestion': 51.3, 'impact_pct': -10.0},
+            ],
+        },
+    }
+
+
+def test_sim_results_round_trip(tmp_path):
+    """Scalars, lists of dicts and the per-scenario frame survive a save/load"""
+    pytest.importorskip("pyarrow")
+    simulation_results = make_simulation_results()
+    results_io.save_sim_results(tmp_path, simulation_results)
+
+    loaded = results_io.load_sim_results(tmp_path)
+    expected = {k: v for k, v in simulation_results['moderate_increase'].items() if k != 'data'}
+    assert loaded['moderate_increase'] == expected
+    # Lists stay lists, so consumers can build frames or append as before
+    assert isinstance(loaded['moderate_increase']['country_effects'], list)
+
+    data = results_io.load_scenario_data(tmp_path, 'moderate_increase')
+    pd.testing.assert_frame_equal(data, simulation_results['moderate_increase']['data'])
+
+
+def test_uncertainty_round_trip(tmp_path):
+    """Bootstrap distributions keep their dtype and values; scalars load as floats"""
+    distribution = np.array([-10.2, -9.8, -10.5, -9.1])
+    bootstrap_results = {
+        'moderate_increase': {
+            'mean': np.mean(distribution),
+            'std': np.std(distribution),
+            'ci_95_lower': np.percentile(distribution, 2.5),
+            'ci_95_upper': np.percentile(distribution, 97.5),
+            'distribution': distribution,
+        },
+    }
+    path = tmp_path / 'uncertainty_quantification.msgpack'
+    results_io.save_uncertainty(path, bootstrap_results)
+
+    loaded = results_io.load_uncertainty(path)['moderate_increase']
+    assert loaded['distribution'].dtype == distribution.dtype
+    np.testing.assert_array_equal(loaded['distribution'], distribution)
+    # Arrays are views over the loaded bytes
+    assert not loaded['distribution'].flags.writeable
+    for key in ('mean', 'std', 'ci_95_lower', 'ci_95_upper'):
+        assert type(loaded[key]) is float
+        assert loaded[key] == bootstrap_results['moderate_increase'][key]
+
+
+def test_float32_scalar_loads_as_exact_value(tmp_path):
+    """A float32 scalar loads as the Python float equal to its float32 value"""
+    path = tmp_path / 'scalar.msgpack'
+    results_io.save_uncertainty(path, {'value': np.float32(0.3)})
+
+    value = results_io.load_uncertainty(path)['value']
+    assert value == float(np.float32(0.3))
+    assert np.float32(value) == np.float32(0.3)
+
+
+def _sidecar_count(path):
+    """Number of out-of-band buffers recorded in a pickle's .bin sidecar"""
+    return sum(1 for _ in results_io.iter_buffers(path))
+
+
+def test_pickle_round_trip_with_buffers(tmp_path):
+    """A dict holding a DataFrame and arrays round-trips through the sidecar"""
+    obj = {
+        'data': pd.DataFrame({
+            'country': ['Philippines', 'Thailand'],
+            'congestion_index': [71.0, 61.0],
+        }),
+        'distribution': np.arange(1000, dtype=np.float64),
+        'codes': np.array([[1, 2], [3, 4]], dtype=np.int16),
+        'name': 'High Investment (+100%)',
+    }
+    path = tmp_path / 'results.pkl'
+    results_io.save_pickle(path, obj)
+    assert _sidecar_count(path) >= 2
+
+    loaded = results_io.load_pickle(path)
+    pd.testing.assert_frame_equal(loaded['data'], obj['data'])
+    np.testing.assert_array_equal(loaded['distribution'], obj['distribution'])
+    assert loaded['codes'].dtype == np.int16
+    np.testing.assert_array_equal(loaded['codes'], obj['codes'])
+    assert loaded['name'] == obj['name']
+
+
+def test_load_legacy_pickle_without_sidecar(tmp_path):
+    """A plain pickle with no .bin sidecar still loads"""
+    obj = {'distribution': np.array([1.5, 2.5]), 'mean': 2.0}
+    path = tmp_path / 'legacy.pkl'
+    with open(path, 'wb') as f:
+        pickle.dump(obj, f)
+
+    loaded = results_io.load_pickle(path)
+    np.testing.assert_array_equal(loaded['distribution'], obj['distribution'])
+    assert loaded['mean'] == 2.0
+
+
+def test_pickle_round_trip_without_buffers(tmp_path):
+    """An object with no out-of-band buffers writes an empty sidecar and loads"""
+    obj = {'scenario': {'name': 'Baseline', 'transit_multiplier': 1.0}, 'effects': [1, 2, 3]}
+    path = tmp_path / 'scalars.pkl'
+    results_io.save_pickle(path, obj)
+    assert _sidecar_count(path) == 0
+
+    assert results_io.load_pickle(path) == obj